@@ -1,22 +1,44 @@
 import logging
 
-from workers import RawDoctrineWatcherWorker
+from core.config.settings import get_settings
+from workers import RawDoctrineWatcherWorker, WorkerSupervisor
 
 logger = logging.getLogger(__name__)
 
-_watcher = RawDoctrineWatcherWorker()
+_supervisor: WorkerSupervisor | None = None
 
 
 def start_workers() -> None:
+    global _supervisor
     logger.info("Starting workers")
-    _watcher.start()
+    _supervisor = _build_supervisor()
+    _supervisor.start()
 
 
 def stop_workers() -> None:
     logger.info("Stopping workers")
-    _watcher.stop()
+    if _supervisor:
+        _supervisor.stop()
+
+
+def worker_status() -> list[dict]:
+    return _supervisor.status() if _supervisor else []
+
+
+def _build_supervisor() -> WorkerSupervisor:
+    settings = get_settings()
+    if settings.index_warmup:
+        from integrations.llamaindex import warm_index
+
+        warm_index()
+    return WorkerSupervisor(
+        {"raw_doctrine_watcher": RawDoctrineWatcherWorker},
+        check_interval=settings.supervisor_check_seconds,
+    )
 
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     logger.info("Welcome to MASX AI")
+    _supervisor = _build_supervisor()
+    _supervisor.run_forever()
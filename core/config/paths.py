@@ -9,6 +9,8 @@ class Paths:
     CLEANED_DIR = BASE_DATA_DIR / "cleaned"
     CHUNK_DIR = BASE_DATA_DIR / "chunks"
     VECTOR_DIR = BASE_DATA_DIR / "vector"
+    STATE_DIR = BASE_DATA_DIR / "state"
+    OCR_CACHE_DIR = BASE_DATA_DIR / "ocr_cache"
     TEMPLATE_DIR = Path("templates/doctrines")
 
     @classmethod
@@ -19,5 +21,7 @@ class Paths:
             cls.CLEANED_DIR,
             cls.CHUNK_DIR,
             cls.VECTOR_DIR,
+            cls.STATE_DIR,
+            cls.OCR_CACHE_DIR,
         ]:
             path.mkdir(parents=True, exist_ok=True)
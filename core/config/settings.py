@@ -1,6 +1,19 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from core.domain.constants import (
+    DEFAULT_PIPELINE_STAGE_CONCURRENCY,
+    DEFAULT_RAG_CONTEXT_MODE,
+    DEFAULT_SUPERVISOR_CHECK_SECONDS,
+    DEFAULT_WATCHER_DEBOUNCE_SECONDS,
+    DEFAULT_WATCHER_WORKERS,
+    DoctrineStatus,
+    EmbeddingPrecision,
+    IndexLayout,
+    RagContextMode,
+    VectorStoreBackend,
+)
+
 
 class AppSettings(BaseSettings):
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
@@ -19,6 +32,34 @@ class AppSettings(BaseSettings):
     )
     llamaindex_chunk_size: int = Field(default=512, alias="LLAMAINDEX_CHUNK_SIZE")
     llamaindex_chunk_overlap: int = Field(default=64, alias="LLAMAINDEX_CHUNK_OVERLAP")
+    vector_store_backend: VectorStoreBackend = Field(
+        default=VectorStoreBackend.CHROMA,
+        alias="VECTOR_STORE_BACKEND",
+    )
+    vector_store_precision: EmbeddingPrecision = Field(
+        default=EmbeddingPrecision.FLOAT16,
+        alias="VECTOR_STORE_PRECISION",
+    )
+    index_layout: IndexLayout = Field(default=IndexLayout.SHARED, alias="INDEX_LAYOUT")
+    index_warmup: bool = Field(default=False, alias="INDEX_WARMUP")
+    rag_context_mode: RagContextMode = Field(
+        default=DEFAULT_RAG_CONTEXT_MODE,
+        alias="RAG_CONTEXT_MODE",
+    )
+    watcher_debounce_seconds: float = Field(
+        default=DEFAULT_WATCHER_DEBOUNCE_SECONDS,
+        alias="WATCHER_DEBOUNCE_SECONDS",
+    )
+    watcher_workers: int = Field(default=DEFAULT_WATCHER_WORKERS, alias="WATCHER_WORKERS")
+    pipeline_stage_concurrency: dict[DoctrineStatus, int] = Field(
+        default_factory=lambda: dict(DEFAULT_PIPELINE_STAGE_CONCURRENCY),
+        alias="PIPELINE_STAGE_CONCURRENCY",
+    )
+    chunking_llms: list[str] = Field(default_factory=list, alias="CHUNKING_LLMS")
+    supervisor_check_seconds: float = Field(
+        default=DEFAULT_SUPERVISOR_CHECK_SECONDS,
+        alias="SUPERVISOR_CHECK_SECONDS",
+    )
 
 
 _settings: AppSettings | None = None
@@ -1,9 +1,19 @@
-from .parser import convert_text_to_chunks, normalize_chunk, safe_parse_llm_chunk
-from .text_splitter import split_text
+from .bulk_splitter import split_corpus, split_texts
+from .parser import (
+    convert_text_to_chunks,
+    normalize_chunk,
+    parse_llm_chunks,
+    safe_parse_llm_chunk,
+)
+from .text_splitter import split_file, split_text
 
 __all__ = [
     "convert_text_to_chunks",
     "normalize_chunk",
+    "parse_llm_chunks",
     "safe_parse_llm_chunk",
+    "split_corpus",
+    "split_file",
     "split_text",
+    "split_texts",
 ]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import TypeVar
+
+from core.config.paths import Paths
+from core.domain.constants import DEFAULT_CHUNK_SIZE
+from core.doctrine.text_splitter import split_file, split_text
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True)
+class _SplitOutcome:
+    slug: str
+    segments: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
+def split_corpus(
+    slugs: list[str] | None = None,
+    *,
+    max_tokens: int = DEFAULT_CHUNK_SIZE,
+    overlap_tokens: int = 0,
+    max_workers: int | None = None,
+) -> dict[str, list[str]]:
+    """Split cleaned doctrines across a process pool, one doctrine per task.
+
+    Defaults to every doctrine in ``Paths.CLEANED_DIR``. A doctrine that
+    fails to split is logged and left out of the result.
+    """
+    slugs = slugs if slugs is not None else sorted(p.stem for p in Paths.CLEANED_DIR.glob("*.md"))
+    split = partial(
+        _split_doctrine,
+        cleaned_dir=Paths.CLEANED_DIR,
+        max_tokens=max_tokens,
+        overlap_tokens=overlap_tokens,
+    )
+
+    segments: dict[str, list[str]] = {}
+    for outcome in _map(split, slugs, max_workers=max_workers):
+        if outcome.error is not None:
+            logger.error("Failed to split %s: %s", outcome.slug, outcome.error)
+            continue
+        segments[outcome.slug] = outcome.segments
+
+    logger.info(
+        "Split %d/%d doctrines into %d segments (max_tokens=%d, overlap=%d)",
+        len(segments), len(slugs), sum(len(s) for s in segments.values()),
+        max_tokens, overlap_tokens,
+    )
+    return segments
+
+
+def split_texts(
+    texts: list[str],
+    *,
+    max_tokens: int = DEFAULT_CHUNK_SIZE,
+    overlap_tokens: int = 0,
+    max_workers: int | None = None,
+) -> list[list[str]]:
+    split = partial(split_text, max_tokens=max_tokens, overlap_tokens=overlap_tokens)
+    return _map(split, texts, max_workers=max_workers)
+
+
+def _map(
+    fn: Callable[[_T], _R],
+    items: Sequence[_T],
+    *,
+    max_workers: int | None,
+) -> list[_R]:
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+    if workers <= 1:
+        return [fn(item) for item in items]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items, chunksize=max(1, len(items) // (workers * 4))))
+
+
+def _split_doctrine(
+    slug: str,
+    *,
+    cleaned_dir: Path,
+    max_tokens: int,
+    overlap_tokens: int,
+) -> _SplitOutcome:
+    path = cleaned_dir / f"{slug}.md"
+    try:
+        segments = list(split_file(path, max_tokens=max_tokens, overlap_tokens=overlap_tokens))
+    except (OSError, ValueError) as e:
+        return _SplitOutcome(slug=slug, error=f"{type(e).__name__}: {e}")
+    return _SplitOutcome(slug=slug, segments=segments)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger(__name__)
+
+_READ_BLOCK_BYTES = 1 << 20
+
+
+class FileFingerprint(BaseModel):
+    name: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    def same_content(self, other: FileFingerprint) -> bool:
+        return self.name == other.name and self.sha256 == other.sha256
+
+
+class _ManifestFile(BaseModel):
+    version: str
+    entries: dict[str, list[FileFingerprint]] = Field(default_factory=dict)
+
+
+class FingerprintManifest:
+    """Persisted fingerprints of input files, grouped under a key such as a slug.
+
+    Fingerprinting is stat-first: a file whose size and mtime match its last
+    recorded fingerprint reuses the stored hash, so only files whose stats
+    changed are read. A group counts as changed only when a file's content
+    hash differs, a file was added or removed, or ``version`` changed (the
+    code that turns inputs into outputs changed). Touching a file without
+    editing it is not a change.
+    """
+
+    def __init__(self, path: Path, *, version: str) -> None:
+        self._path = path
+        self.version = version
+        self._entries = self._load()
+        self._known = {fp.name: fp for group in self._entries.values() for fp in group}
+
+    def fingerprint(self, file: Path) -> FileFingerprint:
+        stat = file.stat()
+        known = self._known.get(file.name)
+        if known and known.size == stat.st_size and known.mtime_ns == stat.st_mtime_ns:
+            return known
+        return FileFingerprint(
+            name=file.name,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=_hash_file(file),
+        )
+
+    def fingerprint_groups(
+        self,
+        groups: dict[str, list[Path]],
+        *,
+        max_workers: int | None = None,
+    ) -> dict[str, list[FileFingerprint]]:
+        """Fingerprint every file of every group, hashing changed files in parallel."""
+        files = [file for group in groups.values() for file in group]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            by_path = dict(zip(files, pool.map(self.fingerprint, files)))
+        return {key: [by_path[file] for file in group] for key, group in groups.items()}
+
+    def is_current(self, key: str, fingerprints: list[FileFingerprint]) -> bool:
+        recorded = self._entries.get(key)
+        return recorded is not None and len(recorded) == len(fingerprints) and all(
+            old.same_content(new) for old, new in zip(recorded, fingerprints)
+        )
+
+    def keys(self) -> list[str]:
+        return list(self._entries)
+
+    def update(self, key: str, fingerprints: list[FileFingerprint]) -> None:
+        self._entries[key] = fingerprints
+        self._known.update((fp.name, fp) for fp in fingerprints)
+
+    def discard(self, key: str) -> None:
+        for fp in self._entries.pop(key, []):
+            self._known.pop(fp.name, None)
+
+    def save(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(
+            _ManifestFile(version=self.version, entries=self._entries).model_dump_json(),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self._path)
+
+    def _load(self) -> dict[str, list[FileFingerprint]]:
+        if not self._path.exists():
+            return {}
+        try:
+            manifest = _ManifestFile.model_validate_json(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValidationError) as e:
+            logger.warning("Ignoring unreadable fingerprint manifest %s: %s", self._path, e)
+            return {}
+        if manifest.version != self.version:
+            logger.info(
+                "Fingerprint manifest %s is for version %s, now %s — treating all inputs as changed",
+                self._path.name, manifest.version, self.version,
+            )
+            return {}
+        return manifest.entries
+
+
+def _hash_file(path: Path) -> str:
+    """SHA-256 of the file's content, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_READ_BLOCK_BYTES):
+            digest.update(block)
+    return digest.hexdigest()
@@ -4,11 +4,13 @@ import json
 import logging
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pydantic import BaseModel, Field, ValidationError as PydanticValidationError
 
 from core.config import Paths
+from core.doctrine.fingerprints import FingerprintManifest
 from core.domain.constants import SUPPORTED_DOC_EXTENSIONS, DoctrineStatus
 
 logger = logging.getLogger(__name__)
@@ -96,7 +98,7 @@ class DoctrineMetadata:
 
     def save(self) -> Path:
         self.STORAGE_DIR.mkdir(parents=True, exist_ok=True)
-        output_path = self.STORAGE_DIR / f"{self.slug}.json"
+        output_path = self.path_for(self.slug)
         output_path.write_text(
             json.dumps(self.data, indent=4), encoding="utf-8"
         )
@@ -107,19 +109,112 @@ class DoctrineMetadata:
 
     @staticmethod
     def extract_slug(filename: str) -> str:
-        return re.sub(r"[-_](\d+)$", "", Path(filename).stem.lower())
+        return _PART_SUFFIX.sub("", Path(filename).stem.lower())
+
+    @staticmethod
+    def part_order(file: Path) -> tuple[str, int, str]:
+        """Sort key putting ``slug_2`` before ``slug_10``; unnumbered files come first."""
+        stem = file.stem.lower()
+        match = _PART_SUFFIX.search(stem)
+        return (stem[:match.start()], int(match.group(1)), file.name) if match else (stem, -1, file.name)
 
     @classmethod
-    def bulk_generate(cls, raw_dir: str) -> None:
-        raw_path = Path(raw_dir)
-        grouped: dict[str, list[str]] = defaultdict(list)
-        for file in raw_path.iterdir():
+    def raw_files(cls, slug: str, raw_dir: Path) -> list[Path]:
+        """Every supported raw file belonging to ``slug``, in part order."""
+        return sorted(
+            (
+                file
+                for file in raw_dir.iterdir()
+                if file.suffix.lower() in SUPPORTED_DOC_EXTENSIONS
+                and cls.extract_slug(file.name) == slug
+            ),
+            key=cls.part_order,
+        )
+
+    @classmethod
+    def group_raw_files(cls, raw_dir: Path) -> dict[str, list[Path]]:
+        """Every supported raw file in ``raw_dir``, grouped by slug in part order."""
+        grouped: dict[str, list[Path]] = defaultdict(list)
+        for file in sorted(raw_dir.iterdir(), key=cls.part_order):
             if file.suffix.lower() in SUPPORTED_DOC_EXTENSIONS:
-                slug = cls.extract_slug(file.name)
-                grouped[slug].append(file.name)
-        for slug, files in grouped.items():
-            instance = cls(slug, files, raw_path)
-            instance.save()
+                grouped[cls.extract_slug(file.name)].append(file)
+        return dict(grouped)
+
+    @classmethod
+    def for_slug(cls, slug: str, raw_dir: Path) -> DoctrineMetadata | None:
+        """Metadata covering every raw file of ``slug``; None if none remain."""
+        files = [file.name for file in cls.raw_files(slug, raw_dir)]
+        return cls(slug, files, raw_dir) if files else None
+
+    @classmethod
+    def path_for(cls, slug: str) -> Path:
+        return cls.STORAGE_DIR / f"{slug}.json"
+
+    @classmethod
+    def delete(cls, slug: str) -> None:
+        cls.path_for(slug).unlink(missing_ok=True)
+
+    @classmethod
+    def set_status(cls, slug: str, status: DoctrineStatus) -> None:
+        path = cls.path_for(slug)
+        if not path.exists():
+            return
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["status"] = status.value
+        path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+
+    @classmethod
+    def bulk_generate(
+        cls,
+        raw_dir: str | Path,
+        *,
+        max_workers: int | None = None,
+        force: bool = False,
+    ) -> list[str]:
+        """Regenerate metadata for every slug whose raw files changed since the last run.
+
+        The raw directory is scanned once. Source files are fingerprinted
+        stat-first, and only slugs with new, removed or edited files (or a
+        missing metadata file) are written, in parallel. Metadata of slugs
+        whose raw files are all gone is deleted. Returns the written slugs.
+        """
+        raw_path = Path(raw_dir)
+        grouped = cls.group_raw_files(raw_path)
+        manifest = FingerprintManifest(_fingerprint_path(), version=_METADATA_VERSION)
+        fingerprints = manifest.fingerprint_groups(grouped, max_workers=max_workers)
+        changed = [
+            slug
+            for slug, prints in fingerprints.items()
+            if force
+            or not manifest.is_current(slug, prints)
+            or not cls.path_for(slug).exists()
+        ]
+
+        def generate(slug: str) -> None:
+            cls(slug, [file.name for file in grouped[slug]], raw_path).save()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(generate, changed))
+
+        for slug in set(manifest.keys()) - set(grouped):
+            manifest.discard(slug)
+            cls.delete(slug)
+            logger.info("Removed metadata of %s — no raw files remain", slug)
+        for slug, prints in fingerprints.items():
+            manifest.update(slug, prints)
+        manifest.save()
+        logger.info(
+            "Metadata bulk generation: %d of %d doctrines changed", len(changed), len(grouped),
+        )
+        return changed
+
+
+_PART_SUFFIX = re.compile(r"[-_](\d+)$")
+_METADATA_VERSION = DoctrineMetadataModel.model_fields["metadata_version"].default
+
+
+def _fingerprint_path() -> Path:
+    return Paths.STATE_DIR / "fingerprints" / "metadata.json"
 
 
 def _source_type(filename: str) -> str:
@@ -1,14 +1,12 @@
-import json
 import logging
 import re
 
 from core.domain.models import DoctrineChunk, ChunkMeta
+from core.llm.json_repair import RepairStats, scan_json_objects
 
 logger = logging.getLogger(__name__)
 
-_SECTION_PATTERN = re.compile(
-    r'{\s*"section"\s*:[\s\S]+?}', re.DOTALL
-)
+_TEXT_FIELD_PATTERN = re.compile(r'"text"\s*:\s*"([^"]*)"')
 _MARKDOWN_PATTERN = re.compile(
     r"\*\*Section:\*\* (.*?)\n\*\*Text:\*\*\n(.*?)(?=\n###|$)",
     re.DOTALL,
@@ -16,21 +14,37 @@ _MARKDOWN_PATTERN = re.compile(
 
 
 def convert_text_to_chunks(raw_text: str) -> list[dict]:
-    chunks = _try_json_parse(raw_text)
+    chunks, stats = parse_llm_chunks(raw_text)
+    if stats.repairs or stats.failed:
+        logger.info("Repaired LLM chunk output: %s", stats)
     if chunks:
         return chunks
     return _parse_markdown_fallback(raw_text)
 
 
-def _try_json_parse(raw_text: str) -> list[dict]:
-    match = _SECTION_PATTERN.search(raw_text)
-    if not match:
-        return []
-
-    parsed = safe_parse_llm_chunk(match.group())
-    if parsed:
-        return [normalize_chunk(parsed, idx=1)]
-    return []
+def parse_llm_chunks(raw_text: str) -> tuple[list[dict], RepairStats]:
+    """Every chunk object in an LLM response, normalised, with repair statistics."""
+    objects, stats = scan_json_objects(raw_text)
+    chunks = [
+        normalize_chunk(parsed, idx=idx)
+        for idx, parsed in enumerate(_chunk_objects(objects), 1)
+    ]
+    return chunks, stats
+
+
+def _chunk_objects(objects: list) -> list[dict]:
+    """Chunk-shaped dicts, unwrapping containers such as ``{"chunks": [...]}``."""
+    chunks: list[dict] = []
+    for obj in objects:
+        if not isinstance(obj, dict):
+            continue
+        if obj.get("section") or obj.get("text"):
+            chunks.append(obj)
+            continue
+        for value in obj.values():
+            if isinstance(value, list):
+                chunks.extend(_chunk_objects(value))
+    return chunks
 
 
 def _parse_markdown_fallback(raw_text: str) -> list[dict]:
@@ -75,51 +89,12 @@ def safe_parse_llm_chunk(raw_json_str: str) -> dict | None:
     if not raw_json_str:
         return None
 
-    raw = _clean_json_string(raw_json_str)
-    raw = _fix_common_json_issues(raw)
-    raw = _balance_braces(raw)
-
-    return _parse_with_fallbacks(raw)
-
-
-def _clean_json_string(raw: str) -> str:
-    raw = raw.strip()
-    raw = re.sub(r"```json\s*|\s*```", "", raw)
-    raw = re.sub(r"^[^{]*", "", raw)
-    raw = re.sub(r"[^}]*$", "", raw)
-    return raw
-
-
-def _fix_common_json_issues(raw: str) -> str:
-    raw = re.sub(r",\s*([}\]])", r"\1", raw)
-    raw = re.sub(r"([{,]\s*)(\w+)(\s*:)", r'\1"\2"\3', raw)
-    raw = re.sub(r"'", '"', raw)
-    return raw
-
-
-def _balance_braces(raw: str) -> str:
-    opens = raw.count("{")
-    closes = raw.count("}")
-    if closes < opens:
-        raw += "}" * (opens - closes)
-    elif closes > opens:
-        raw = "{" * (closes - opens) + raw
-    return raw
-
-
-def _parse_with_fallbacks(raw: str) -> dict | None:
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        pass
-
-    try:
-        wrapped = raw if raw.startswith("[") else f"[{raw}]"
-        return json.loads(wrapped)[0]
-    except json.JSONDecodeError:
-        pass
+    objects, _ = scan_json_objects(raw_json_str)
+    parsed = next((obj for obj in objects if isinstance(obj, dict) and obj), None)
+    if parsed is not None:
+        return parsed
 
-    text_match = re.search(r'"text"\s*:\s*"([^"]*)"', raw)
+    text_match = _TEXT_FIELD_PATTERN.search(raw_json_str)
     if text_match:
         return {
             "section": "Extracted Content",
@@ -127,5 +102,5 @@ def _parse_with_fallbacks(raw: str) -> dict | None:
             "meta": {"theme": "unspecified", "region": "unspecified", "use_case": "doctrine_selector"},
         }
 
-    logger.debug("Failed to parse LLM chunk: %.100s...", raw)
+    logger.debug("Failed to parse LLM chunk: %.100s...", raw_json_str)
     return None
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+from core.config.paths import Paths
+from core.doctrine.fingerprints import FileFingerprint, FingerprintManifest
+from core.domain.constants import DoctrineStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """One step of the doctrine pipeline.
+
+    ``status`` is what the doctrine reaches once ``run`` succeeds. ``inputs``
+    lists the files the stage reads; their fingerprints decide whether the
+    stage has to run again.
+    """
+
+    status: DoctrineStatus
+    inputs: Callable[[str], list[Path]]
+    run: Callable[[str], None]
+    concurrency: int = 1
+
+
+class DoctrineState(BaseModel):
+    slug: str
+    status: DoctrineStatus | None = None
+    error: str | None = None
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
+class DoctrinePipeline:
+    """Advances a single doctrine through its stages, skipping up-to-date ones.
+
+    A stage runs when its inputs differ from the fingerprints recorded the
+    last time it succeeded, or when an earlier stage ran in the same pass.
+    Fingerprints live in a per-doctrine ``FingerprintManifest``, so inputs
+    whose size and mtime are unchanged are not read again. Each stage has its own concurrency limit, so slow LLM chunking can
+    be throttled while cheap stages of other doctrines keep moving. A failed
+    stage records its error and the next pass resumes from it. ``remove``
+    drops a doctrine whose raw files are gone, through ``on_remove``.
+    """
+
+    def __init__(
+        self,
+        stages: list[PipelineStage],
+        *,
+        state_dir: Path | None = None,
+        on_status: Callable[[str, DoctrineStatus], None] | None = None,
+        on_remove: Callable[[str], None] | None = None,
+    ) -> None:
+        self._stages = stages
+        self._state_dir = state_dir or Paths.STATE_DIR
+        self._on_status = on_status
+        self._on_remove = on_remove
+        self._limits = {
+            stage.status: threading.BoundedSemaphore(stage.concurrency) for stage in stages
+        }
+
+    def process(self, slug: str) -> DoctrineState:
+        state = self.load_state(slug)
+        manifest = FingerprintManifest(self._fingerprint_path(slug), version=_FINGERPRINT_VERSION)
+        fingerprints: dict[Path, FileFingerprint] = {}
+        upstream_ran = False
+        try:
+            for stage in self._stages:
+                inputs = stage.inputs(slug)
+                if not inputs or not all(path.exists() for path in inputs):
+                    logger.info("[%s] %s: inputs missing, stopping", slug, stage.status.value)
+                    break
+                for path in inputs:
+                    if path not in fingerprints:
+                        fingerprints[path] = manifest.fingerprint(path)
+                prints = [fingerprints[path] for path in inputs]
+                if not upstream_ran and manifest.is_current(stage.status.value, prints):
+                    state.status = stage.status
+                    continue
+                manifest.discard(stage.status.value)
+                self._run_stage(stage, state)
+                manifest.update(stage.status.value, prints)
+                upstream_ran = True
+        finally:
+            manifest.save()
+        self.save_state(state)
+        return state
+
+    def remove(self, slug: str) -> None:
+        """Drop every output and the recorded state of ``slug``."""
+        logger.info("[%s] removing doctrine", slug)
+        if self._on_remove:
+            self._on_remove(slug)
+        self._state_path(slug).unlink(missing_ok=True)
+        self._fingerprint_path(slug).unlink(missing_ok=True)
+
+    def load_state(self, slug: str) -> DoctrineState:
+        path = self._state_path(slug)
+        if path.exists():
+            try:
+                return DoctrineState.model_validate_json(path.read_text(encoding="utf-8"))
+            except ValidationError as e:
+                logger.warning("Ignoring unreadable pipeline state %s: %s", path, e)
+        return DoctrineState(slug=slug)
+
+    def save_state(self, state: DoctrineState) -> None:
+        self._state_dir.mkdir(parents=True, exist_ok=True)
+        state.updated_at = datetime.now(UTC)
+        self._state_path(state.slug).write_text(
+            state.model_dump_json(indent=2), encoding="utf-8",
+        )
+
+    def _run_stage(self, stage: PipelineStage, state: DoctrineState) -> None:
+        slug = state.slug
+        with self._limits[stage.status]:
+            logger.info("[%s] running stage %s", slug, stage.status.value)
+            try:
+                stage.run(slug)
+            except Exception as e:
+                state.error = f"{stage.status.value}: {e}"
+                self.save_state(state)
+                raise
+        state.status = stage.status
+        state.error = None
+        self.save_state(state)
+        if self._on_status:
+            self._on_status(slug, stage.status)
+
+    def _state_path(self, slug: str) -> Path:
+        return self._state_dir / f"{slug}.json"
+
+    def _fingerprint_path(self, slug: str) -> Path:
+        return self._state_dir / "fingerprints" / "pipeline" / f"{slug}.json"
+
+
+# Bump when stage outputs change, so every stage of every doctrine runs again.
+_FINGERPRINT_VERSION = "1"
@@ -1,22 +1,109 @@
 import logging
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from core.config.paths import Paths
-from core.domain.constants import SUPPORTED_DOC_EXTENSIONS
+from core.domain.constants import DEFAULT_OCR_DPI, SUPPORTED_DOC_EXTENSIONS
 from core.domain.exceptions import FileProcessingError
+from core.doctrine.fingerprints import FileFingerprint, FingerprintManifest
+from core.doctrine.metadata.doctrine_metadata import DoctrineMetadata
+from core.doctrine.processor.helpers.ocr_cache import CachedPageOcr
+from core.doctrine.processor.helpers.page_stream import (
+    StreamingTextCleaner,
+    extract_pdf_pages,
+)
 from core.doctrine.text_splitter import split_text
 
 logger = logging.getLogger(__name__)
 
 _SLUG_PATTERN = re.compile(r"[^a-zA-Z0-9]+")
 
+# Bump when cleaning output changes, so every doctrine is cleaned again.
+PROCESSOR_VERSION = "1"
+
+_OCR_LANGUAGES = ["en"]
+
 
 class DoctrineProcessor:
     @staticmethod
-    def batch_process() -> None:
-        _process_text_files()
-        _process_pdf_files()
+    def batch_process(*, force: bool = False) -> list[str]:
+        """Clean doctrines whose raw files are new or changed since they were last cleaned.
+
+        Raw files are grouped by doctrine slug, so the parts of a multi-part
+        doctrine are fingerprinted together and an edited part re-cleans the
+        whole ``<slug>.md`` and deletes its now stale chunk file. The first
+        run without a manifest records doctrines whose cleaned output is
+        newer than every raw part as clean instead of cleaning them again.
+        Returns the slugs that were cleaned.
+        """
+        path = _fingerprint_path()
+        first_run = not path.exists()
+        manifest = FingerprintManifest(path, version=PROCESSOR_VERSION)
+        groups = (
+            DoctrineMetadata.group_raw_files(Paths.RAW_DIR) if Paths.RAW_DIR.exists() else {}
+        )
+        fingerprints = manifest.fingerprint_groups(groups)
+        if first_run:
+            _seed_from_cleaned_outputs(manifest, groups, fingerprints)
+
+        cleaned: list[str] = []
+        ocr: CachedPageOcr | None = None
+        try:
+            for slug, files in groups.items():
+                if (
+                    not force
+                    and manifest.is_current(slug, fingerprints[slug])
+                    and _cleaned_path(slug).exists()
+                ):
+                    logger.info("Skipping %s — unchanged since last clean", slug)
+                    continue
+                try:
+                    if ocr is None and any(file.suffix.lower() == ".pdf" for file in files):
+                        ocr = _create_ocr_reader()
+                    DoctrineProcessor.clean_doctrine(slug, files, ocr=ocr)
+                except FileProcessingError as e:
+                    logger.error("Failed to clean %s: %s", slug, e)
+                    continue
+                _mark_cleaned(manifest, slug, fingerprints[slug])
+                cleaned.append(slug)
+        finally:
+            for slug in set(manifest.keys()) - set(groups):
+                manifest.discard(slug)
+            manifest.save()
+        return cleaned
+
+    @staticmethod
+    def clean_doctrine(
+        slug: str,
+        files: list[Path],
+        *,
+        ocr: CachedPageOcr | None = None,
+    ) -> Path:
+        """Clean every part of one doctrine, in order, into a single ``<slug>.md``.
+
+        A single-PDF doctrine is extracted resumably, page by page.
+        """
+        dest = _cleaned_path(slug)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if len(files) == 1 and files[0].suffix.lower() == ".pdf":
+            _extract_pdf_text(files[0], dest, ocr or _create_ocr_reader())
+            return dest
+        partial = dest.with_name(dest.name + ".partial")
+        cleaner = StreamingTextCleaner()
+        with open(partial, "w", encoding="utf-8") as out:
+            for part_idx, path in enumerate(files):
+                separator = "\n\n" if part_idx else ""
+                if path.suffix.lower() != ".pdf":
+                    out.write(cleaner.feed(separator + _read_text(path)))
+                    continue
+                ocr = ocr or _create_ocr_reader()
+                for page_idx, text in enumerate(_iter_pdf_page_texts(path, ocr)):
+                    out.write(cleaner.feed((separator if page_idx == 0 else "\n") + text))
+        os.replace(partial, dest)
+        logger.info("Cleaned %d file(s) of %s → %s", len(files), slug, dest.name)
+        return dest
 
     @staticmethod
     def extract_slug(filename: str) -> str:
@@ -24,77 +111,94 @@ class DoctrineProcessor:
         return _SLUG_PATTERN.sub("_", name).strip("_").lower()
 
 
-def _process_text_files() -> None:
-    txt_files = list(Paths.RAW_DIR.glob("*.txt"))
-    for file_path in txt_files:
-        slug = DoctrineProcessor.extract_slug(file_path.name)
-        cleaned_path = Paths.CLEANED_DIR / f"{slug}.md"
-        if cleaned_path.exists():
-            logger.info("Skipping %s — already cleaned", slug)
-            continue
-        _clean_and_save_text(file_path, cleaned_path)
+def _seed_from_cleaned_outputs(
+    manifest: FingerprintManifest,
+    groups: dict[str, list[Path]],
+    fingerprints: dict[str, list[FileFingerprint]],
+) -> None:
+    seeded = 0
+    for slug, files in groups.items():
+        cleaned = _cleaned_path(slug)
+        if cleaned.exists() and cleaned.stat().st_mtime_ns >= max(
+            file.stat().st_mtime_ns for file in files
+        ):
+            manifest.update(slug, fingerprints[slug])
+            seeded += 1
+    logger.info("Seeded cleaning manifest from %d existing cleaned doctrines", seeded)
 
 
-def _process_pdf_files() -> None:
-    try:
-        import fitz
-        import easyocr
-    except ImportError:
-        logger.warning("PyMuPDF or EasyOCR not installed — skipping PDF processing")
-        return
+def _mark_cleaned(
+    manifest: FingerprintManifest,
+    slug: str,
+    fingerprints: list[FileFingerprint],
+) -> None:
+    manifest.update(slug, fingerprints)
+    chunk_path = Paths.CHUNK_DIR / f"{slug}_chunks.json"
+    if chunk_path.exists():
+        chunk_path.unlink()
+        logger.info("Invalidated stale chunks %s", chunk_path.name)
+
+
+def _cleaned_path(slug: str) -> Path:
+    return Paths.CLEANED_DIR / f"{slug}.md"
 
-    pdf_files = list(Paths.RAW_DIR.glob("*.pdf"))
-    if not pdf_files:
-        return
 
-    reader = easyocr.Reader(["en"])
-    for file_path in pdf_files:
-        slug = DoctrineProcessor.extract_slug(file_path.name)
-        cleaned_path = Paths.CLEANED_DIR / f"{slug}.md"
-        if cleaned_path.exists():
-            continue
-        _extract_pdf_text(file_path, cleaned_path, reader)
+def _fingerprint_path() -> Path:
+    # Keyed by doctrine slug; the older per-file "cleaning.json" is not reused.
+    return Paths.STATE_DIR / "fingerprints" / "doctrine_cleaning.json"
 
 
-def _clean_and_save_text(source: Path, dest: Path) -> None:
+def _read_text(source: Path) -> str:
     try:
-        raw = source.read_text(encoding="utf-8")
-        cleaned = _clean_text(raw)
-        dest.write_text(cleaned, encoding="utf-8")
-        logger.info("Cleaned %s → %s", source.name, dest.name)
+        return source.read_text(encoding="utf-8")
     except Exception as e:
         raise FileProcessingError(f"Failed to clean {source}: {e}") from e
 
 
-def _extract_pdf_text(pdf_path: Path, dest: Path, reader) -> None:
-    import fitz
+def _create_ocr_reader() -> CachedPageOcr:
+    try:
+        import easyocr
+    except ImportError as e:
+        raise FileProcessingError("PyMuPDF and EasyOCR are required to clean PDFs") from e
+    return CachedPageOcr(
+        lambda: easyocr.Reader(_OCR_LANGUAGES),
+        engine_version=f"easyocr-{easyocr.__version__}-{'+'.join(_OCR_LANGUAGES)}",
+        dpi=DEFAULT_OCR_DPI,
+    )
+
 
+def _extract_pdf_text(pdf_path: Path, dest: Path, ocr: CachedPageOcr) -> None:
     try:
-        doc = fitz.open(str(pdf_path))
-        all_text: list[str] = []
-        for page in doc:
-            text = page.get_text()
-            if text.strip():
-                all_text.append(text)
-            else:
-                all_text.append(_ocr_page(page, reader))
-        doc.close()
-
-        cleaned = _clean_text("\n".join(all_text))
-        dest.write_text(cleaned, encoding="utf-8")
-        logger.info("Extracted PDF %s → %s", pdf_path.name, dest.name)
+        pages = extract_pdf_pages(
+            pdf_path,
+            dest,
+            page_text=lambda page: ocr.page_text(page, document=pdf_path.name),
+        )
+    except FileProcessingError:
+        raise
     except Exception as e:
         raise FileProcessingError(f"Failed to process PDF {pdf_path}: {e}") from e
+    logger.info("Extracted PDF %s (%d pages) → %s", pdf_path.name, pages, dest.name)
+    _log_ocr_stats(pdf_path, ocr)
 
 
-def _ocr_page(page, reader) -> str:
-    pix = page.get_pixmap()
-    img_bytes = pix.tobytes("png")
-    results = reader.readtext(img_bytes)
-    return " ".join(text for _, text, _ in results)
+def _iter_pdf_page_texts(pdf_path: Path, ocr: CachedPageOcr) -> Iterator[str]:
+    try:
+        import fitz
+
+        with fitz.open(str(pdf_path)) as doc:
+            for page in doc:
+                yield ocr.page_text(page, document=pdf_path.name)
+    except Exception as e:
+        raise FileProcessingError(f"Failed to process PDF {pdf_path}: {e}") from e
+    _log_ocr_stats(pdf_path, ocr)
+
 
+def _log_ocr_stats(pdf_path: Path, ocr: CachedPageOcr) -> None:
+    stats = ocr.stats_for(pdf_path.name)
+    logger.info(
+        "OCR cache for %s: %d pages, %d with text, %d hits, %d OCRed (coverage %.0f%%)",
+        pdf_path.name, stats.pages, stats.text_pages, stats.cache_hits,
+        stats.cache_misses, stats.coverage * 100,
+    )
 
-def _clean_text(text: str) -> str:
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
-    return text.strip()
@@ -1,12 +1,17 @@
 import json
 import logging
+import os
+import textwrap
 import time
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
 
 from core.config.paths import Paths
 from core.domain.constants import ResponseType
 from core.domain.exceptions import DoctrineProcessingError
 from core.doctrine.parser import convert_text_to_chunks
-from core.doctrine.text_splitter import split_text
+from core.doctrine.text_splitter import split_file
 from core.llm.ports import LLMClientPort
 from core.prompts.prompts import Prompts
 
@@ -24,44 +29,40 @@ class ChunkAndEnrich:
         *,
         embedded_prompt: str = Prompts.CHUNK_AND_ENRICH_PROMPT,
         system_prompt: str = Prompts.SYSTEM_ROLE_PROMPT,
+        overwrite: bool = False,
     ) -> None:
         chunk_path = Paths.CHUNK_DIR / f"{slug}_chunks.json"
-        if chunk_path.exists():
+        if chunk_path.exists() and not overwrite:
             logger.info("Skipping %s — already chunked", slug)
             return
 
         cleaned_path = Paths.CLEANED_DIR / f"{slug}.md"
-        full_text = cleaned_path.read_text(encoding="utf-8")
+        batches = _batched(split_file(cleaned_path, max_tokens=1000), _BATCH_SIZE)
+        chunks = _process_batches(slug, batches, clients, embedded_prompt, system_prompt)
+        _save_chunks(chunk_path, _assign_ids(slug, chunks))
 
-        segments = split_text(full_text, max_tokens=1000)
-        batches = [segments[i : i + _BATCH_SIZE] for i in range(0, len(segments), _BATCH_SIZE)]
 
-        all_chunks = _process_batches(slug, batches, clients, embedded_prompt, system_prompt)
-        _assign_ids(slug, all_chunks)
-        _save_chunks(chunk_path, all_chunks)
+def _batched(segments: Iterator[str], size: int) -> Iterator[list[str]]:
+    while batch := list(islice(segments, size)):
+        yield batch
 
 
 def _process_batches(
     slug: str,
-    batches: list[list[str]],
+    batches: Iterable[list[str]],
     clients: list[LLMClientPort],
     embedded_prompt: str,
     system_prompt: str,
-) -> list[dict]:
-    all_chunks: list[dict] = []
-
+) -> Iterator[dict]:
     for batch_idx, batch in enumerate(batches):
-        chunks = _try_clients(slug, batch_idx, len(batches), batch, clients, embedded_prompt, system_prompt)
-        all_chunks.extend(chunks)
-        time.sleep(_BATCH_DELAY_SECONDS)
-
-    return all_chunks
+        if batch_idx:
+            time.sleep(_BATCH_DELAY_SECONDS)
+        yield from _try_clients(slug, batch_idx, batch, clients, embedded_prompt, system_prompt)
 
 
 def _try_clients(
     slug: str,
     batch_idx: int,
-    total_batches: int,
     batch: list[str],
     clients: list[LLMClientPort],
     embedded_prompt: str,
@@ -69,7 +70,7 @@ def _try_clients(
 ) -> list[dict]:
     for client_idx, client in enumerate(clients):
         try:
-            logger.info("[%s] batch %d/%d via client %d", slug, batch_idx + 1, total_batches, client_idx)
+            logger.info("[%s] batch %d via client %d", slug, batch_idx + 1, client_idx)
 
             response = client.call_batch(batch, embedded_prompt, system_prompt)
 
@@ -90,13 +91,24 @@ def _try_clients(
     return []
 
 
-def _assign_ids(slug: str, chunks: list[dict]) -> None:
+def _assign_ids(slug: str, chunks: Iterable[dict]) -> Iterator[dict]:
     for idx, chunk in enumerate(chunks):
         chunk["id"] = f"{slug}_{str(idx + 1).zfill(3)}"
         chunk.setdefault("meta", {})["chunk_index"] = idx + 1
-
-
-def _save_chunks(path, chunks: list[dict]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(chunks, f, indent=2, ensure_ascii=False)
-    logger.info("Saved %d chunks to %s", len(chunks), path)
+        yield chunk
+
+
+def _save_chunks(path: Path, chunks: Iterable[dict]) -> None:
+    """Write chunks as a JSON array one at a time; the file appears once complete."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    count = 0
+    with open(partial, "w", encoding="utf-8") as f:
+        f.write("[")
+        for chunk in chunks:
+            f.write(",\n" if count else "\n")
+            f.write(textwrap.indent(json.dumps(chunk, indent=2, ensure_ascii=False), "  "))
+            count += 1
+        f.write("\n]" if count else "]")
+    os.replace(partial, path)
+    logger.info("Saved %d chunks to %s", count, path)
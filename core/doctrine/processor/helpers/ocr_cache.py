@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from core.config.paths import Paths
+
+logger = logging.getLogger(__name__)
+
+
+class OcrCache:
+    """Persistent OCR text per page image, one file per key in sharded directories."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self._dir = cache_dir or Paths.OCR_CACHE_DIR
+
+    @staticmethod
+    def key(image: bytes, *, engine_version: str, dpi: int) -> str:
+        digest = hashlib.sha256(image)
+        digest.update(f"|{engine_version}|{dpi}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.txt"
+
+
+@dataclass
+class OcrDocumentStats:
+    pages: int = 0
+    text_pages: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def coverage(self) -> float:
+        """Share of image-only pages served from the cache (1.0 when none needed OCR)."""
+        ocr_pages = self.cache_hits + self.cache_misses
+        return self.cache_hits / ocr_pages if ocr_pages else 1.0
+
+    def snapshot(self) -> dict:
+        return {**asdict(self), "coverage": round(self.coverage, 3)}
+
+
+class CachedPageOcr:
+    """Page text extraction that OCRs an image-only page at most once per rendering.
+
+    Pages with a text layer are returned as-is. Image-only pages are
+    rasterized at ``dpi`` and looked up by (pixel hash, engine version,
+    DPI); only misses reach the OCR reader, which is created on the first
+    miss so a fully cached re-extraction never loads the OCR model. Counts
+    are kept per document.
+    """
+
+    def __init__(
+        self,
+        reader_factory: Callable[[], Any],
+        *,
+        engine_version: str,
+        dpi: int,
+        cache: OcrCache | None = None,
+    ) -> None:
+        self._reader_factory = reader_factory
+        self._reader: Any | None = None
+        self._engine_version = engine_version
+        self._dpi = dpi
+        self._cache = cache or OcrCache()
+        self._stats: dict[str, OcrDocumentStats] = {}
+
+    def page_text(self, page: Any, *, document: str) -> str:
+        stats = self._stats.setdefault(document, OcrDocumentStats())
+        stats.pages += 1
+        text = page.get_text()
+        if text.strip():
+            stats.text_pages += 1
+            return text
+
+        pix = page.get_pixmap(dpi=self._dpi)
+        image = f"{pix.width}x{pix.height}x{pix.n}|".encode("ascii") + bytes(pix.samples)
+        key = OcrCache.key(image, engine_version=self._engine_version, dpi=self._dpi)
+        cached = self._cache.get(key)
+        if cached is not None:
+            stats.cache_hits += 1
+            return cached
+
+        stats.cache_misses += 1
+        if self._reader is None:
+            self._reader = self._reader_factory()
+        results = self._reader.readtext(pix.tobytes("png"))
+        text = " ".join(text for _, text, _ in results)
+        self._cache.put(key, text)
+        return text
+
+    def stats_for(self, document: str) -> OcrDocumentStats:
+        return self._stats.get(document, OcrDocumentStats())
+
+    def report(self) -> dict[str, dict]:
+        """Per-document page counts and OCR cache coverage for this run."""
+        return {document: stats.snapshot() for document, stats in self._stats.items()}
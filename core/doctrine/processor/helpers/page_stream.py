@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from core.domain.exceptions import FileProcessingError
+
+logger = logging.getLogger(__name__)
+
+_BLANK_LINES = re.compile(r"\n{3,}")
+_SPACES = re.compile(r"[ \t]+")
+_TRAILING_WHITESPACE = re.compile(r"\s+\Z")
+
+_PAGE_SEPARATOR = "\n"
+_PARTIAL_SUFFIX = ".partial"
+_CURSOR_SUFFIX = ".cursor"
+
+
+def clean_text(text: str) -> str:
+    text = _BLANK_LINES.sub("\n\n", text)
+    text = _SPACES.sub(" ", text)
+    return text.strip()
+
+
+class StreamingTextCleaner:
+    """Applies ``clean_text`` to a document fed in pieces.
+
+    The concatenated output of ``feed`` equals ``clean_text`` of the whole
+    document. Trailing whitespace of each piece is held back until the next
+    non-blank text arrives, because it may merge with whitespace at the start
+    of the next piece; whatever is still held at the end is dropped, as
+    ``strip`` would.
+    """
+
+    def __init__(self, *, started: bool = False, pending: str = "") -> None:
+        self.started = started
+        self.pending = pending
+
+    def feed(self, text: str) -> str:
+        buffer = self.pending + text
+        tail = _TRAILING_WHITESPACE.search(buffer)
+        cut = tail.start() if tail else len(buffer)
+        self.pending = buffer[cut:]
+        body = buffer[:cut]
+        if not body:
+            return ""
+        cleaned = _SPACES.sub(" ", _BLANK_LINES.sub("\n\n", body))
+        if not self.started:
+            cleaned = cleaned.lstrip()
+            self.started = True
+        return cleaned
+
+
+class PageCursor(BaseModel):
+    """Progress of an interrupted extraction, valid only for the same source file."""
+
+    source_size: int
+    source_mtime_ns: int
+    next_page: int = 0
+    written_bytes: int = 0
+    started: bool = False
+    pending: str = ""
+
+
+def stream_pages_to_file(
+    source: Path,
+    dest: Path,
+    pages_from: Callable[[int], Iterator[str]],
+) -> int:
+    """Clean page texts into ``dest`` one page at a time, resumably.
+
+    ``pages_from(start)`` yields the text of every page from index ``start``
+    on. Output goes to ``<dest>.partial`` and a cursor is saved after each
+    page, so a crash resumes at the first unwritten page of the same source
+    file. ``dest`` only appears once every page is written. Returns the page
+    count.
+    """
+    partial = dest.with_name(dest.name + _PARTIAL_SUFFIX)
+    cursor_path = dest.with_name(dest.name + _CURSOR_SUFFIX)
+    stat = source.stat()
+    cursor = _load_cursor(cursor_path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    if cursor.next_page:
+        logger.info("Resuming %s at page %d", source.name, cursor.next_page + 1)
+
+    cleaner = StreamingTextCleaner(started=cursor.started, pending=cursor.pending)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    mode = "r+b" if cursor.next_page and partial.exists() else "wb"
+    with open(partial, mode) as out:
+        out.truncate(cursor.written_bytes)
+        out.seek(cursor.written_bytes)
+        for page_text in pages_from(cursor.next_page):
+            separator = _PAGE_SEPARATOR if cursor.next_page else ""
+            out.write(cleaner.feed(separator + page_text).encode("utf-8"))
+            out.flush()
+            cursor.next_page += 1
+            cursor.written_bytes = out.tell()
+            cursor.started, cursor.pending = cleaner.started, cleaner.pending
+            _save_cursor(cursor_path, cursor)
+
+    os.replace(partial, dest)
+    cursor_path.unlink(missing_ok=True)
+    return cursor.next_page
+
+
+def extract_pdf_pages(
+    pdf_path: Path,
+    dest: Path,
+    *,
+    page_text: Callable[[Any], str],
+) -> int:
+    """Stream a PDF's cleaned text into ``dest``; ``page_text`` turns a page into text."""
+    try:
+        import fitz
+    except ImportError as e:
+        raise FileProcessingError("PyMuPDF is required to extract PDF text") from e
+
+    with fitz.open(str(pdf_path)) as doc:
+        def pages_from(start: int) -> Iterator[str]:
+            for number in range(start, doc.page_count):
+                yield page_text(doc.load_page(number))
+
+        return stream_pages_to_file(pdf_path, dest, pages_from)
+
+
+def _load_cursor(path: Path, *, size: int, mtime_ns: int) -> PageCursor:
+    fresh = PageCursor(source_size=size, source_mtime_ns=mtime_ns)
+    if not path.exists():
+        return fresh
+    try:
+        cursor = PageCursor.model_validate_json(path.read_text(encoding="utf-8"))
+    except (OSError, ValidationError) as e:
+        logger.warning("Ignoring unreadable page cursor %s: %s", path, e)
+        return fresh
+    if (cursor.source_size, cursor.source_mtime_ns) != (size, mtime_ns):
+        logger.info("Source changed since %s was written, starting over", path.name)
+        return fresh
+    return cursor
+
+
+def _save_cursor(path: Path, cursor: PageCursor) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(cursor.model_dump_json(), encoding="utf-8")
+    os.replace(tmp, path)
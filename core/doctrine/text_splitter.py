@@ -1,19 +1,168 @@
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from pathlib import Path
+
 from tiktoken import get_encoding
 
-from core.domain.constants import DEFAULT_CHUNK_SIZE
+from core.domain.constants import DEFAULT_CHUNK_SIZE, DEFAULT_SPLIT_BOUNDARY_TOLERANCE
+
+logger = logging.getLogger(__name__)
 
 _ENCODING = None
 
+_BOUNDARY_PATTERN = re.compile(r"\n\s*\n|(?<=[.!?])\s+")
+_READ_CHARS = 1 << 16
+# Sentences encoded per tiktoken batch call; segments closed within a batch are decoded together.
+_ENCODE_BATCH_UNITS = 256
+_MAX_CHARS_PER_TOKEN = 8
+_APPROXIMATE_TOKEN_PATTERN = re.compile(r"\s*\w{1,4}|\s*[^\w\s]|\s+")
+
+
+class ApproximateEncoding:
+    """Offline stand-in for a tiktoken encoding.
+
+    Tokens are text pieces: a run of up to four word characters or one
+    punctuation mark, each with its leading whitespace, which lands near
+    cl100k_base counts on prose and errs high on symbol-heavy text. ``decode`` joins pieces back,
+    so splitting and truncation stay lossless.
+    """
+
+    def encode(self, text: str) -> list[str]:
+        return _APPROXIMATE_TOKEN_PATTERN.findall(text)
+
+    def encode_ordinary(self, text: str) -> list[str]:
+        return self.encode(text)
+
+    def encode_ordinary_batch(self, texts: Sequence[str], *, num_threads: int = 8) -> list[list[str]]:
+        return [self.encode(text) for text in texts]
+
+    def decode(self, tokens: list[str]) -> str:
+        return "".join(tokens)
+
+    def decode_batch(self, batch: Sequence[list[str]], *, num_threads: int = 8) -> list[str]:
+        return [self.decode(tokens) for tokens in batch]
+
+
+def use_encoding(encoding) -> None:
+    """Replace the token encoding, e.g. with ``ApproximateEncoding`` in offline runs."""
+    global _ENCODING
+    _ENCODING = encoding
+
 
 def _get_encoding():
     global _ENCODING
     if _ENCODING is None:
-        _ENCODING = get_encoding("cl100k_base")
+        try:
+            _ENCODING = get_encoding("cl100k_base")
+        except Exception as e:
+            # tiktoken downloads the BPE ranks on first use; without network fall back.
+            logger.warning("cl100k_base encoding unavailable (%s), approximating token counts", e)
+            _ENCODING = ApproximateEncoding()
     return _ENCODING
 
 
-def split_text(text: str, *, max_tokens: int = DEFAULT_CHUNK_SIZE) -> list[str]:
+def split_text(
+    text: str,
+    *,
+    max_tokens: int = DEFAULT_CHUNK_SIZE,
+    overlap_tokens: int = 0,
+) -> list[str]:
+    return list(iter_segments(text, max_tokens=max_tokens, overlap_tokens=overlap_tokens))
+
+
+def split_file(
+    path: Path,
+    *,
+    max_tokens: int = DEFAULT_CHUNK_SIZE,
+    overlap_tokens: int = 0,
+) -> Iterator[str]:
+    """Stream segments from a text file without loading it whole."""
+    with path.open(encoding="utf-8") as f:
+        blocks = iter(lambda: f.read(_READ_CHARS), "")
+        yield from iter_segments(blocks, max_tokens=max_tokens, overlap_tokens=overlap_tokens)
+
+
+def iter_segments(
+    source: str | Iterable[str],
+    *,
+    max_tokens: int = DEFAULT_CHUNK_SIZE,
+    overlap_tokens: int = 0,
+    boundary_tolerance: float = DEFAULT_SPLIT_BOUNDARY_TOLERANCE,
+) -> Iterator[str]:
+    """Yield segments of at most ``max_tokens`` tokens, encoding sentences in batches.
+
+    A segment is closed at the last sentence or paragraph boundary once it
+    is within ``boundary_tolerance`` (a fraction of ``max_tokens``) of full;
+    a sentence that would leave it shorter than that is cut at the token
+    limit instead. Each segment after the first starts with the last
+    ``overlap_tokens`` tokens of the previous one. Sentences go through
+    tiktoken's ``encode_ordinary_batch`` and the segments they close through
+    ``decode_batch``, so memory is bounded by one batch of sentences plus
+    one read block, whatever the input size.
+    """
+    if not 0 <= overlap_tokens < max_tokens:
+        msg = f"overlap_tokens must be in [0, {max_tokens}), got {overlap_tokens}"
+        raise ValueError(msg)
+
+    enc = _get_encoding()
+    min_fill = max_tokens - int(max_tokens * boundary_tolerance)
+    blocks = _blocks(source) if isinstance(source, str) else source
+    units = _iter_units(blocks, max_chars=max_tokens * _MAX_CHARS_PER_TOKEN)
+    current: list = []
+    fresh = 0
+
+    while batch := list(islice(units, _ENCODE_BATCH_UNITS)):
+        closed: list[list] = []
+        for tokens in enc.encode_ordinary_batch(batch):
+            while len(current) + len(tokens) > max_tokens:
+                if not fresh or len(current) < min_fill:
+                    room = max_tokens - len(current)
+                    current.extend(tokens[:room])
+                    tokens = tokens[room:]
+                closed.append(current)
+                current = current[-overlap_tokens:] if overlap_tokens else []
+                fresh = 0
+            current.extend(tokens)
+            fresh += len(tokens)
+        yield from enc.decode_batch(closed)
+
+    if fresh:
+        yield enc.decode(current)
+
+
+def count_tokens(text: str) -> int:
+    return len(_get_encoding().encode(text))
+
+
+def truncate_tokens(text: str, *, max_tokens: int) -> str:
     enc = _get_encoding()
     tokens = enc.encode(text)
-    token_chunks = [tokens[i : i + max_tokens] for i in range(0, len(tokens), max_tokens)]
-    return [enc.decode(chunk) for chunk in token_chunks]
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[:max_tokens])
+
+
+def _blocks(text: str) -> Iterator[str]:
+    for start in range(0, len(text), _READ_CHARS):
+        yield text[start:start + _READ_CHARS]
+
+
+def _iter_units(blocks: Iterable[str], *, max_chars: int) -> Iterator[str]:
+    """Split a stream of text blocks into sentences and paragraphs, trailing whitespace kept."""
+    buffer = ""
+    for block in blocks:
+        buffer += block
+        start = 0
+        for match in _BOUNDARY_PATTERN.finditer(buffer):
+            yield buffer[start:match.end()]
+            start = match.end()
+        buffer = buffer[start:]
+        while len(buffer) > max_chars:
+            yield buffer[:max_chars]
+            buffer = buffer[max_chars:]
+    if buffer:
+        yield buffer
@@ -1,5 +1,5 @@
-from .ports import DoctrineAgentPort, EvidenceRetrievalPort
-from .forecaster import generate_forecast
+from .ports import DoctrineAgentPort, DoctrinePassagePort, EvidenceRetrievalPort
+from .forecaster import generate_forecast, generate_forecasts
 from .doctrine_council import run_doctrine_council
 from .question_generator import generate_strategic_questions
 from .scenario_generator import generate_scenarios
@@ -7,8 +7,10 @@ from .scenario_monitor import update_scenario_weights, check_scenario_alerts
 
 __all__ = [
     "DoctrineAgentPort",
+    "DoctrinePassagePort",
     "EvidenceRetrievalPort",
     "generate_forecast",
+    "generate_forecasts",
     "run_doctrine_council",
     "generate_strategic_questions",
     "generate_scenarios",
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 
-from core.domain.agents.ports import DoctrineAgentPort
+from core.domain.agents.ports import DoctrineAgentPort, DoctrinePassagePort
 from core.domain.forecast_models import Evidence
 
 logger = logging.getLogger(__name__)
@@ -25,8 +25,10 @@ def run_doctrine_council(
     questions: list[str],
     evidence: list[Evidence],
     agents: list[DoctrineAgentPort],
+    *,
+    passage_port: DoctrinePassagePort | None = None,
 ) -> CouncilResult:
-    analyses = _collect_analyses(questions, evidence, agents)
+    analyses = _collect_analyses(questions, evidence, agents, passage_port=passage_port)
     synthesis = _synthesize(analyses)
     return CouncilResult(analyses=analyses, synthesis=synthesis)
 
@@ -35,12 +37,21 @@ def _collect_analyses(
     questions: list[str],
     evidence: list[Evidence],
     agents: list[DoctrineAgentPort],
+    *,
+    passage_port: DoctrinePassagePort | None,
 ) -> list[CouncilAnalysis]:
     combined_question = "\n".join(f"- {q}" for q in questions)
+    passages = _retrieve_passages(combined_question, agents, passage_port)
     results: list[CouncilAnalysis] = []
     for agent in agents:
         try:
-            response = agent.analyze(combined_question, evidence)
+            # A doctrine with no hits in the shared pass retrieves on its own.
+            agent_passages = passages.get(agent.doctrine_id) if passages else None
+            response = agent.analyze(
+                combined_question,
+                evidence,
+                passages=agent_passages or None,
+            )
             results.append(CouncilAnalysis(
                 agent_id=agent.doctrine_id,
                 response=response,
@@ -54,6 +65,26 @@ def _collect_analyses(
     return results
 
 
+def _retrieve_passages(
+    question: str,
+    agents: list[DoctrineAgentPort],
+    passage_port: DoctrinePassagePort | None,
+) -> dict[str, list[Evidence]] | None:
+    if passage_port is None or not agents:
+        return None
+    try:
+        return passage_port.retrieve_by_doctrine(
+            question,
+            doctrine_ids=[a.doctrine_id for a in agents],
+        )
+    except Exception:
+        logger.warning(
+            "Council passage retrieval failed, agents will retrieve individually",
+            exc_info=True,
+        )
+        return None
+
+
 def _synthesize(analyses: list[CouncilAnalysis]) -> str:
     if not analyses:
         return "No doctrine agent responses available."
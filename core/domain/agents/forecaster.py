@@ -5,12 +5,22 @@ import uuid
 from datetime import UTC, date, datetime
 
 from core.domain.agents.doctrine_council import CouncilResult, run_doctrine_council
-from core.domain.agents.ports import DoctrineAgentPort, EvidenceRetrievalPort
+from core.domain.agents.ports import (
+    DoctrineAgentPort,
+    DoctrinePassagePort,
+    EvidenceRetrievalPort,
+)
 from core.domain.agents.question_generator import generate_strategic_questions
-from core.domain.constants import DoctrineDomain, ForecastStatus
+from core.domain.constants import (
+    SYNTHESIS_SECTION_TOKENS,
+    DoctrineDomain,
+    ForecastStatus,
+    PromptPriority,
+)
 from core.domain.exceptions import ForecastError
 from core.domain.forecast_models import Evidence, Forecast
 from core.llm.ports import LLMClientPort
+from core.prompts.prompt_budget import PromptSection, assemble_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +34,58 @@ def generate_forecast(
     evidence_port: EvidenceRetrievalPort,
     doctrine_agents: list[DoctrineAgentPort],
     base_rate: float | None = None,
+    passage_port: DoctrinePassagePort | None = None,
 ) -> Forecast:
     evidence = _retrieve_evidence(event, evidence_port)
+    return _forecast_from_evidence(
+        event, evidence,
+        horizon=horizon, domain=domain, llm=llm,
+        doctrine_agents=doctrine_agents, base_rate=base_rate,
+        passage_port=passage_port,
+    )
+
+
+def generate_forecasts(
+    events: list[str],
+    *,
+    horizon: date,
+    domain: DoctrineDomain,
+    llm: LLMClientPort,
+    evidence_port: EvidenceRetrievalPort,
+    doctrine_agents: list[DoctrineAgentPort],
+    passage_port: DoctrinePassagePort | None = None,
+) -> list[Forecast]:
+    """Forecast a batch of events, retrieving evidence for all of them in one pass."""
+    evidence_per_event = _retrieve_evidence_many(events, evidence_port)
+    forecasts: list[Forecast] = []
+    for event, evidence in zip(events, evidence_per_event):
+        try:
+            forecasts.append(_forecast_from_evidence(
+                event, evidence,
+                horizon=horizon, domain=domain, llm=llm,
+                doctrine_agents=doctrine_agents, base_rate=None,
+                passage_port=passage_port,
+            ))
+        except ForecastError as e:
+            logger.warning("Skipping forecast for %r: %s", event, e)
+    return forecasts
+
+
+def _forecast_from_evidence(
+    event: str,
+    evidence: list[Evidence],
+    *,
+    horizon: date,
+    domain: DoctrineDomain,
+    llm: LLMClientPort,
+    doctrine_agents: list[DoctrineAgentPort],
+    base_rate: float | None,
+    passage_port: DoctrinePassagePort | None,
+) -> Forecast:
     questions = _generate_questions(event, evidence, llm)
-    council = _run_council(questions, evidence, doctrine_agents)
+    council = _run_council(
+        questions, evidence, doctrine_agents, passage_port=passage_port,
+    )
     probability = _estimate_probability(
         event, council, llm, base_rate=base_rate,
     )
@@ -49,6 +107,17 @@ def _retrieve_evidence(
         return []
 
 
+def _retrieve_evidence_many(
+    events: list[str],
+    port: EvidenceRetrievalPort,
+) -> list[list[Evidence]]:
+    try:
+        return port.retrieve_many(events, top_k=10)
+    except Exception as e:
+        logger.warning("Batched evidence retrieval failed: %s", e)
+        return [[] for _ in events]
+
+
 def _generate_questions(
     event: str,
     evidence: list[Evidence],
@@ -63,8 +132,12 @@ def _run_council(
     questions: list[str],
     evidence: list[Evidence],
     agents: list[DoctrineAgentPort],
+    *,
+    passage_port: DoctrinePassagePort | None,
 ) -> CouncilResult:
-    return run_doctrine_council(questions, evidence, agents)
+    return run_doctrine_council(
+        questions, evidence, agents, passage_port=passage_port,
+    )
 
 
 def _estimate_probability(
@@ -88,16 +161,23 @@ def _build_probability_prompt(
         f"The reference-class base rate is {base_rate:.0%}.\n"
         if base_rate is not None else ""
     )
-    return (
+    return assemble_prompt([
         "You are a calibrated probabilistic forecaster trained in "
         "superforecasting methodology.\n\n"
         f"Event: {event}\n\n"
         f"{base_rate_str}"
-        f"Doctrine council analysis:\n{council.synthesis}\n\n"
+        "Doctrine council analysis:\n",
+        PromptSection(
+            name="synthesis",
+            items=council.synthesis.split("\n"),
+            max_tokens=SYNTHESIS_SECTION_TOKENS,
+            priority=PromptPriority.HIGH,
+        ),
+        "\n\n"
         "Provide your probability estimate as a single decimal (0.00-1.00). "
         "Think step by step: outside view first, then inside view adjustments. "
-        "Respond with ONLY the number."
-    )
+        "Respond with ONLY the number.",
+    ])
 
 
 def _parse_probability(raw: str) -> float:
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 from typing import Protocol
 
+from core.domain.constants import DEFAULT_SIMILARITY_TOP_K
 from core.domain.forecast_models import Evidence
 
 
 class DoctrineAgentPort(Protocol):
-    def analyze(self, question: str, evidence: list[Evidence]) -> str: ...
+    def analyze(
+        self,
+        question: str,
+        evidence: list[Evidence],
+        *,
+        passages: list[Evidence] | None = None,
+    ) -> str: ...
 
     @property
     def doctrine_id(self) -> str: ...
@@ -14,3 +21,20 @@ class DoctrineAgentPort(Protocol):
 
 class EvidenceRetrievalPort(Protocol):
     def retrieve(self, query: str, *, top_k: int = 10) -> list[Evidence]: ...
+
+    def retrieve_many(
+        self,
+        queries: list[str],
+        *,
+        top_k: int = 10,
+    ) -> list[list[Evidence]]: ...
+
+
+class DoctrinePassagePort(Protocol):
+    def retrieve_by_doctrine(
+        self,
+        query: str,
+        *,
+        doctrine_ids: list[str],
+        top_k: int = DEFAULT_SIMILARITY_TOP_K,
+    ) -> dict[str, list[Evidence]]: ...
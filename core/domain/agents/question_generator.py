@@ -3,7 +3,9 @@ from __future__ import annotations
 import logging
 
 from core.domain.agents.ports import DoctrineAgentPort, EvidenceRetrievalPort
+from core.domain.constants import EVIDENCE_SECTION_TOKENS
 from core.domain.forecast_models import Evidence
+from core.prompts.prompt_budget import PromptSection, assemble_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -15,30 +17,35 @@ def generate_strategic_questions(
     llm_call: callable,
     max_questions: int = 10,
 ) -> list[str]:
-    evidence_text = _format_evidence(evidence)
-    prompt = _build_question_prompt(event, evidence_text, max_questions)
+    prompt = _build_question_prompt(event, evidence, max_questions)
     raw = llm_call(prompt)
     return _parse_questions(raw)
 
 
-def _format_evidence(evidence: list[Evidence]) -> str:
-    lines = [f"- {e.snippet} (source: {e.source})" for e in evidence[:10]]
-    return "\n".join(lines) if lines else "No evidence available."
+def _evidence_section(evidence: list[Evidence]) -> PromptSection:
+    return PromptSection(
+        name="evidence",
+        items=[f"- {e.snippet} (source: {e.source})" for e in evidence[:10]],
+        max_tokens=EVIDENCE_SECTION_TOKENS,
+        fallback="No evidence available.",
+    )
 
 
 def _build_question_prompt(
     event: str,
-    evidence_text: str,
+    evidence: list[Evidence],
     max_questions: int,
 ) -> str:
-    return (
+    return assemble_prompt([
         f"You are analyzing whether: {event}\n\n"
-        f"Evidence:\n{evidence_text}\n\n"
+        "Evidence:\n",
+        _evidence_section(evidence),
+        "\n\n"
         f"Generate {max_questions} decisive strategic questions that must be answered "
         "to forecast this event. Focus on: base rates, key actors' incentives, "
         "capability vs intent, historical analogues, and disconfirming evidence.\n"
-        "Return one question per line, numbered."
-    )
+        "Return one question per line, numbered.",
+    ])
 
 
 def _parse_questions(raw: str) -> list[str]:
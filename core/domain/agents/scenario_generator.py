@@ -5,9 +5,10 @@ import uuid
 from datetime import UTC, datetime
 
 from core.domain.agents.ports import DoctrineAgentPort
-from core.domain.constants import DoctrineDomain, ScenarioStatus
+from core.domain.constants import EVIDENCE_SECTION_TOKENS, DoctrineDomain, ScenarioStatus
 from core.domain.forecast_models import Evidence, Scenario, Signpost
 from core.llm.ports import LLMClientPort
+from core.prompts.prompt_budget import PromptSection, assemble_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -32,14 +33,18 @@ def _build_scenario_prompt(
     evidence: list[Evidence],
     num_scenarios: int,
 ) -> str:
-    evidence_str = "\n".join(
-        f"- {e.snippet}" for e in evidence[:8]
-    ) or "No evidence provided."
-    return (
+    return assemble_prompt([
         "You are a strategic scenario planner using Shell International's "
         "methodology.\n\n"
         f"Topic: {topic}\n\n"
-        f"Evidence:\n{evidence_str}\n\n"
+        "Evidence:\n",
+        PromptSection(
+            name="evidence",
+            items=[f"- {e.snippet}" for e in evidence[:8]],
+            max_tokens=EVIDENCE_SECTION_TOKENS,
+            fallback="No evidence provided.",
+        ),
+        "\n\n"
         f"Generate {num_scenarios} plausible future scenarios. "
         "For each scenario provide:\n"
         "1. Title (one line)\n"
@@ -47,8 +52,8 @@ def _build_scenario_prompt(
         "3. Probability weight (0.0-1.0, should roughly sum to 1)\n"
         "4. Key assumptions (2-3 bullet points)\n"
         "5. Early warning signals (2-3 observable indicators)\n\n"
-        "Format each scenario clearly with headers."
-    )
+        "Format each scenario clearly with headers.",
+    ])
 
 
 def _parse_scenarios(
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Literal
 
 
@@ -7,6 +7,7 @@ class DoctrineStatus(str, Enum):
     CLEANED = "cleaned"
     CHUNKED = "chunked"
     TAGGED = "tagged"
+    INDEXED = "indexed"
 
 
 class ResponseType(str, Enum):
@@ -27,6 +28,40 @@ class ScenarioStatus(str, Enum):
     REALIZED = "realized"
 
 
+class PromptPriority(IntEnum):
+    """Sections with lower priority are trimmed first when a prompt is over budget."""
+
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+
+
+class RagContextMode(str, Enum):
+    SYNTHESIS = "synthesis"
+    RETRIEVAL = "retrieval"
+
+
+class RetrievalMode(str, Enum):
+    VECTOR = "vector"
+    KEYWORD = "keyword"
+    HYBRID = "hybrid"
+
+
+class VectorStoreBackend(str, Enum):
+    CHROMA = "chroma"
+    MMAP = "mmap"
+
+
+class IndexLayout(str, Enum):
+    SHARED = "shared"
+    PARTITIONED = "partitioned"
+
+
+class EmbeddingPrecision(str, Enum):
+    FLOAT16 = "float16"
+    INT8 = "int8"
+
+
 class DoctrineDomain(str, Enum):
     GEOPOLITICS = "geopolitics"
     ECONOMIC = "economic"
@@ -62,12 +97,46 @@ class EventCategory(str, Enum):
 
 SUPPORTED_DOC_EXTENSIONS: frozenset[str] = frozenset({".txt", ".pdf", ".html"})
 
+METADATA_KEY_DOCTRINE_SLUG: str = "doctrine_slug"
+METADATA_KEY_SOURCE_FILENAME: str = "source_filename"
+METADATA_KEY_PART_INDEX: str = "part_index"
+
 DEFAULT_MAX_TOKENS: int = 3000
 DEFAULT_TEMPERATURE: float = 0.3
 DEFAULT_CHUNK_SIZE: int = 1000
 DEFAULT_CHUNK_MAX_WORDS: int = 500
+DEFAULT_SPLIT_BOUNDARY_TOLERANCE: float = 0.2
+DEFAULT_OCR_DPI: int = 72
 ANTHROPIC_API_VERSION: str = "2023-06-01"
 CONTENT_TYPE_JSON: str = "application/json"
 
 DEFAULT_SIMILARITY_TOP_K: int = 5
 DEFAULT_RAG_RESPONSE_MODE: str = "compact"
+DEFAULT_RAG_CONTEXT_MODE: RagContextMode = RagContextMode.SYNTHESIS
+DEFAULT_RAG_PASSAGE_MAX_CHARS: int = 800
+DEFAULT_EVIDENCE_CACHE_SIZE: int = 512
+DEFAULT_EVIDENCE_CACHE_TTL_SECONDS: float = 3600.0
+DEFAULT_RETRIEVAL_MODE: RetrievalMode = RetrievalMode.VECTOR
+HYBRID_CANDIDATE_MULTIPLIER: int = 2
+DEFAULT_EVIDENCE_DIVERSITY: float = 0.3
+DIVERSITY_CANDIDATE_MULTIPLIER: int = 2
+NEAR_DUPLICATE_THRESHOLD: float = 0.8
+
+DEFAULT_PROMPT_TOKEN_BUDGET: int = 6000
+EVIDENCE_SECTION_TOKENS: int = 1500
+PRINCIPLES_SECTION_TOKENS: int = 500
+RAG_PASSAGES_SECTION_TOKENS: int = 2500
+SYNTHESIS_SECTION_TOKENS: int = 3000
+
+DEFAULT_WATCHER_DEBOUNCE_SECONDS: float = 2.0
+DEFAULT_WATCHER_WORKERS: int = 2
+DEFAULT_PIPELINE_STAGE_CONCURRENCY: dict[DoctrineStatus, int] = {
+    DoctrineStatus.RAW_COLLECTED: 2,
+    DoctrineStatus.CLEANED: 2,
+    DoctrineStatus.CHUNKED: 1,
+    DoctrineStatus.TAGGED: 2,
+    DoctrineStatus.INDEXED: 1,
+}
+DEFAULT_SUPERVISOR_CHECK_SECONDS: float = 5.0
+WORKER_THROUGHPUT_WINDOW_SECONDS: float = 60.0
+LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (0.1, 0.5, 1.0, 5.0, 30.0, 120.0, 600.0)
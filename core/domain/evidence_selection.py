@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import re
+
+from core.domain.constants import NEAR_DUPLICATE_THRESHOLD
+from core.domain.forecast_models import Evidence
+
+_WORD_PATTERN = re.compile(r"\w+")
+_SHINGLE_SIZE = 3
+
+
+def select_diverse_evidence(
+    evidence: list[Evidence],
+    *,
+    top_k: int,
+    diversity: float,
+    duplicate_threshold: float = NEAR_DUPLICATE_THRESHOLD,
+) -> list[Evidence]:
+    """Pick ``top_k`` items by maximal marginal relevance over snippet shingles.
+
+    ``diversity`` trades relevance (0.0) against novelty (1.0); snippets at
+    least ``duplicate_threshold`` similar to an already picked one are dropped
+    outright. A diversity of 0 keeps the incoming relevance order.
+    """
+    if diversity <= 0.0:
+        return evidence[:top_k]
+
+    shingles = [_shingles(e.snippet) for e in evidence]
+    redundancy = [0.0] * len(evidence)
+    remaining = set(range(len(evidence)))
+    selected: list[int] = []
+    while remaining and len(selected) < top_k:
+        best = max(
+            sorted(remaining),
+            key=lambda i: _mmr_score(evidence[i], redundancy[i], diversity=diversity),
+        )
+        selected.append(best)
+        remaining.discard(best)
+        for i in list(remaining):
+            redundancy[i] = max(redundancy[i], _overlap(shingles[i], shingles[best]))
+            if redundancy[i] >= duplicate_threshold:
+                remaining.discard(i)
+    return [evidence[i] for i in selected]
+
+
+def _mmr_score(item: Evidence, redundancy: float, *, diversity: float) -> float:
+    return (1.0 - diversity) * item.relevance_score - diversity * redundancy
+
+
+def _shingles(text: str) -> frozenset[tuple[str, ...]]:
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < _SHINGLE_SIZE:
+        return frozenset([tuple(words)])
+    return frozenset(
+        tuple(words[i:i + _SHINGLE_SIZE])
+        for i in range(len(words) - _SHINGLE_SIZE + 1)
+    )
+
+
+def _overlap(a: frozenset, b: frozenset) -> float:
+    """Overlap coefficient, so a snippet contained in a longer one scores 1.0."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / min(len(a), len(b))
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+
+
+class KeywordMatcher:
+    """Finds every category whose keywords occur as substrings of a text.
+
+    All keywords are compiled once into a single trie-shaped regex inside a
+    lookahead, so one C-level scan reports the longest keyword starting at
+    each position, overlaps included. Every shorter keyword that also
+    matches there is a prefix of that one, so each keyword maps to its own
+    categories plus those of its prefixes. Matching is case-insensitive and
+    categories come back in the order of the keyword mapping.
+    """
+
+    def __init__(self, keywords: Mapping[str, Iterable[str]]) -> None:
+        self._order = {category: idx for idx, category in enumerate(keywords)}
+        owners: dict[str, set[str]] = {}
+        for category, words in keywords.items():
+            for word in words:
+                if word:
+                    owners.setdefault(word.lower(), set()).add(category)
+        self._categories = {
+            word: self._sorted(
+                set().union(*(owners[word[:end]] for end in range(1, len(word) + 1) if word[:end] in owners))
+            )
+            for word in owners
+        }
+        self._pattern = (
+            re.compile(f"(?=({_trie_pattern(_build_trie(owners))}))") if owners else None
+        )
+
+    def match(self, text: str) -> list[str]:
+        if self._pattern is None:
+            return []
+        found: set[str] = set()
+        for m in self._pattern.finditer(text.lower()):
+            found.update(self._categories[m.group(1)])
+        return self._sorted(found)
+
+    def _sorted(self, categories: set[str]) -> list[str]:
+        return sorted(categories, key=self._order.__getitem__)
+
+
+def _build_trie(words: Iterable[str]) -> dict:
+    root: dict = {}
+    for word in words:
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return root
+
+
+def _trie_pattern(node: dict) -> str:
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    return f"(?:{body})?" if "" in node else body
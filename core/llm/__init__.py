@@ -1,11 +1,12 @@
 from .ports import LLMClientPort
-from .json_extraction import extract_json_array
+from .json_extraction import extract_json_array, iter_json_objects
 from .enums.llm_provider import LLMProvider
 from .enums.llm_model import LLMModel
 
 __all__ = [
     "LLMClientPort",
     "extract_json_array",
+    "iter_json_objects",
     "LLMProvider",
     "LLMModel",
 ]
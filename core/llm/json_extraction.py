@@ -1,11 +1,10 @@
 import json
 import logging
-import re
+from collections.abc import Iterable, Iterator
 
-logger = logging.getLogger(__name__)
+from core.llm.json_repair import JsonObjectScanner, scan_json_objects
 
-_JSON_ARRAY_PATTERN = re.compile(r"(\[\s*{.*?}\s*\])", re.DOTALL)
-_CODE_BLOCK_PATTERN = re.compile(r"```json(.*?)```", re.DOTALL)
+logger = logging.getLogger(__name__)
 
 
 def extract_json_array(text: str) -> list[dict] | None:
@@ -13,37 +12,42 @@ def extract_json_array(text: str) -> list[dict] | None:
     if result is not None:
         return result
 
-    result = _try_code_block(text)
-    if result is not None:
-        return result
+    objects, stats = scan_json_objects(text)
+    if stats.repairs or stats.failed:
+        logger.debug("Repaired JSON in LLM output: %s", stats)
+    return _unwrap(objects) or None
 
-    return _try_json5_fallback(text)
 
+def iter_json_objects(chunks: Iterable[str]) -> Iterator[dict]:
+    """Yield each top-level object of a streamed response as soon as it closes.
 
-def _try_strict_json(text: str) -> list[dict] | None:
-    try:
-        match = _JSON_ARRAY_PATTERN.search(text)
-        if match:
-            return json.loads(match.group(1))
-    except json.JSONDecodeError:
-        pass
-    return None
+    Objects inside a top-level array are yielded one by one, so callers can
+    start on the first chunk while the model is still generating the rest.
+    A response cut off mid-object yields the repaired remainder at the end.
+    """
+    scanner = JsonObjectScanner()
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.close()
+    if scanner.stats.repairs or scanner.stats.failed:
+        logger.debug("Repaired JSON in streamed LLM output: %s", scanner.stats)
 
 
-def _try_code_block(text: str) -> list[dict] | None:
+def _try_strict_json(text: str) -> list[dict] | None:
+    stripped = text.strip()
+    if not stripped.startswith("["):
+        return None
     try:
-        match = _CODE_BLOCK_PATTERN.search(text)
-        if match:
-            return json.loads(match.group(1).strip())
+        parsed = json.loads(stripped)
     except json.JSONDecodeError:
-        pass
-    return None
+        return None
+    return parsed if isinstance(parsed, list) else None
 
 
-def _try_json5_fallback(text: str) -> list[dict] | None:
-    try:
-        import json5
-        return json5.loads(text)
-    except Exception:
-        logger.debug("json5 fallback failed for text: %.100s...", text)
-        return None
+def _unwrap(objects: list[dict]) -> list[dict]:
+    """Unwrap a single ``{"<key>": [{...}, ...]}`` envelope around the array."""
+    if len(objects) == 1 and isinstance(objects[0], dict) and len(objects[0]) == 1:
+        (value,) = objects[0].values()
+        if isinstance(value, list) and all(isinstance(v, dict) for v in value):
+            return value
+    return objects
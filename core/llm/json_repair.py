@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+from dataclasses import dataclass, fields
+
+logger = logging.getLogger(__name__)
+
+_OBJECT = "{"
+_ARRAY = "["
+_CLOSERS = {"}": _OBJECT, "]": _ARRAY}
+_CLOSER_FOR = {_OBJECT: "}", _ARRAY: "]"}
+
+# Frame states: what the scanner expects next inside the open container.
+_KEY = 0
+_COLON = 1
+_VALUE = 2
+_NEXT = 3
+
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-+.")
+_WHITESPACE = frozenset(" \t\r\n")
+_JSON_LITERALS = frozenset({"true", "false", "null"})
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_VALID_ESCAPES = frozenset('"\\/bfnrtu')
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+_NUMBER_PATTERN = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_STRING_SPECIALS = {
+    '"': re.compile(r'["\\\x00-\x1f]'),
+    "'": re.compile(r'[\'"\\\x00-\x1f]'),
+}
+
+
+@dataclass
+class RepairStats:
+    objects: int = 0
+    trailing_commas: int = 0
+    missing_separators: int = 0
+    unquoted_keys: int = 0
+    single_quoted_strings: int = 0
+    bare_literals: int = 0
+    string_escapes: int = 0
+    unbalanced: int = 0
+    truncated: int = 0
+    failed: int = 0
+
+    @property
+    def repairs(self) -> int:
+        return sum(
+            getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in ("objects", "failed")
+        )
+
+
+class JsonObjectScanner:
+    """Single-pass, tolerant scanner for JSON objects embedded in LLM output.
+
+    Text is fed in pieces of any size. Every top-level ``{...}`` is rewritten
+    into strict JSON as it is read, and returned from ``feed`` as soon as its
+    closing brace arrives. Prose, code fences and any enclosing array are
+    skipped. Repairs made on the fly: trailing and missing commas, unquoted
+    keys, single-quoted strings, Python literals, raw control characters in
+    strings and mismatched closers. ``close`` completes an object cut off by
+    a truncated response. Each input character is visited once.
+    """
+
+    def __init__(self) -> None:
+        self.stats = RepairStats()
+        self._out: list[str] = []
+        self._stack: list[list] = []
+        self._quote: str | None = None
+        self._escape = False
+        self._word: list[str] = []
+        self._pending_comma = False
+        self._done: list[dict] = []
+
+    def feed(self, text: str) -> list[dict]:
+        i, n = 0, len(text)
+        while i < n:
+            if self._quote:
+                i = self._consume_string(text, i)
+                continue
+            ch = text[i]
+            i += 1
+            if self._word:
+                if ch in _WORD_CHARS:
+                    self._word.append(ch)
+                    continue
+                self._finish_word()
+            if not self._stack:
+                if ch == "{":
+                    self._out.append(ch)
+                    self._stack.append([_OBJECT, _KEY])
+                continue
+            self._consume_char(ch)
+        return self._take_done()
+
+    def close(self) -> list[dict]:
+        """Finish a truncated object, if one is open, and return it."""
+        if not self._stack:
+            return self._take_done()
+        self.stats.truncated += 1
+        if self._quote:
+            self._escape = False
+            self._out.append('"')
+            self._quote = None
+            self._after_token()
+        if self._word:
+            self._finish_word()
+        self._pending_comma = False
+        while self._stack:
+            self._pop()
+        return self._take_done()
+
+    def _consume_char(self, ch: str) -> None:
+        if ch in _WHITESPACE:
+            return
+        if ch == '"' or ch == "'":
+            self._before_token()
+            if ch == "'":
+                self.stats.single_quoted_strings += 1
+            self._quote = ch
+            self._out.append('"')
+        elif ch == "{" or ch == "[":
+            self._before_token()
+            self._out.append(ch)
+            self._stack.append([ch, _KEY if ch == _OBJECT else _VALUE])
+        elif ch in _CLOSERS:
+            self._close(_CLOSERS[ch])
+        elif ch == ",":
+            frame = self._stack[-1]
+            if frame[1] == _NEXT:
+                self._pending_comma = True
+                frame[1] = _KEY if frame[0] == _OBJECT else _VALUE
+        elif ch == ":":
+            frame = self._stack[-1]
+            if frame[0] == _OBJECT and frame[1] == _COLON:
+                self._out.append(":")
+                frame[1] = _VALUE
+        elif ch in _WORD_CHARS:
+            self._before_token()
+            self._word.append(ch)
+
+    def _consume_string(self, text: str, i: int) -> int:
+        quote = self._quote
+        special = _STRING_SPECIALS[quote]
+        n = len(text)
+        while i < n:
+            if self._escape:
+                self._escape = False
+                self._out.append(self._escaped(text[i], quote))
+                i += 1
+                continue
+            match = special.search(text, i)
+            end = match.start() if match else n
+            self._out.append(text[i:end])
+            if not match:
+                return n
+            ch = text[end]
+            i = end + 1
+            if ch == "\\":
+                self._escape = True
+            elif ch == quote:
+                self._out.append('"')
+                self._quote = None
+                self._after_token()
+                return i
+            elif ch == '"':
+                self._out.append('\\"')
+            else:
+                self.stats.string_escapes += 1
+                self._out.append(_CONTROL_ESCAPES.get(ch, f"\\u{ord(ch):04x}"))
+        return i
+
+    def _escaped(self, ch: str, quote: str) -> str:
+        if quote == "'" and ch == "'":
+            return "'"
+        if ch in _VALID_ESCAPES:
+            return "\\" + ch
+        self.stats.string_escapes += 1
+        return "\\\\" + ch
+
+    def _finish_word(self) -> None:
+        word = "".join(self._word)
+        self._word.clear()
+        frame = self._stack[-1]
+        if frame[0] == _OBJECT and frame[1] == _KEY:
+            self.stats.unquoted_keys += 1
+            self._out.append(json.dumps(word))
+        elif word in _JSON_LITERALS or _NUMBER_PATTERN.fullmatch(word):
+            self._out.append(word)
+        else:
+            self.stats.bare_literals += 1
+            self._out.append(_PYTHON_LITERALS.get(word) or json.dumps(word))
+        self._after_token()
+
+    def _before_token(self) -> None:
+        frame = self._stack[-1]
+        if self._pending_comma:
+            self._out.append(",")
+            self._pending_comma = False
+        elif frame[1] == _NEXT:
+            self.stats.missing_separators += 1
+            self._out.append(",")
+            frame[1] = _KEY if frame[0] == _OBJECT else _VALUE
+        elif frame[0] == _OBJECT and frame[1] == _COLON:
+            self.stats.missing_separators += 1
+            self._out.append(":")
+            frame[1] = _VALUE
+
+    def _after_token(self) -> None:
+        frame = self._stack[-1]
+        frame[1] = _COLON if frame[0] == _OBJECT and frame[1] == _KEY else _NEXT
+
+    def _close(self, kind: str) -> None:
+        if not any(frame[0] == kind for frame in self._stack):
+            return
+        if self._pending_comma:
+            self.stats.trailing_commas += 1
+            self._pending_comma = False
+        while self._stack[-1][0] != kind:
+            self.stats.unbalanced += 1
+            self._pop()
+        self._pop()
+
+    def _pop(self) -> None:
+        kind, state = self._stack.pop()
+        if kind == _OBJECT and state == _COLON:
+            self._out.append(":null")
+        elif kind == _OBJECT and state == _VALUE:
+            self._out.append("null")
+        self._out.append(_CLOSER_FOR[kind])
+        if self._stack:
+            self._stack[-1][1] = _NEXT
+        else:
+            self._finish_object()
+
+    def _finish_object(self) -> None:
+        raw = "".join(self._out)
+        self._out.clear()
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            self.stats.failed += 1
+            logger.debug("Unrecoverable JSON object: %.100s...", raw)
+            return
+        self.stats.objects += 1
+        self._done.append(parsed)
+
+    def _take_done(self) -> list[dict]:
+        done, self._done = self._done, []
+        return done
+
+
+def scan_json_objects(text: str) -> tuple[list[dict], RepairStats]:
+    """Every top-level JSON object in ``text``, repaired, plus what was fixed."""
+    scanner = JsonObjectScanner()
+    objects = scanner.feed(text) + scanner.close()
+    return objects, scanner.stats
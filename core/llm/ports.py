@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Protocol
 
 from core.domain.models import LLMResponse
@@ -8,6 +9,12 @@ from core.domain.models import LLMResponse
 class LLMClientPort(Protocol):
     def call(self, prompt: str, system_prompt: str | None = None) -> str: ...
 
+    def call_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+    ) -> Iterator[str]: ...
+
     def call_batch(
         self,
         batch_texts: list[str],
@@ -1,3 +1,4 @@
 from .prompts import Prompts
+from .prompt_budget import PromptSection, assemble_prompt
 
-__all__ = ["Prompts"]
+__all__ = ["Prompts", "PromptSection", "assemble_prompt"]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+from core.doctrine.text_splitter import count_tokens, truncate_tokens
+from core.domain.constants import DEFAULT_PROMPT_TOKEN_BUDGET, PromptPriority
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PromptSection:
+    """A variable-length block of prompt context, rendered one item per line."""
+
+    name: str
+    items: list[str] = field(default_factory=list)
+    max_tokens: int = DEFAULT_PROMPT_TOKEN_BUDGET
+    priority: PromptPriority = PromptPriority.MEDIUM
+    fallback: str = ""
+
+
+def assemble_prompt(
+    parts: list[str | PromptSection],
+    *,
+    budget: int = DEFAULT_PROMPT_TOKEN_BUDGET,
+) -> str:
+    """Join fixed text and sections so the whole prompt fits in ``budget`` tokens.
+
+    Fixed strings are always kept. Each section is first capped at its own
+    ``max_tokens``; if the prompt is still over budget, sections are trimmed
+    lowest priority first. Trimming drops trailing items before cutting
+    into one.
+    """
+    sections = [p for p in parts if isinstance(p, PromptSection)]
+    fixed_tokens = sum(count_tokens(p) for p in parts if isinstance(p, str))
+    fitted = _fit_sections(sections, budget=max(budget - fixed_tokens, 0))
+    return "".join(
+        fitted[id(p)] if isinstance(p, PromptSection) else p
+        for p in parts
+    )
+
+
+def _fit_sections(sections: list[PromptSection], *, budget: int) -> dict[int, str]:
+    texts = {id(s): _fit_items(s.items, max_tokens=s.max_tokens) for s in sections}
+    overflow = sum(count_tokens(t) for t in texts.values()) - budget
+
+    for section in sorted(sections, key=lambda s: s.priority):
+        if overflow <= 0:
+            break
+        used = count_tokens(texts[id(section)])
+        texts[id(section)] = _fit_items(section.items, max_tokens=max(used - overflow, 0))
+        trimmed = count_tokens(texts[id(section)])
+        overflow -= used - trimmed
+        logger.debug(
+            "Trimmed prompt section '%s' from %d to %d tokens",
+            section.name, used, trimmed,
+        )
+
+    return {
+        id(s): texts[id(s)] or s.fallback
+        for s in sections
+    }
+
+
+def _fit_items(items: list[str], *, max_tokens: int) -> str:
+    kept: list[str] = []
+    used = 0
+    for item in items:
+        cost = count_tokens(item) + (1 if kept else 0)
+        if used + cost > max_tokens:
+            if not kept:
+                kept.append(truncate_tokens(item, max_tokens=max_tokens))
+            break
+        kept.append(item)
+        used += cost
+    return "\n".join(kept)
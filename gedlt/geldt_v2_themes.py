@@ -8,6 +8,7 @@ root_dir = str(Path(__file__).parent.parent)
 if root_dir not in sys.path:
     sys.path.append(root_dir)
 
+from core.domain.keyword_matcher import KeywordMatcher
 from helpers.json_file_helper import JsonFileHelper
 
 class GdeltV2Themes:
@@ -23,9 +24,10 @@ class GdeltV2Themes:
             f.write(response.text)
         print(f"Downloaded {local_filename}")
 
-    # Step 2: Load and filter themes by relevance
+    # Step 2: Load and filter themes by relevance (every matching category per theme)
     @staticmethod
     def load_and_filter_themes(filename, keywords):
+        matcher = KeywordMatcher(keywords)
         relevant_themes = []
         with open(filename, "r", encoding="utf-8") as f:
             for line in f:
@@ -35,10 +37,8 @@ class GdeltV2Themes:
                 if len(parts) != 2:
                     continue
                 theme_code = parts[0].lower()
-                for category, words in keywords.items():
-                    if any(word.lower() in theme_code for word in words):
-                        relevant_themes.append((theme_code, category))
-                        break
+                for category in matcher.match(theme_code):
+                    relevant_themes.append((theme_code, category))
         return relevant_themes
 
     # Step 3: Map themes to MASX AI categories
@@ -1,4 +1,8 @@
+import json
+import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import pandas as pd
 from langchain_core.prompts import PromptTemplate
@@ -10,14 +14,56 @@ root_dir = str(Path(__file__).parent.parent)
 if root_dir not in sys.path:
     sys.path.append(root_dir)
 
+from core.llm.json_extraction import extract_json_array
 from gedlt import GdeltV2Themes
 from helpers import JsonFileHelper
 
+logger = logging.getLogger(__name__)
+
+UNCATEGORIZED = "uncategorized"
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_CACHE_FILE = Path("gedlt/constants/masx_theme_classifications.json")
+
+_BATCH_INSTRUCTIONS = """
+Respond ONLY with JSON of the form
+{{"classifications": [{{"theme_code": "<theme code>", "category": "<category name>"}}, ...]}}
+with exactly one entry per theme code, copying each theme code unchanged.
+If you are unsure or no category fits a theme, use SKIP as its category.
+"""
+
+BATCH_PROMPT = """
+You are an expert classifier.
+Assign each GDELT theme code below to the most appropriate MASX AI category.
+Categories: {categories}
+Theme codes:
+{themes}
+""" + _BATCH_INSTRUCTIONS
+
+BATCH_PROMPT_WITH_DESCRIPTION = """
+You are an expert classifier.
+Given each GDELT theme code and its description, assign it to the most appropriate MASX AI category.
+Categories: {categories}
+Theme codes with descriptions:
+{themes}
+""" + _BATCH_INSTRUCTIONS
+
+
 class GeoDataAgent:
-    def __init__(self):
+    def __init__(
+        self,
+        batch_size=DEFAULT_BATCH_SIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        cache_file=DEFAULT_CACHE_FILE,
+    ):
         self.llm = ChatOllama(model="llama3")
+        self.batch_llm = ChatOllama(model="llama3", format="json")
         self.chain = None
+        self.batch_chains = {}
         self.known_descriptions = {}
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.cache_file = Path(cache_file)
 
     def load_known_descriptions(self, csv_file):
         df = pd.read_csv(csv_file, usecols=[0,1,2], header=0, names=['Type', 'Name', 'Description'])
@@ -59,6 +105,70 @@ class GeoDataAgent:
             result = self.chain.invoke({"theme_code": theme_code})
         return result.strip()
 
+    def init_batch_chains(self, masx_categories):
+        categories = ", ".join(masx_categories)
+        self.batch_chains = {
+            with_description: PromptTemplate(
+                input_variables=["themes"],
+                partial_variables={"categories": categories},
+                template=template,
+            ) | self.batch_llm | StrOutputParser()
+            for with_description, template in (
+                (True, BATCH_PROMPT_WITH_DESCRIPTION),
+                (False, BATCH_PROMPT),
+            )
+        }
+
+    def classify_batch(self, batch, masx_categories):
+        """Classify (theme_code, description) pairs in one prompt; returns {theme_code: category}."""
+        with_description = batch[0][1] is not None
+        if with_description:
+            lines = "\n".join(f"- {code}: {description}" for code, description in batch)
+        else:
+            lines = "\n".join(f"- {code}" for code, _ in batch)
+        response = self.batch_chains[with_description].invoke({"themes": lines})
+
+        wanted = {code for code, _ in batch}
+        classified = {}
+        for item in extract_json_array(response) or []:
+            code = str(item.get("theme_code", "")).strip().lower()
+            if code in wanted:
+                category = str(item.get("category", "")).strip()
+                classified[code] = category if category in masx_categories else UNCATEGORIZED
+        missing = len(wanted) - len(classified)
+        if missing:
+            logger.warning("LLM left %d of %d themes unclassified in a batch", missing, len(batch))
+        return classified
+
+    def classify_themes(self, theme_codes, masx_categories):
+        """Classify theme codes in concurrent batches, resuming from the classification cache.
+
+        Themes already cached for the same category list are not sent again.
+        The cache is rewritten after every finished batch, so an interrupted
+        run picks up where it stopped. Themes the LLM failed on stay out of
+        the cache and are retried on the next run.
+        """
+        cache = self._load_cache(masx_categories)
+        pending = [code for code in dict.fromkeys(theme_codes) if code not in cache]
+        logger.info("%d themes cached, %d to classify", len(theme_codes) - len(pending), len(pending))
+
+        self.init_batch_chains(masx_categories)
+        batches = self._make_batches(pending)
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            futures = {pool.submit(self.classify_batch, batch, masx_categories): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    cache.update(future.result())
+                except Exception as e:
+                    logger.error("LLM error on batch starting at %s: %s", batch[0][0], e)
+                self._save_cache(cache, masx_categories)
+                done += len(batch)
+                logger.info("Classified %d/%d themes", done, len(pending))
+
+        return [(code, cache.get(code, UNCATEGORIZED)) for code in theme_codes]
+
     def run_full_pipeline(self):
         themes = GdeltV2Themes()
         themes.download_gdelt_themes(
@@ -71,46 +181,53 @@ class GeoDataAgent:
 
         self.load_known_descriptions("gedlt/constants/GDELT-Global_Knowledge_Graph_CategoryList.csv")
 
-        relevant_themes = []
-        count = 0
+        theme_codes = []
         with open("v2_themes.txt", "r", encoding="utf-8") as f:
             for line in f:
-                count += 1
-                print(f"Processing line {count}")
-                
-                # if count > 27:
-                #      break
                 if line.strip() == "":
                     continue
                 parts = line.strip().split("\t")
                 if len(parts) != 2:
                     continue
+                theme_codes.append(parts[0].lower())
 
-                theme_code = parts[0].lower()
-                description = self.known_descriptions.get(theme_code)
-
-                self.init_chain(masx_categories, with_description=bool(description))
-
-                try:
-                    category = self.invoke_chain(theme_code, description)
-                    print(f"************     LLM - Category: {category} for theme - {theme_code}      **************")
-                    if category.upper() == "SKIP":
-                        print(f"⚠ Unknown category for {theme_code}, marking as uncategorized.")
-                        relevant_themes.append((theme_code, "uncategorized"))
-                    else:
-                        if category in masx_categories:
-                            relevant_themes.append((theme_code, category))
-                        else:
-                            print(f"⚠ Unknown category for {theme_code}, marking as uncategorized.")
-                            relevant_themes.append((theme_code, "uncategorized"))
-                except Exception as e:
-                    print(f"❌ LLM error on {theme_code}: {e}")
-                    relevant_themes.append((theme_code, "uncategorized"))
-
+        relevant_themes = self.classify_themes(theme_codes, masx_categories)
         mapped = self.map_themes_to_nested_structure(relevant_themes, masx_template)
         JsonFileHelper.write_data(mapped, "gedlt/constants/masx_theme_map.json")
         return mapped
 
+    def _make_batches(self, theme_codes):
+        # Themes with and without a description use different prompts, so they never share a batch.
+        described = [(code, self.known_descriptions[code]) for code in theme_codes if code in self.known_descriptions]
+        bare = [(code, None) for code in theme_codes if code not in self.known_descriptions]
+        return [
+            group[i:i + self.batch_size]
+            for group in (described, bare)
+            for i in range(0, len(group), self.batch_size)
+        ]
+
+    def _load_cache(self, masx_categories):
+        if not self.cache_file.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable classification cache %s: %s", self.cache_file, e)
+            return {}
+        if data.get("categories") != list(masx_categories):
+            logger.info("MASX categories changed since %s was written, reclassifying all themes", self.cache_file.name)
+            return {}
+        return data.get("classifications", {})
+
+    def _save_cache(self, cache, masx_categories):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"categories": list(masx_categories), "classifications": cache}, indent=2),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.cache_file)
+
     def flatten_masx_categories(self, masx_template):
         flat = []
         for main_cat, subcats in masx_template.items():
@@ -137,11 +254,12 @@ class GeoDataAgent:
                         subcats.append(theme_code)
                         inserted = True
                         break
-            if not inserted:
-                print(f"⚠ Warning: category '{category}' not found in template — skipping or logging")
+            if not inserted and category != UNCATEGORIZED:
+                logger.warning("Category '%s' not found in template, skipping %s", category, theme_code)
         return category_map
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     agent = GeoDataAgent()
     mapped = agent.run_full_pipeline()
-    print(mapped)
+    logger.info("Mapped themes into %d MASX category groups", len(mapped))
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+
+from core.config.settings import get_settings
+from core.domain.agents.forecaster import generate_forecasts
+from core.domain.agents.ports import DoctrineAgentPort, DoctrinePassagePort, EvidenceRetrievalPort
+from core.domain.constants import DoctrineDomain, RagContextMode
+from core.domain.doctrine_pack import load_all_doctrine_packs
+from core.domain.forecast_models import DoctrinePack, Forecast
+from core.llm.ports import LLMClientPort
+from integrations.llamaindex.council_retriever import LlamaIndexCouncilRetriever
+from integrations.llamaindex.doctrine_query_tools import DoctrineToolRegistry, get_doctrine_tool_registry
+from integrations.llamaindex.evidence_retriever import LlamaIndexEvidenceRetriever
+from integrations.llms.doctrine_agent_adapter import build_doctrine_agents
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ForecastPorts:
+    doctrine_agents: list[DoctrineAgentPort]
+    evidence_port: EvidenceRetrievalPort
+    passage_port: DoctrinePassagePort | None
+
+
+def build_forecast_ports(
+    *,
+    llm: LLMClientPort,
+    packs: list[DoctrinePack] | None = None,
+    registry: DoctrineToolRegistry | None = None,
+    mode: RagContextMode | None = None,
+) -> ForecastPorts:
+    """Wire doctrine agents and retrieval ports for the forecaster and council.
+
+    In RETRIEVAL mode the council fetches passages for every agent in one
+    shared query and each agent makes a single LLM call; doctrines without
+    shared hits fall back to their own retriever. SYNTHESIS mode keeps the
+    per-agent query engine, which costs an extra synthesis call per agent.
+    ``mode`` defaults to the ``RAG_CONTEXT_MODE`` setting. Every port looks
+    the router up through the registry on each query, so long-lived ports
+    follow a reindex.
+    """
+    mode = mode or get_settings().rag_context_mode
+    registry = registry or get_doctrine_tool_registry()
+    agents = build_doctrine_agents(
+        llm=llm,
+        packs=load_all_doctrine_packs() if packs is None else packs,
+        registry=registry,
+        mode=mode,
+    )
+    logger.info("Built %d doctrine agents in %s mode", len(agents), mode.value)
+    return ForecastPorts(
+        doctrine_agents=agents,
+        evidence_port=LlamaIndexEvidenceRetriever(router_source=lambda: registry.router),
+        passage_port=(
+            LlamaIndexCouncilRetriever(router_source=lambda: registry.router)
+            if mode == RagContextMode.RETRIEVAL
+            else None
+        ),
+    )
+
+
+def forecast_events(
+    events: list[str],
+    *,
+    horizon: date,
+    domain: DoctrineDomain,
+    llm: LLMClientPort,
+    ports: ForecastPorts | None = None,
+) -> list[Forecast]:
+    ports = ports or build_forecast_ports(llm=llm)
+    return generate_forecasts(
+        events,
+        horizon=horizon,
+        domain=domain,
+        llm=llm,
+        evidence_port=ports.evidence_port,
+        doctrine_agents=ports.doctrine_agents,
+        passage_port=ports.passage_port,
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 
@@ -11,16 +12,35 @@ logger = logging.getLogger(__name__)
 
 _GDELT_DOC_API = "https://api.gdeltproject.org/api/v2/doc/doc"
 _REQUEST_TIMEOUT = 30.0
+_MAX_CONCURRENT_REQUESTS = 8
 
 
 class GdeltEvidenceAdapter:
-    def __init__(self, *, timeout: float = _REQUEST_TIMEOUT) -> None:
+    def __init__(
+        self,
+        *,
+        timeout: float = _REQUEST_TIMEOUT,
+        max_concurrency: int = _MAX_CONCURRENT_REQUESTS,
+    ) -> None:
         self._timeout = timeout
+        self._max_concurrency = max_concurrency
 
     def retrieve(self, query: str, *, top_k: int = 10) -> list[Evidence]:
         articles = self._fetch_articles(query, max_records=top_k)
         return [_article_to_evidence(a) for a in articles]
 
+    def retrieve_many(
+        self,
+        queries: list[str],
+        *,
+        top_k: int = 10,
+    ) -> list[list[Evidence]]:
+        if not queries:
+            return []
+        workers = min(self._max_concurrency, len(queries))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gdelt") as pool:
+            return list(pool.map(lambda q: self.retrieve(q, top_k=top_k), queries))
+
     def _fetch_articles(
         self,
         query: str,
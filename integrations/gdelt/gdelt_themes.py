@@ -3,6 +3,7 @@ from pathlib import Path
 
 import httpx
 
+from core.domain.keyword_matcher import KeywordMatcher
 from helpers.json_file_helper import JsonFileHelper
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,8 @@ class GdeltV2Themes:
         themes_file: Path,
         keywords: dict[str, list[str]],
     ) -> list[tuple[str, str]]:
+        """One (theme, category) pair for every category whose keywords occur in a theme code."""
+        matcher = KeywordMatcher(keywords)
         relevant: list[tuple[str, str]] = []
         with open(themes_file, encoding="utf-8") as f:
             for line in f:
@@ -36,9 +39,7 @@ class GdeltV2Themes:
                 if len(parts) != 2:
                     continue
                 theme_code = parts[0].lower()
-                match = _match_keyword(theme_code, keywords)
-                if match:
-                    relevant.append((theme_code, match))
+                relevant.extend((theme_code, category) for category in matcher.match(theme_code))
         return relevant
 
     @staticmethod
@@ -48,9 +49,3 @@ class GdeltV2Themes:
             categories.setdefault(category, []).append({"code": theme_code})
         return categories
 
-
-def _match_keyword(theme_code: str, keywords: dict[str, list[str]]) -> str | None:
-    for category, words in keywords.items():
-        if any(word.lower() in theme_code for word in words):
-            return category
-    return None
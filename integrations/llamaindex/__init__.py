@@ -1,9 +1,14 @@
-from integrations.llamaindex.doctrine_reader import read_doctrine_documents
-from integrations.llamaindex.index_builder import load_or_build_index
+from integrations.llamaindex.doctrine_reader import read_cleaned_documents, read_doctrine_documents
+from integrations.llamaindex.index_builder import load_or_build_index, replace_doctrine
 from integrations.llamaindex.evidence_retriever import LlamaIndexEvidenceRetriever
+from integrations.llamaindex.index_registry import get_index_router, warm_index
 
 __all__ = [
     "read_doctrine_documents",
+    "read_cleaned_documents",
     "load_or_build_index",
+    "replace_doctrine",
     "LlamaIndexEvidenceRetriever",
+    "get_index_router",
+    "warm_index",
 ]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+
+from llama_index.core import VectorStoreIndex
+
+from core.domain.constants import (
+    DEFAULT_EVIDENCE_DIVERSITY,
+    DEFAULT_SIMILARITY_TOP_K,
+    DIVERSITY_CANDIDATE_MULTIPLIER,
+)
+from core.domain.evidence_selection import select_diverse_evidence
+from core.domain.forecast_models import Evidence
+from integrations.llamaindex.evidence_retriever import nodes_to_evidence
+from integrations.llamaindex.index_registry import get_index_router
+from integrations.llamaindex.index_router import DoctrineIndexRouter
+
+logger = logging.getLogger(__name__)
+
+
+class LlamaIndexCouncilRetriever:
+    """Serves every council agent from a single query embedding.
+
+    With a shared collection this is one slug-filtered vector query for
+    ``top_k * len(doctrine_ids)`` candidates split per doctrine; with a
+    partitioned index the embedding is reused across each doctrine's
+    partition.
+    """
+
+    def __init__(
+        self,
+        *,
+        index: VectorStoreIndex | None = None,
+        router: DoctrineIndexRouter | None = None,
+        router_source: Callable[[], DoctrineIndexRouter] | None = None,
+        diversity: float = DEFAULT_EVIDENCE_DIVERSITY,
+    ) -> None:
+        self._router = router or (DoctrineIndexRouter(index=index) if index is not None else None)
+        self._router_source = router_source or get_index_router
+        self._diversity = diversity
+
+    def retrieve_by_doctrine(
+        self,
+        query: str,
+        *,
+        doctrine_ids: list[str],
+        top_k: int = DEFAULT_SIMILARITY_TOP_K,
+    ) -> dict[str, list[Evidence]]:
+        candidates = top_k * DIVERSITY_CANDIDATE_MULTIPLIER if self._diversity > 0.0 else top_k
+        grouped = self._get_router().retrieve_grouped(
+            query, slugs=doctrine_ids, top_k=candidates,
+        )
+        logger.info(
+            "Council retrieval: %d/%d doctrines matched",
+            len(grouped), len(doctrine_ids),
+        )
+        return {
+            slug: select_diverse_evidence(
+                nodes_to_evidence(nodes), top_k=top_k, diversity=self._diversity,
+            )
+            for slug, nodes in grouped.items()
+        }
+
+    def _get_router(self) -> DoctrineIndexRouter:
+        return self._router or self._router_source()
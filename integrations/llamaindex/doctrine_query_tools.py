@@ -1,17 +1,105 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
 
 from llama_index.core import VectorStoreIndex
+from llama_index.core.retrievers import BaseRetriever
 from llama_index.core.tools import QueryEngineTool, ToolMetadata
-from llama_index.core.vector_stores import MetadataFilter, MetadataFilters
 
-from core.domain.constants import DEFAULT_RAG_RESPONSE_MODE, DEFAULT_SIMILARITY_TOP_K
-from integrations.llamaindex.index_builder import load_or_build_index
+from core.domain.constants import DEFAULT_SIMILARITY_TOP_K
+from integrations.llamaindex.index_registry import get_index_router
+from integrations.llamaindex.index_router import DoctrineIndexRouter
 
 logger = logging.getLogger(__name__)
 
-_METADATA_KEY_SLUG = "doctrine_slug"
+_registries: dict[int, DoctrineToolRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+class DoctrineToolRegistry:
+    """Per-doctrine query tools, built on first use and reused until the index changes.
+
+    Slugs come from the index manifest (falling back to a collection
+    metadata query), so listing doctrines never opens the index or walks
+    the docstore. Tools and retrievers are routed to the doctrine's own
+    partition when the index uses the partitioned layout. With a
+    ``router_source`` the router is resolved on every call, and memoized
+    tools are dropped once it hands out a different (reopened) router.
+    """
+
+    def __init__(
+        self,
+        *,
+        index: VectorStoreIndex | None = None,
+        top_k: int = DEFAULT_SIMILARITY_TOP_K,
+        persist_dir: Path | None = None,
+        router: DoctrineIndexRouter | None = None,
+        router_source: Callable[[], DoctrineIndexRouter] | None = None,
+    ) -> None:
+        self._router_source = router_source
+        self._router = None if router_source else (
+            router or DoctrineIndexRouter(index=index, persist_dir=persist_dir)
+        )
+        self._top_k = top_k
+        self._tools: dict[str, QueryEngineTool] = {}
+        self._retrievers: dict[str, BaseRetriever] = {}
+        self._memo_router: DoctrineIndexRouter | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def router(self) -> DoctrineIndexRouter:
+        return self._router or self._router_source()
+
+    @property
+    def slugs(self) -> list[str]:
+        return self.router.slugs
+
+    def get(self, slug: str) -> QueryEngineTool | None:
+        router = self.router
+        if slug not in router.slugs:
+            return None
+        with self._lock:
+            self._reset_if_reopened(router)
+            if slug not in self._tools:
+                tool = _create_tool_for_doctrine(router, slug, top_k=self._top_k)
+                if tool is None:
+                    return None
+                self._tools[slug] = tool
+            return self._tools[slug]
+
+    def get_retriever(self, slug: str) -> BaseRetriever | None:
+        router = self.router
+        if slug not in router.slugs:
+            return None
+        with self._lock:
+            self._reset_if_reopened(router)
+            if slug not in self._retrievers:
+                self._retrievers[slug] = router.retriever_for(slug, top_k=self._top_k)
+            return self._retrievers[slug]
+
+    def tools(self) -> list[QueryEngineTool]:
+        return [tool for slug in self.slugs if (tool := self.get(slug))]
+
+    def _reset_if_reopened(self, router: DoctrineIndexRouter) -> None:
+        if router is not self._memo_router:
+            self._tools.clear()
+            self._retrievers.clear()
+            self._memo_router = router
+
+
+def get_doctrine_tool_registry(
+    *,
+    top_k: int = DEFAULT_SIMILARITY_TOP_K,
+) -> DoctrineToolRegistry:
+    with _registries_lock:
+        registry = _registries.get(top_k)
+        if registry is None:
+            registry = DoctrineToolRegistry(router_source=get_index_router, top_k=top_k)
+            _registries[top_k] = registry
+        return registry
 
 
 def build_doctrine_tools(
@@ -19,51 +107,24 @@ def build_doctrine_tools(
     index: VectorStoreIndex | None = None,
     top_k: int = DEFAULT_SIMILARITY_TOP_K,
 ) -> list[QueryEngineTool]:
-    index = index or load_or_build_index()
-    slugs = _extract_unique_slugs(index)
-
-    tools: list[QueryEngineTool] = []
-    for slug in sorted(slugs):
-        tool = _create_tool_for_doctrine(index, slug, top_k=top_k)
-        if tool:
-            tools.append(tool)
-
+    registry = (
+        DoctrineToolRegistry(index=index, top_k=top_k)
+        if index is not None
+        else get_doctrine_tool_registry(top_k=top_k)
+    )
+    tools = registry.tools()
     logger.info("Built %d doctrine query tools", len(tools))
     return tools
 
 
-def _extract_unique_slugs(index: VectorStoreIndex) -> set[str]:
-    try:
-        docstore = index.docstore
-        slugs: set[str] = set()
-        for doc_id in docstore.docs:
-            doc = docstore.docs[doc_id]
-            slug = doc.metadata.get(_METADATA_KEY_SLUG, "")
-            if slug:
-                slugs.add(slug)
-        return slugs
-    except Exception:
-        logger.warning("Could not extract slugs from docstore, returning empty set")
-        return set()
-
-
 def _create_tool_for_doctrine(
-    index: VectorStoreIndex,
+    router: DoctrineIndexRouter,
     slug: str,
     *,
     top_k: int,
 ) -> QueryEngineTool | None:
     try:
-        filters = MetadataFilters(
-            filters=[
-                MetadataFilter(key=_METADATA_KEY_SLUG, value=slug),
-            ]
-        )
-        engine = index.as_query_engine(
-            similarity_top_k=top_k,
-            filters=filters,
-            response_mode=DEFAULT_RAG_RESPONSE_MODE,
-        )
+        engine = router.query_engine_for(slug, top_k=top_k)
         pretty_name = slug.replace("_", " ").title()
         return QueryEngineTool(
             query_engine=engine,
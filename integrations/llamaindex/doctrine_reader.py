@@ -9,15 +9,16 @@ from llama_index.core.schema import Document
 from llama_index.readers.file import PyMuPDFReader
 
 from core.config.paths import Paths
+from core.domain.constants import (
+    METADATA_KEY_DOCTRINE_SLUG,
+    METADATA_KEY_PART_INDEX,
+    METADATA_KEY_SOURCE_FILENAME,
+)
 
 logger = logging.getLogger(__name__)
 
 _PART_SUFFIX_PATTERN = re.compile(r"[-_](\d+)$")
 
-_METADATA_KEY_SLUG = "doctrine_slug"
-_METADATA_KEY_FILENAME = "source_filename"
-_METADATA_KEY_PART = "part_index"
-
 
 def read_doctrine_documents(
     *,
@@ -45,6 +46,35 @@ def read_doctrine_documents(
     return documents
 
 
+def read_cleaned_documents(*, cleaned_dir: Path | None = None) -> list[Document]:
+    """One document per cleaned doctrine, the same source the pipeline's index stage reads."""
+    cleaned_dir = cleaned_dir or Paths.CLEANED_DIR
+    documents = [
+        document
+        for path in sorted(cleaned_dir.glob("*.md"))
+        for document in read_cleaned_doctrine(path.stem, cleaned_dir=cleaned_dir)
+    ]
+    logger.info("Read %d cleaned doctrines from %s", len(documents), cleaned_dir)
+    return documents
+
+
+def read_cleaned_doctrine(slug: str, *, cleaned_dir: Path | None = None) -> list[Document]:
+    """Read the cleaned ``<slug>.md`` of one doctrine, whatever its raw formats were."""
+    path = (cleaned_dir or Paths.CLEANED_DIR) / f"{slug}.md"
+    if not path.exists():
+        logger.warning("No cleaned output for doctrine '%s' at %s", slug, path)
+        return []
+    return [
+        Document(
+            text=path.read_text(encoding="utf-8"),
+            metadata={
+                METADATA_KEY_DOCTRINE_SLUG: slug,
+                METADATA_KEY_SOURCE_FILENAME: path.name,
+            },
+        )
+    ]
+
+
 def _group_by_doctrine(pdf_files: list[Path]) -> dict[str, list[Path]]:
     grouped: dict[str, list[Path]] = defaultdict(list)
     for pdf in pdf_files:
@@ -67,9 +97,9 @@ def _read_doctrine_group(
         try:
             part_docs = reader.load_data(file_path=pdf_path)
             for doc in part_docs:
-                doc.metadata[_METADATA_KEY_SLUG] = slug
-                doc.metadata[_METADATA_KEY_FILENAME] = pdf_path.name
-                doc.metadata[_METADATA_KEY_PART] = part_idx
+                doc.metadata[METADATA_KEY_DOCTRINE_SLUG] = slug
+                doc.metadata[METADATA_KEY_SOURCE_FILENAME] = pdf_path.name
+                doc.metadata[METADATA_KEY_PART_INDEX] = part_idx
             docs.extend(part_docs)
         except Exception as e:
             logger.error(
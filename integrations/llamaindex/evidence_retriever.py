@@ -1,39 +1,167 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 
 from llama_index.core import VectorStoreIndex
+from llama_index.core.schema import NodeWithScore
 
-from core.domain.constants import DEFAULT_RAG_RESPONSE_MODE, DEFAULT_SIMILARITY_TOP_K
+from core.domain.constants import (
+    DEFAULT_EVIDENCE_DIVERSITY,
+    DEFAULT_RETRIEVAL_MODE,
+    DEFAULT_SIMILARITY_TOP_K,
+    DIVERSITY_CANDIDATE_MULTIPLIER,
+    HYBRID_CANDIDATE_MULTIPLIER,
+    METADATA_KEY_DOCTRINE_SLUG,
+    RetrievalMode,
+)
+from core.domain.evidence_selection import select_diverse_evidence
+from core.domain.exceptions import ConfigurationError
 from core.domain.forecast_models import Evidence
-from integrations.llamaindex.index_builder import load_or_build_index
+from integrations.llamaindex.index_registry import get_index_router
+from integrations.llamaindex.index_router import DoctrineIndexRouter
+from integrations.llamaindex.keyword_index import BM25KeywordIndex
+from integrations.llamaindex.query_cache import CacheStats, QueryResultCache
+from integrations.llamaindex.rank_fusion import reciprocal_rank_fusion
 
 logger = logging.getLogger(__name__)
 
 
 class LlamaIndexEvidenceRetriever:
-    def __init__(self, *, index: VectorStoreIndex | None = None) -> None:
-        self._index = index
+    def __init__(
+        self,
+        *,
+        index: VectorStoreIndex | None = None,
+        cache: QueryResultCache | None = None,
+        mode: RetrievalMode = DEFAULT_RETRIEVAL_MODE,
+        keyword_index: BM25KeywordIndex | None = None,
+        router: DoctrineIndexRouter | None = None,
+        router_source: Callable[[], DoctrineIndexRouter] | None = None,
+        diversity: float = DEFAULT_EVIDENCE_DIVERSITY,
+    ) -> None:
+        self._router = router or (DoctrineIndexRouter(index=index) if index is not None else None)
+        self._router_source = router_source or get_index_router
+        self._mode = mode
+        self._diversity = diversity
+        self._keyword_index = keyword_index
+        self._keyword_index_injected = keyword_index is not None
+        self._keyword_version: str | None = None
+        self._cache = cache or QueryResultCache()
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        return self._cache.stats
 
     def retrieve(self, query: str, *, top_k: int = DEFAULT_SIMILARITY_TOP_K) -> list[Evidence]:
-        index = self._get_index()
-        retriever = index.as_retriever(similarity_top_k=top_k)
-        nodes = retriever.retrieve(query)
-        return _nodes_to_evidence(nodes)
+        router = self._get_router()
+        cached = self._cache.get(query, top_k=top_k, version=router.version)
+        if cached is not None:
+            return cached
+        nodes = self._search(router, query, top_k=self._candidate_k(top_k))
+        evidence = self._select(nodes, top_k=top_k)
+        self._cache.put(query, top_k=top_k, results=evidence, version=router.version)
+        return evidence
+
+    def retrieve_many(
+        self,
+        queries: list[str],
+        *,
+        top_k: int = DEFAULT_SIMILARITY_TOP_K,
+    ) -> list[list[Evidence]]:
+        router = self._get_router()
+        results: dict[str, list[Evidence]] = {}
+        misses: list[str] = []
+        for query in dict.fromkeys(queries):
+            cached = self._cache.get(query, top_k=top_k, version=router.version)
+            if cached is None:
+                misses.append(query)
+            else:
+                results[query] = cached
+        candidates = self._search_many(router, misses, top_k=self._candidate_k(top_k))
+        for query, nodes in zip(misses, candidates):
+            results[query] = self._select(nodes, top_k=top_k)
+            self._cache.put(query, top_k=top_k, results=results[query], version=router.version)
+        return [results[query] for query in queries]
+
+    def _candidate_k(self, top_k: int) -> int:
+        return top_k * DIVERSITY_CANDIDATE_MULTIPLIER if self._diversity > 0.0 else top_k
+
+    def _select(self, nodes: list[NodeWithScore], *, top_k: int) -> list[Evidence]:
+        return select_diverse_evidence(
+            nodes_to_evidence(nodes), top_k=top_k, diversity=self._diversity,
+        )
+
+    def _search_many(
+        self,
+        router: DoctrineIndexRouter,
+        queries: list[str],
+        *,
+        top_k: int,
+    ) -> list[list[NodeWithScore]]:
+        if not queries:
+            return []
+        if self._mode == RetrievalMode.KEYWORD:
+            return [self._keyword_search(router, query, top_k=top_k) for query in queries]
+        if self._mode == RetrievalMode.HYBRID:
+            candidates = top_k * HYBRID_CANDIDATE_MULTIPLIER
+            vector_hits = router.retrieve_many(queries, top_k=candidates)
+            return [
+                reciprocal_rank_fusion(
+                    [hits, self._keyword_search(router, query, top_k=candidates)],
+                    top_k=top_k,
+                )
+                for query, hits in zip(queries, vector_hits)
+            ]
+        return router.retrieve_many(queries, top_k=top_k)
+
+    def _search(self, router: DoctrineIndexRouter, query: str, *, top_k: int) -> list[NodeWithScore]:
+        if self._mode == RetrievalMode.KEYWORD:
+            return self._keyword_search(router, query, top_k=top_k)
+        if self._mode == RetrievalMode.HYBRID:
+            candidates = top_k * HYBRID_CANDIDATE_MULTIPLIER
+            return reciprocal_rank_fusion(
+                [
+                    router.retrieve(query, top_k=candidates),
+                    self._keyword_search(router, query, top_k=candidates),
+                ],
+                top_k=top_k,
+            )
+        return router.retrieve(query, top_k=top_k)
+
+    def _get_router(self) -> DoctrineIndexRouter:
+        return self._router or self._router_source()
+
+    def _keyword_search(
+        self,
+        router: DoctrineIndexRouter,
+        query: str,
+        *,
+        top_k: int,
+    ) -> list[NodeWithScore]:
+        return self._get_keyword_index(router).search(query, top_k=top_k)
 
-    def _get_index(self) -> VectorStoreIndex:
-        if self._index is None:
-            self._index = load_or_build_index()
-        return self._index
+    def _get_keyword_index(self, router: DoctrineIndexRouter) -> BM25KeywordIndex:
+        """The BM25 index of ``router``'s store, reloaded whenever its version changes."""
+        if not self._keyword_index_injected:
+            version = router.version
+            if self._keyword_index is None or version != self._keyword_version:
+                if self._keyword_index is not None:
+                    logger.info("Index version changed to %s, reloading keyword index", version)
+                self._keyword_index = BM25KeywordIndex.load(router.persist_dir)
+                self._keyword_version = version
+        if self._keyword_index is None:
+            msg = f"No keyword index in {router.persist_dir}; rebuild the index first"
+            raise ConfigurationError(msg)
+        return self._keyword_index
 
 
-def _nodes_to_evidence(nodes: list) -> list[Evidence]:
+def nodes_to_evidence(nodes: list[NodeWithScore]) -> list[Evidence]:
     results: list[Evidence] = []
     for node_with_score in nodes:
         node = node_with_score.node
         metadata = node.metadata or {}
         source = metadata.get("source_filename", metadata.get("file_path", "unknown"))
-        slug = metadata.get("doctrine_slug", "")
+        slug = metadata.get(METADATA_KEY_DOCTRINE_SLUG, "")
         if slug:
             source = f"{slug} ({source})"
 
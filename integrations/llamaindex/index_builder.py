@@ -1,49 +1,59 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import chromadb
 from llama_index.core import StorageContext, VectorStoreIndex
+from llama_index.core.base.embeddings.base import BaseEmbedding
 from llama_index.core.node_parser import SentenceSplitter
-from llama_index.core.schema import Document
+from llama_index.core.schema import BaseNode, Document
+from llama_index.core.vector_stores.types import BasePydanticVectorStore
+from llama_index.core.vector_stores.utils import metadata_dict_to_node
 from llama_index.embeddings.openai import OpenAIEmbedding
-from llama_index.vector_stores.chroma import ChromaVectorStore
 
 from core.config.paths import Paths
 from core.config.settings import get_settings
+from core.domain.constants import METADATA_KEY_DOCTRINE_SLUG, IndexLayout, VectorStoreBackend
+from integrations.llamaindex.index_manifest import write_index_manifest
+from integrations.llamaindex.keyword_index import BM25KeywordIndex
+from integrations.llamaindex.mmap_vector_store import MmapVectorStore
+
+if TYPE_CHECKING:
+    import chromadb
 
 logger = logging.getLogger(__name__)
 
 _COLLECTION_NAME = "masx_doctrines"
+_PARTITION_SEPARATOR = "__"
+_MMAP_SUBDIR = "mmap"
+_MMAP_PARTITIONS_SUBDIR = "mmap_partitions"
 
 
 def load_or_build_index(
     *,
     documents: list[Document] | None = None,
     persist_dir: Path | None = None,
+    partition: str | None = None,
+    embed_model: BaseEmbedding | None = None,
 ) -> VectorStoreIndex:
     persist_dir = persist_dir or Paths.VECTOR_DIR
     persist_dir.mkdir(parents=True, exist_ok=True)
 
-    chroma_client = _create_chroma_client(persist_dir)
-    vector_store = _create_vector_store(chroma_client)
-    embed_model = _create_embed_model()
+    vector_store = _create_vector_store(persist_dir, partition=partition)
+    embed_model = embed_model or create_embed_model()
     storage_context = StorageContext.from_defaults(vector_store=vector_store)
 
     if documents:
-        node_parser = _create_node_parser()
-        logger.info(
-            "Building index from %d documents (chunk_size=%d, overlap=%d)",
-            len(documents), node_parser.chunk_size, node_parser.chunk_overlap,
-        )
-        index = VectorStoreIndex.from_documents(
+        index, nodes = _index_documents(
             documents,
             storage_context=storage_context,
             embed_model=embed_model,
-            transformations=[node_parser],
-            show_progress=True,
         )
+        vector_store.persist(str(persist_dir))
+        if partition is None:
+            _write_catalog(persist_dir, nodes, slugs=_document_slugs(documents))
         logger.info("Index built and persisted to %s", persist_dir)
         return index
 
@@ -54,16 +64,94 @@ def load_or_build_index(
     )
 
 
-def _create_chroma_client(persist_dir: Path) -> chromadb.ClientAPI:
-    return chromadb.PersistentClient(path=str(persist_dir))
+def build_doctrine_index(
+    documents: list[Document],
+    *,
+    persist_dir: Path | None = None,
+) -> None:
+    """Build the index in the configured layout (one collection, or one per doctrine)."""
+    persist_dir = persist_dir or Paths.VECTOR_DIR
+    if not uses_partitioned_layout():
+        load_or_build_index(documents=documents, persist_dir=persist_dir)
+        return
+    grouped = _group_by_slug(documents)
+    embed_model = create_embed_model()
+    for slug, group in grouped.items():
+        _rebuild_partition_store(slug, group, persist_dir=persist_dir, embed_model=embed_model)
+    _refresh_catalog(persist_dir)
 
 
-def _create_vector_store(client: chromadb.ClientAPI) -> ChromaVectorStore:
-    collection = client.get_or_create_collection(name=_COLLECTION_NAME)
-    return ChromaVectorStore(chroma_collection=collection)
+def rebuild_partition(
+    slug: str,
+    documents: list[Document],
+    *,
+    persist_dir: Path | None = None,
+) -> VectorStoreIndex:
+    """Replace a single doctrine's partition, leaving every other doctrine untouched."""
+    persist_dir = persist_dir or Paths.VECTOR_DIR
+    index = _rebuild_partition_store(slug, documents, persist_dir=persist_dir)
+    _refresh_catalog(persist_dir)
+    return index
+
+
+def replace_doctrine(
+    slug: str,
+    documents: list[Document],
+    *,
+    persist_dir: Path | None = None,
+) -> None:
+    """Re-index one doctrine in place, in either layout, without touching the others."""
+    persist_dir = persist_dir or Paths.VECTOR_DIR
+    if uses_partitioned_layout():
+        if documents:
+            rebuild_partition(slug, documents, persist_dir=persist_dir)
+        else:
+            _drop_partition(persist_dir, slug)
+            _refresh_catalog(persist_dir)
+        return
+
+    persist_dir.mkdir(parents=True, exist_ok=True)
+    vector_store = _create_vector_store(persist_dir)
+    _delete_shared_slug(persist_dir, vector_store, slug)
+    if documents:
+        _index_documents(
+            documents,
+            storage_context=StorageContext.from_defaults(vector_store=vector_store),
+            embed_model=create_embed_model(),
+        )
+        vector_store.persist(str(persist_dir))
+    nodes = _stored_nodes(persist_dir, partition=None)
+    _write_catalog(persist_dir, nodes, slugs=_node_slugs(nodes))
+    logger.info("Re-indexed doctrine '%s' (%d documents)", slug, len(documents))
+
 
+def uses_partitioned_layout() -> bool:
+    return get_settings().index_layout == IndexLayout.PARTITIONED
 
-def _create_embed_model() -> OpenAIEmbedding:
+
+def list_collection_slugs(*, persist_dir: Path | None = None) -> set[str]:
+    persist_dir = persist_dir or Paths.VECTOR_DIR
+    if uses_partitioned_layout():
+        return _partition_slugs(persist_dir)
+    if _uses_mmap_store():
+        return set(_create_mmap_store(persist_dir).slugs)
+    result = _get_chroma_collection(persist_dir).get(include=["metadatas"])
+    return {
+        meta[METADATA_KEY_DOCTRINE_SLUG]
+        for meta in result.get("metadatas") or []
+        if meta and meta.get(METADATA_KEY_DOCTRINE_SLUG)
+    }
+
+
+def build_keyword_index(*, persist_dir: Path | None = None) -> BM25KeywordIndex:
+    """Rebuild the BM25 index from the stored collection, without re-embedding."""
+    persist_dir = persist_dir or Paths.VECTOR_DIR
+    keyword_index = BM25KeywordIndex.from_nodes(_all_stored_nodes(persist_dir))
+    keyword_index.save(persist_dir)
+    return keyword_index
+
+
+def create_embed_model() -> OpenAIEmbedding:
     settings = get_settings()
     return OpenAIEmbedding(
         model=settings.llamaindex_embed_model,
@@ -71,6 +159,211 @@ def _create_embed_model() -> OpenAIEmbedding:
     )
 
 
+def _rebuild_partition_store(
+    slug: str,
+    documents: list[Document],
+    *,
+    persist_dir: Path,
+    embed_model: BaseEmbedding | None = None,
+) -> VectorStoreIndex:
+    _drop_partition(persist_dir, slug)
+    return load_or_build_index(
+        documents=documents,
+        persist_dir=persist_dir,
+        partition=slug,
+        embed_model=embed_model,
+    )
+
+
+def _refresh_catalog(persist_dir: Path) -> None:
+    """Rewrite the manifest and keyword index from the partitions actually stored."""
+    nodes_by_slug = {
+        slug: _stored_nodes(persist_dir, partition=slug)
+        for slug in sorted(_partition_slugs(persist_dir))
+    }
+    slugs = {slug for slug, nodes in nodes_by_slug.items() if nodes}
+    nodes = [node for slug in sorted(slugs) for node in nodes_by_slug[slug]]
+    _write_catalog(persist_dir, nodes, slugs=slugs)
+
+
+def _write_catalog(persist_dir: Path, nodes: list[BaseNode], *, slugs: set[str]) -> None:
+    write_index_manifest(
+        persist_dir,
+        collection=_COLLECTION_NAME,
+        slugs=slugs,
+        node_count=len(nodes),
+    )
+    BM25KeywordIndex.from_nodes(nodes).save(persist_dir)
+
+
+def _index_documents(
+    documents: list[Document],
+    *,
+    storage_context: StorageContext,
+    embed_model: BaseEmbedding,
+) -> tuple[VectorStoreIndex, list[BaseNode]]:
+    node_parser = _create_node_parser()
+    logger.info(
+        "Building index from %d documents (chunk_size=%d, overlap=%d)",
+        len(documents), node_parser.chunk_size, node_parser.chunk_overlap,
+    )
+    nodes = node_parser.get_nodes_from_documents(documents, show_progress=True)
+    index = VectorStoreIndex(
+        nodes,
+        storage_context=storage_context,
+        embed_model=embed_model,
+        show_progress=True,
+    )
+    return index, nodes
+
+
+def _delete_shared_slug(
+    persist_dir: Path,
+    vector_store: BasePydanticVectorStore,
+    slug: str,
+) -> None:
+    if isinstance(vector_store, MmapVectorStore):
+        vector_store.delete_slug(slug)
+        return
+    _get_chroma_collection(persist_dir).delete(where={METADATA_KEY_DOCTRINE_SLUG: slug})
+
+
+def _all_stored_nodes(persist_dir: Path) -> list[BaseNode]:
+    if not uses_partitioned_layout():
+        return _stored_nodes(persist_dir, partition=None)
+    return [
+        node
+        for slug in sorted(_partition_slugs(persist_dir))
+        for node in _stored_nodes(persist_dir, partition=slug)
+    ]
+
+
+def _stored_nodes(persist_dir: Path, *, partition: str | None) -> list[BaseNode]:
+    if _uses_mmap_store():
+        return _create_mmap_store(persist_dir, partition=partition).get_nodes()
+    collection = _get_chroma_collection(persist_dir, partition=partition)
+    result = collection.get(include=["documents", "metadatas"])
+    return [
+        _stored_node(text, meta)
+        for text, meta in zip(result["documents"], result["metadatas"])
+    ]
+
+
+def _stored_node(text: str, metadata: dict) -> BaseNode:
+    node = metadata_dict_to_node(metadata)
+    node.set_content(text)
+    return node
+
+
+def _document_slugs(documents: list[Document]) -> set[str]:
+    return {
+        doc.metadata[METADATA_KEY_DOCTRINE_SLUG]
+        for doc in documents
+        if doc.metadata.get(METADATA_KEY_DOCTRINE_SLUG)
+    }
+
+
+def _node_slugs(nodes: list[BaseNode]) -> set[str]:
+    return {
+        node.metadata[METADATA_KEY_DOCTRINE_SLUG]
+        for node in nodes
+        if node.metadata.get(METADATA_KEY_DOCTRINE_SLUG)
+    }
+
+
+def _group_by_slug(documents: list[Document]) -> dict[str, list[Document]]:
+    grouped: dict[str, list[Document]] = defaultdict(list)
+    for doc in documents:
+        slug = doc.metadata.get(METADATA_KEY_DOCTRINE_SLUG)
+        if slug:
+            grouped[slug].append(doc)
+        else:
+            logger.warning("Skipping document without '%s' metadata", METADATA_KEY_DOCTRINE_SLUG)
+    return dict(grouped)
+
+
+def _partition_slugs(persist_dir: Path) -> set[str]:
+    if _uses_mmap_store():
+        root = persist_dir / _MMAP_PARTITIONS_SUBDIR
+        return {p.name for p in root.iterdir() if p.is_dir()} if root.exists() else set()
+    prefix = f"{_COLLECTION_NAME}{_PARTITION_SEPARATOR}"
+    return {
+        name.removeprefix(prefix)
+        for name in _chroma_collection_names(_create_chroma_client(persist_dir))
+        if name.startswith(prefix)
+    }
+
+
+def _drop_partition(persist_dir: Path, slug: str) -> None:
+    if _uses_mmap_store():
+        _create_mmap_store(persist_dir, partition=slug).clear()
+        return
+    client = _create_chroma_client(persist_dir)
+    name = _collection_name(slug)
+    if name in _chroma_collection_names(client):
+        client.delete_collection(name=name)
+        logger.info("Dropped partition '%s'", name)
+
+
+def _uses_mmap_store() -> bool:
+    return get_settings().vector_store_backend == VectorStoreBackend.MMAP
+
+
+def _create_vector_store(
+    persist_dir: Path,
+    *,
+    partition: str | None = None,
+) -> BasePydanticVectorStore:
+    if _uses_mmap_store():
+        return _create_mmap_store(persist_dir, partition=partition)
+    from llama_index.vector_stores.chroma import ChromaVectorStore
+
+    collection = _get_chroma_collection(persist_dir, partition=partition)
+    return ChromaVectorStore(chroma_collection=collection)
+
+
+def _create_mmap_store(
+    persist_dir: Path,
+    *,
+    partition: str | None = None,
+) -> MmapVectorStore:
+    store_dir = (
+        persist_dir / _MMAP_PARTITIONS_SUBDIR / partition
+        if partition
+        else persist_dir / _MMAP_SUBDIR
+    )
+    return MmapVectorStore.from_persist_dir(
+        store_dir,
+        precision=get_settings().vector_store_precision,
+    )
+
+
+def _collection_name(partition: str | None) -> str:
+    if partition is None:
+        return _COLLECTION_NAME
+    return f"{_COLLECTION_NAME}{_PARTITION_SEPARATOR}{partition}"
+
+
+def _get_chroma_collection(
+    persist_dir: Path,
+    *,
+    partition: str | None = None,
+) -> chromadb.Collection:
+    return _create_chroma_client(persist_dir).get_or_create_collection(
+        name=_collection_name(partition),
+    )
+
+
+def _chroma_collection_names(client: chromadb.ClientAPI) -> list[str]:
+    return [c if isinstance(c, str) else c.name for c in client.list_collections()]
+
+
+def _create_chroma_client(persist_dir: Path) -> chromadb.ClientAPI:
+    import chromadb
+
+    return chromadb.PersistentClient(path=str(persist_dir))
+
+
 def _create_node_parser() -> SentenceSplitter:
     settings = get_settings()
     return SentenceSplitter(
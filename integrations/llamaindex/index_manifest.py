@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_FILENAME = "index_manifest.json"
+
+_version_cache: dict[Path, tuple[int, str | None]] = {}
+
+
+class IndexManifest(BaseModel):
+    version: str
+    collection: str
+    slugs: list[str] = Field(default_factory=list)
+    node_count: int = 0
+    built_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
+def manifest_path(persist_dir: Path) -> Path:
+    return persist_dir / _MANIFEST_FILENAME
+
+
+def write_index_manifest(
+    persist_dir: Path,
+    *,
+    collection: str,
+    slugs: set[str],
+    node_count: int,
+) -> IndexManifest:
+    manifest = IndexManifest(
+        version=uuid.uuid4().hex,
+        collection=collection,
+        slugs=sorted(slugs),
+        node_count=node_count,
+    )
+    manifest_path(persist_dir).write_text(
+        manifest.model_dump_json(indent=2), encoding="utf-8",
+    )
+    logger.info("Wrote index manifest %s (%d doctrines)", manifest.version, len(slugs))
+    return manifest
+
+
+def read_index_manifest(persist_dir: Path) -> IndexManifest | None:
+    path = manifest_path(persist_dir)
+    if not path.exists():
+        return None
+    try:
+        return IndexManifest.model_validate_json(path.read_text(encoding="utf-8"))
+    except (OSError, ValidationError) as e:
+        logger.warning("Ignoring unreadable index manifest %s: %s", path, e)
+        return None
+
+
+def current_manifest_version(persist_dir: Path) -> str | None:
+    """Manifest version, re-read only when the file's mtime changes."""
+    path = manifest_path(persist_dir)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _version_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        manifest = read_index_manifest(persist_dir)
+        cached = (mtime, manifest.version if manifest else None)
+        _version_cache[path] = cached
+    return cached[1]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+
+from core.config.paths import Paths
+from integrations.llamaindex.index_builder import create_embed_model
+from integrations.llamaindex.index_manifest import current_manifest_version
+from integrations.llamaindex.index_router import DoctrineIndexRouter
+
+logger = logging.getLogger(__name__)
+
+_WARMUP_QUERY = "strategic doctrine"
+
+
+class IndexRegistry:
+    """Process-wide index handles, opened once and reused by every retriever.
+
+    Each persist directory maps to one ``DoctrineIndexRouter``, which records
+    the manifest version it was opened at. When the on-disk version changes
+    the next caller gets a freshly opened router; callers still holding the
+    old one finish against it undisturbed. The embedding model is shared
+    across reloads.
+    """
+
+    def __init__(self) -> None:
+        self._routers: dict[Path, DoctrineIndexRouter] = {}
+        self._embed_model: BaseEmbedding | None = None
+        self._lock = threading.Lock()
+
+    def get(self, persist_dir: Path | None = None) -> DoctrineIndexRouter:
+        persist_dir = persist_dir or Paths.VECTOR_DIR
+        version = current_manifest_version(persist_dir)
+        with self._lock:
+            router = self._routers.get(persist_dir)
+            if router is not None and router.version == version:
+                return router
+            if router is not None:
+                logger.info(
+                    "Index version changed in %s (%s -> %s), reopening",
+                    persist_dir, router.version, version,
+                )
+            router = DoctrineIndexRouter(
+                persist_dir=persist_dir,
+                embed_model=self._get_embed_model(),
+            )
+            self._routers[persist_dir] = router
+            return router
+
+    def warm(self, persist_dir: Path | None = None) -> bool:
+        """Open the index, page in its vectors and run one throwaway query."""
+        try:
+            self.get(persist_dir).warm(query=_WARMUP_QUERY)
+        except Exception:
+            logger.warning("Index warmup failed", exc_info=True)
+            return False
+        logger.info("Index warmed up")
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routers.clear()
+
+    def _get_embed_model(self) -> BaseEmbedding:
+        if self._embed_model is None:
+            self._embed_model = create_embed_model()
+        return self._embed_model
+
+
+_registry = IndexRegistry()
+
+
+def get_index_router(persist_dir: Path | None = None) -> DoctrineIndexRouter:
+    return _registry.get(persist_dir)
+
+
+def warm_index(persist_dir: Path | None = None) -> bool:
+    return _registry.warm(persist_dir)
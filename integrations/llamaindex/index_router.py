@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+from llama_index.core import VectorStoreIndex
+from llama_index.core.base.base_query_engine import BaseQueryEngine
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle
+from llama_index.core.vector_stores import FilterOperator, MetadataFilter, MetadataFilters
+from llama_index.core.vector_stores.types import BasePydanticVectorStore, VectorStoreQuery
+
+from core.config.paths import Paths
+from core.domain.constants import DEFAULT_RAG_RESPONSE_MODE, METADATA_KEY_DOCTRINE_SLUG
+from integrations.llamaindex.index_builder import (
+    create_embed_model,
+    list_collection_slugs,
+    load_or_build_index,
+    uses_partitioned_layout,
+)
+from integrations.llamaindex.index_manifest import current_manifest_version, read_index_manifest
+from integrations.llamaindex.mmap_vector_store import MmapVectorStore
+
+logger = logging.getLogger(__name__)
+
+
+class DoctrineIndexRouter:
+    """Routes per-doctrine and cross-doctrine queries to the right vector store.
+
+    In the shared layout every query hits the single collection with a
+    ``doctrine_slug`` filter. In the partitioned layout each doctrine has
+    its own collection, so a per-doctrine query only touches that
+    doctrine's vectors and cross-doctrine queries embed once and fan out.
+    ``version`` is the manifest version read when the router was opened,
+    so a router kept past a reindex reports the version it still serves.
+    """
+
+    def __init__(
+        self,
+        *,
+        index: VectorStoreIndex | None = None,
+        persist_dir: Path | None = None,
+        embed_model: BaseEmbedding | None = None,
+    ) -> None:
+        self._shared = index
+        self._injected = index is not None
+        self._persist_dir = persist_dir or Paths.VECTOR_DIR
+        self._partitioned = index is None and uses_partitioned_layout()
+        self._partitions: dict[str, VectorStoreIndex] = {}
+        self._embed_model = embed_model
+        self._slugs: list[str] | None = None
+        self._lock = threading.Lock()
+        self._version = None if self._injected else current_manifest_version(self._persist_dir)
+
+    @property
+    def persist_dir(self) -> Path:
+        return self._persist_dir
+
+    @property
+    def version(self) -> str | None:
+        """Manifest version the router was opened at; None for an injected index."""
+        return self._version
+
+    @property
+    def slugs(self) -> list[str]:
+        if self._slugs is None:
+            self._slugs = sorted(_discover_slugs(self._persist_dir))
+        return self._slugs
+
+    def retriever_for(self, slug: str, *, top_k: int) -> BaseRetriever:
+        if self._partitioned:
+            return self._partition(slug).as_retriever(similarity_top_k=top_k)
+        return self._shared_index().as_retriever(
+            similarity_top_k=top_k,
+            filters=slug_filters([slug]),
+        )
+
+    def query_engine_for(self, slug: str, *, top_k: int) -> BaseQueryEngine:
+        if self._partitioned:
+            return self._partition(slug).as_query_engine(
+                similarity_top_k=top_k,
+                response_mode=DEFAULT_RAG_RESPONSE_MODE,
+            )
+        return self._shared_index().as_query_engine(
+            similarity_top_k=top_k,
+            filters=slug_filters([slug]),
+            response_mode=DEFAULT_RAG_RESPONSE_MODE,
+        )
+
+    def retrieve(self, query: str, *, top_k: int) -> list[NodeWithScore]:
+        if not self._partitioned:
+            return self._shared_index().as_retriever(similarity_top_k=top_k).retrieve(query)
+        grouped = self.retrieve_grouped(query, slugs=self.slugs, top_k=top_k)
+        merged = [node for nodes in grouped.values() for node in nodes]
+        return sorted(merged, key=lambda n: n.score or 0.0, reverse=True)[:top_k]
+
+    def retrieve_many(self, queries: list[str], *, top_k: int) -> list[list[NodeWithScore]]:
+        """Top-k nodes for each query from one batched embedding call.
+
+        Queries are embedded as text, which is identical to query embedding
+        for the OpenAI models used here.
+        """
+        if not queries:
+            return []
+        embeddings = self._get_embed_model().get_text_embedding_batch(queries)
+        indexes = (
+            [self._partition(slug) for slug in self.slugs]
+            if self._partitioned
+            else [self._shared_index()]
+        )
+        merged: list[list[NodeWithScore]] = [[] for _ in queries]
+        for index in indexes:
+            batch = _query_batch(index.vector_store, embeddings, top_k=top_k)
+            for hits, nodes in zip(merged, batch):
+                hits.extend(nodes)
+        return [
+            sorted(hits, key=lambda n: n.score or 0.0, reverse=True)[:top_k]
+            for hits in merged
+        ]
+
+    def retrieve_grouped(
+        self,
+        query: str,
+        *,
+        slugs: list[str],
+        top_k: int,
+    ) -> dict[str, list[NodeWithScore]]:
+        """Top-k nodes per doctrine, embedding the query only once."""
+        if not slugs:
+            return {}
+        if not self._partitioned:
+            retriever = self._shared_index().as_retriever(
+                similarity_top_k=top_k * len(slugs),
+                filters=slug_filters(slugs),
+            )
+            return _group_by_slug(retriever.retrieve(query), top_k=top_k)
+
+        bundle = QueryBundle(
+            query_str=query,
+            embedding=self._get_embed_model().get_query_embedding(query),
+        )
+        grouped: dict[str, list[NodeWithScore]] = {}
+        for slug in slugs:
+            nodes = self.retriever_for(slug, top_k=top_k).retrieve(bundle)
+            if nodes:
+                grouped[slug] = nodes
+        return grouped
+
+    def warm(self, *, query: str) -> None:
+        """Open every store, page memory-mapped vectors in and run one query."""
+        indexes = (
+            [self._partition(slug) for slug in self.slugs]
+            if self._partitioned
+            else [self._shared_index()]
+        )
+        for index in indexes:
+            if isinstance(index.vector_store, MmapVectorStore):
+                index.vector_store.touch()
+        self.retrieve(query, top_k=1)
+
+    def _shared_index(self) -> VectorStoreIndex:
+        with self._lock:
+            if self._shared is None:
+                self._shared = load_or_build_index(
+                    persist_dir=self._persist_dir,
+                    embed_model=self._embed_model_locked(),
+                )
+            return self._shared
+
+    def _partition(self, slug: str) -> VectorStoreIndex:
+        with self._lock:
+            if slug not in self._partitions:
+                self._partitions[slug] = load_or_build_index(
+                    persist_dir=self._persist_dir,
+                    partition=slug,
+                    embed_model=self._embed_model_locked(),
+                )
+            return self._partitions[slug]
+
+    def _get_embed_model(self) -> BaseEmbedding:
+        with self._lock:
+            return self._embed_model_locked()
+
+    def _embed_model_locked(self) -> BaseEmbedding:
+        if self._embed_model is None:
+            self._embed_model = create_embed_model()
+        return self._embed_model
+
+
+def _query_batch(
+    store: BasePydanticVectorStore,
+    embeddings: list[list[float]],
+    *,
+    top_k: int,
+) -> list[list[NodeWithScore]]:
+    if isinstance(store, MmapVectorStore):
+        results = store.query_many(embeddings, top_k=top_k)
+    else:
+        results = [
+            store.query(VectorStoreQuery(query_embedding=embedding, similarity_top_k=top_k))
+            for embedding in embeddings
+        ]
+    return [
+        [
+            NodeWithScore(node=node, score=score)
+            for node, score in zip(result.nodes or [], result.similarities or [])
+        ]
+        for result in results
+    ]
+
+
+def slug_filters(slugs: list[str]) -> MetadataFilters:
+    if len(slugs) == 1:
+        return MetadataFilters(filters=[MetadataFilter(key=METADATA_KEY_DOCTRINE_SLUG, value=slugs[0])])
+    return MetadataFilters(
+        filters=[
+            MetadataFilter(key=METADATA_KEY_DOCTRINE_SLUG, value=slugs, operator=FilterOperator.IN),
+        ]
+    )
+
+
+def _discover_slugs(persist_dir: Path) -> set[str]:
+    manifest = read_index_manifest(persist_dir)
+    if manifest is not None:
+        return set(manifest.slugs)
+    logger.info("No index manifest in %s, querying collection metadata", persist_dir)
+    try:
+        return list_collection_slugs(persist_dir=persist_dir)
+    except Exception:
+        logger.warning("Could not list doctrine slugs from collection", exc_info=True)
+        return set()
+
+
+def _group_by_slug(
+    nodes: list[NodeWithScore],
+    *,
+    top_k: int,
+) -> dict[str, list[NodeWithScore]]:
+    grouped: dict[str, list[NodeWithScore]] = defaultdict(list)
+    for node_with_score in nodes:
+        slug = (node_with_score.node.metadata or {}).get(METADATA_KEY_DOCTRINE_SLUG, "")
+        if slug and len(grouped[slug]) < top_k:
+            grouped[slug].append(node_with_score)
+    return dict(grouped)
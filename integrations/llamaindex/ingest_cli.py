@@ -19,16 +19,17 @@ def main() -> None:
     logger.info("Starting doctrine ingestion pipeline")
     start = time.monotonic()
 
-    from integrations.llamaindex.doctrine_reader import read_doctrine_documents
-    from integrations.llamaindex.index_builder import load_or_build_index
+    from integrations.llamaindex.doctrine_reader import read_cleaned_documents
+    from integrations.llamaindex.index_builder import build_doctrine_index
 
-    documents = read_doctrine_documents()
+    # Same source as the pipeline's index stage, so both build identical nodes.
+    documents = read_cleaned_documents()
     if not documents:
         logger.error("No documents found — aborting")
         sys.exit(1)
 
     logger.info("Ingested %d documents, building vector index...", len(documents))
-    index = load_or_build_index(documents=documents)
+    build_doctrine_index(documents)
 
     elapsed = time.monotonic() - start
     logger.info(
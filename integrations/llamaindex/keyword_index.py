@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from llama_index.core.schema import BaseNode, NodeWithScore, TextNode
+
+from core.domain.constants import METADATA_KEY_DOCTRINE_SLUG
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FILENAME = "bm25_index.json"
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+_K1 = 1.5
+_B = 0.75
+
+
+class BM25KeywordIndex:
+    """In-process inverted index with Okapi BM25 scoring over index nodes.
+
+    Needs no embedding call, so it serves both the offline keyword mode and
+    the lexical half of hybrid retrieval.
+    """
+
+    def __init__(
+        self,
+        *,
+        docs: list[dict],
+        postings: dict[str, list[tuple[int, int]]],
+    ) -> None:
+        self._docs = docs
+        self._postings = postings
+        total_length = sum(d["length"] for d in docs)
+        self._avgdl = total_length / len(docs) if docs else 0.0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @classmethod
+    def from_nodes(cls, nodes: list[BaseNode]) -> BM25KeywordIndex:
+        docs: list[dict] = []
+        postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for doc_idx, node in enumerate(nodes):
+            text = node.get_content()
+            counts = Counter(tokenize(text))
+            docs.append({
+                "id": node.node_id,
+                "text": text,
+                "metadata": node.metadata or {},
+                "length": sum(counts.values()),
+            })
+            for term, tf in counts.items():
+                postings[term].append((doc_idx, tf))
+        return cls(docs=docs, postings=dict(postings))
+
+    def save(self, persist_dir: Path) -> Path:
+        path = keyword_index_path(persist_dir)
+        payload = {"docs": self._docs, "postings": self._postings}
+        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        logger.info("Saved BM25 index (%d nodes, %d terms) to %s", len(self), len(self._postings), path)
+        return path
+
+    @classmethod
+    def load(cls, persist_dir: Path) -> BM25KeywordIndex | None:
+        path = keyword_index_path(persist_dir)
+        if not path.exists():
+            return None
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        postings = {
+            term: [(doc_idx, tf) for doc_idx, tf in entries]
+            for term, entries in raw["postings"].items()
+        }
+        return cls(docs=raw["docs"], postings=postings)
+
+    def search(
+        self,
+        query: str,
+        *,
+        top_k: int,
+        slugs: set[str] | None = None,
+    ) -> list[NodeWithScore]:
+        scores = self._score(query, slugs=slugs)
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        if not best:
+            return []
+        top_score = best[0][1]
+        return [
+            NodeWithScore(node=self._to_node(doc_idx), score=score / top_score)
+            for doc_idx, score in best
+        ]
+
+    def _score(self, query: str, *, slugs: set[str] | None) -> dict[int, float]:
+        n_docs = len(self._docs)
+        scores: dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            entries = self._postings.get(term)
+            if not entries:
+                continue
+            idf = math.log(1.0 + (n_docs - len(entries) + 0.5) / (len(entries) + 0.5))
+            for doc_idx, tf in entries:
+                doc = self._docs[doc_idx]
+                if slugs is not None and doc["metadata"].get(METADATA_KEY_DOCTRINE_SLUG) not in slugs:
+                    continue
+                norm = _K1 * (1.0 - _B + _B * doc["length"] / self._avgdl)
+                scores[doc_idx] += idf * tf * (_K1 + 1.0) / (tf + norm)
+        return scores
+
+    def _to_node(self, doc_idx: int) -> TextNode:
+        doc = self._docs[doc_idx]
+        return TextNode(id_=doc["id"], text=doc["text"], metadata=doc["metadata"])
+
+
+def keyword_index_path(persist_dir: Path) -> Path:
+    return persist_dir / _INDEX_FILENAME
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
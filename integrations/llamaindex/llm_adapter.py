@@ -52,16 +52,17 @@ class MasxLLMBridge(CustomLLM):
         prompt: str,
         **kwargs,
     ) -> Generator[CompletionResponse, None, None]:
-        text = self._llm_port.call(prompt)
-        yield CompletionResponse(text=text, delta=text)
+        text = ""
+        for delta in self._llm_port.call_stream(prompt):
+            text += delta
+            yield CompletionResponse(text=text, delta=delta)
 
     def chat(
         self,
         messages: list[ChatMessage],
         **kwargs,
     ) -> ChatResponse:
-        combined = "\n".join(m.content or "" for m in messages)
-        text = self._llm_port.call(combined)
+        text = self._llm_port.call(_combine(messages))
         return ChatResponse(message=ChatMessage(role="assistant", content=text))
 
     def stream_chat(
@@ -69,5 +70,14 @@ class MasxLLMBridge(CustomLLM):
         messages: list[ChatMessage],
         **kwargs,
     ) -> Generator[ChatResponse, None, None]:
-        response = self.chat(messages, **kwargs)
-        yield response
+        text = ""
+        for delta in self._llm_port.call_stream(_combine(messages)):
+            text += delta
+            yield ChatResponse(
+                message=ChatMessage(role="assistant", content=text),
+                delta=delta,
+            )
+
+
+def _combine(messages: list[ChatMessage]) -> str:
+    return "\n".join(m.content or "" for m in messages)
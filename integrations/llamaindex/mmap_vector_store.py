@@ -0,0 +1,521 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import uuid
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.schema import BaseNode
+from llama_index.core.vector_stores.types import (
+    BasePydanticVectorStore,
+    FilterCondition,
+    FilterOperator,
+    MetadataFilters,
+    VectorStoreQuery,
+    VectorStoreQueryResult,
+)
+from llama_index.core.vector_stores.utils import metadata_dict_to_node, node_to_metadata_dict
+
+from core.domain.constants import METADATA_KEY_DOCTRINE_SLUG, EmbeddingPrecision
+
+logger = logging.getLogger(__name__)
+
+_EMBEDDINGS_PREFIX = "embeddings"
+_SCALES_PREFIX = "scales"
+_MANIFEST_FILE = "store.json"
+_LEGACY_ROWS_FILE = "rows.json"
+_INT8_MAX = 127.0
+_OFFSET_DTYPE = np.dtype(np.int64)
+_SCALE_DTYPE = np.dtype(np.float32)
+# Variable-length row columns, each a byte blob plus an offsets array into it.
+_COLUMNS = ("ids", "texts", "metadata")
+_GENERATION_PATTERN = re.compile(
+    rf"^(?:{'|'.join((_EMBEDDINGS_PREFIX, _SCALES_PREFIX, *_COLUMNS))})(?:_offsets)?-[0-9a-f]{{32}}\.(?:npy|bin)$",
+)
+
+
+class MmapVectorStore(BasePydanticVectorStore):
+    """Read-optimised local vector store where every column is memory-mapped.
+
+    Embeddings are L2-normalised and stored as a raw float16 matrix, or
+    int8 with a per-row scale, and searched by brute force. Ids, texts and
+    metadata are byte blobs with an offsets file each, so opening a store
+    only parses the small ``store.json`` manifest and a row is decoded when
+    it is returned. Worker processes opening the same directory share pages
+    via the OS page cache.
+
+    ``add`` appends rows past the committed end of each file and then
+    atomically replaces the manifest with the new row count, so a crash
+    mid-append leaves the previous rows intact; the torn tail is truncated
+    by the next append. The manifest maps each ``doctrine_slug`` to its row
+    ranges; deletes only drop ranges, and the files are compacted into a
+    new generation once dead rows outnumber live ones.
+    """
+
+    stores_text: bool = True
+    is_embedding_query: bool = True
+
+    persist_dir: str
+    precision: EmbeddingPrecision = EmbeddingPrecision.FLOAT16
+
+    _generation: str | None = PrivateAttr(default=None)
+    _count: int = PrivateAttr(default=0)
+    _dim: int = PrivateAttr(default=0)
+    _matrix: np.ndarray | None = PrivateAttr(default=None)
+    _scales: np.ndarray | None = PrivateAttr(default=None)
+    _blobs: dict[str, tuple[np.ndarray, np.ndarray]] = PrivateAttr(default_factory=dict)
+    _slug_ranges: dict[str, list[tuple[int, int]]] = PrivateAttr(default_factory=dict)
+    _pending: list[BaseNode] = PrivateAttr(default_factory=list)
+
+    @classmethod
+    def from_persist_dir(
+        cls,
+        persist_dir: Path,
+        *,
+        precision: EmbeddingPrecision = EmbeddingPrecision.FLOAT16,
+    ) -> MmapVectorStore:
+        store = cls(persist_dir=str(persist_dir), precision=precision)
+        store._load()
+        return store
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "MmapVectorStore"
+
+    @property
+    def client(self) -> None:
+        return None
+
+    @property
+    def slugs(self) -> list[str]:
+        self._flush()
+        return sorted(self._slug_ranges)
+
+    def add(self, nodes: Sequence[BaseNode], **add_kwargs: Any) -> list[str]:
+        self._pending.extend(nodes)
+        return [node.node_id for node in nodes]
+
+    def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
+        self._flush()
+        dead = {
+            int(i) for i in self._live_rows()
+            if self._row_metadata(int(i)).get("ref_doc_id") == ref_doc_id
+        }
+        if dead:
+            self._drop_rows(dead)
+
+    def delete_slug(self, slug: str) -> None:
+        """Drop every row of one doctrine by forgetting its row ranges."""
+        self._flush()
+        if slug in self._slug_ranges:
+            self._drop_rows({i for start, end in self._slug_ranges[slug] for i in range(start, end)})
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self._rewrite([])
+
+    def persist(self, persist_path: str | None = None, fs: Any = None) -> None:
+        self._flush()
+
+    def touch(self) -> None:
+        """Fault every page of the embedding matrix into the page cache."""
+        self._flush()
+        if self._matrix is not None and self._matrix.size:
+            np.sum(self._matrix, dtype=np.float32)
+
+    def get_nodes(
+        self,
+        node_ids: list[str] | None = None,
+        filters: MetadataFilters | None = None,
+    ) -> list[BaseNode]:
+        self._flush()
+        rows = self._candidate_rows(filters)
+        wanted = set(node_ids) if node_ids else None
+        return [
+            self._to_node(int(i)) for i in rows
+            if wanted is None or self._row_id(int(i)) in wanted
+        ]
+
+    def query(self, query: VectorStoreQuery, **kwargs: Any) -> VectorStoreQueryResult:
+        if query.query_embedding is None:
+            return VectorStoreQueryResult(nodes=[], similarities=[], ids=[])
+        return self.query_many(
+            [query.query_embedding],
+            top_k=query.similarity_top_k,
+            filters=query.filters,
+        )[0]
+
+    def query_many(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        *,
+        top_k: int,
+        filters: MetadataFilters | None = None,
+    ) -> list[VectorStoreQueryResult]:
+        """Score several query embeddings against the candidates in one matrix product."""
+        self._flush()
+        rows = self._candidate_rows(filters)
+        if rows.size == 0 or not embeddings:
+            return [VectorStoreQueryResult(nodes=[], similarities=[], ids=[]) for _ in embeddings]
+
+        scores = self._scores(rows, _normalize(np.asarray(embeddings, dtype=np.float32)))
+        k = min(top_k, rows.size)
+        return [self._top_k(rows, column, k) for column in scores.T]
+
+    def _top_k(self, rows: np.ndarray, scores: np.ndarray, k: int) -> VectorStoreQueryResult:
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        hits = rows[top]
+        return VectorStoreQueryResult(
+            nodes=[self._to_node(int(i)) for i in hits],
+            similarities=scores[top].tolist(),
+            ids=[self._row_id(int(i)) for i in hits],
+        )
+
+    def _scores(self, rows: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        block = self._contiguous_block(rows)
+        scores = block.astype(np.float32) @ queries.T
+        if self.precision == EmbeddingPrecision.INT8:
+            scores *= self._scales[rows][:, None]
+        return scores
+
+    def _contiguous_block(self, rows: np.ndarray) -> np.ndarray:
+        if rows.size and rows[-1] - rows[0] + 1 == rows.size:
+            return self._matrix[rows[0]:rows[-1] + 1]
+        return self._matrix[rows]
+
+    def _candidate_rows(self, filters: MetadataFilters | None) -> np.ndarray:
+        rows = self._live_rows()
+        if not filters or not filters.filters:
+            return rows
+        if filters.condition == FilterCondition.OR:
+            return np.array([i for i in rows if _matches_any(self._row_metadata(i), filters)], dtype=int)
+
+        for f in filters.filters:
+            if isinstance(f, MetadataFilters):
+                rows = np.array([i for i in rows if _matches_all(self._row_metadata(i), f)], dtype=int)
+            elif f.key == METADATA_KEY_DOCTRINE_SLUG and f.operator in (FilterOperator.EQ, FilterOperator.IN):
+                rows = np.intersect1d(rows, self._slug_rows(f.value), assume_unique=True)
+            else:
+                rows = np.array([i for i in rows if _matches(self._row_metadata(i), f)], dtype=int)
+        return rows
+
+    def _live_rows(self) -> np.ndarray:
+        return self._slug_rows(list(self._slug_ranges))
+
+    def _slug_rows(self, value: Any) -> np.ndarray:
+        slugs = value if isinstance(value, list) else [value]
+        ranges = [r for s in slugs for r in self._slug_ranges.get(s, [])]
+        if not ranges:
+            return np.empty(0, dtype=int)
+        return np.concatenate([np.arange(start, end) for start, end in sorted(ranges)])
+
+    def _to_node(self, row: int) -> BaseNode:
+        node = metadata_dict_to_node(self._row_metadata(row))
+        node.set_content(self._cell("texts", row))
+        return node
+
+    def _row_id(self, row: int) -> str:
+        return self._cell("ids", row)
+
+    def _row_metadata(self, row: int) -> dict:
+        return json.loads(self._cell("metadata", row))
+
+    def _cell(self, column: str, row: int) -> str:
+        blob, offsets = self._blobs[column]
+        return bytes(blob[offsets[row]:offsets[row + 1]]).decode("utf-8")
+
+    def _rows(self, indices: Iterable[int]) -> list[tuple[str, str, dict, np.ndarray]]:
+        vectors = self._dequantized()
+        return [
+            (self._row_id(i), self._cell("texts", i), self._row_metadata(i), vectors[i])
+            for i in indices
+        ]
+
+    def _dequantized(self) -> np.ndarray:
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        matrix = np.asarray(self._matrix, dtype=np.float32)
+        if self.precision == EmbeddingPrecision.INT8:
+            matrix = matrix * self._scales[:, None]
+        return matrix
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        rows = [
+            (
+                node.node_id,
+                node.get_content(),
+                node_to_metadata_dict(node, remove_text=True, flat_metadata=False),
+                np.asarray(node.get_embedding(), dtype=np.float32),
+            )
+            for node in self._pending
+        ]
+        self._pending.clear()
+        if self._generation is None:
+            self._rewrite(rows)
+        else:
+            self._append(rows, generation=self._generation)
+
+    def _rewrite(self, rows: list[tuple[str, str, dict, np.ndarray]]) -> None:
+        """Write ``rows`` as a fresh generation and switch the manifest to it."""
+        directory = Path(self.persist_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        generation = uuid.uuid4().hex
+        self._append(rows, generation=generation, fresh=True)
+        _remove_stale_generations(directory, keep=generation)
+
+    def _append(
+        self,
+        rows: list[tuple[str, str, dict, np.ndarray]],
+        *,
+        generation: str,
+        fresh: bool = False,
+    ) -> None:
+        rows.sort(key=lambda row: row[2].get(METADATA_KEY_DOCTRINE_SLUG, ""))
+        directory = Path(self.persist_dir)
+        count = 0 if fresh else self._count
+        dim = (0 if fresh else self._dim) or (len(rows[0][3]) if rows else 0)
+        if rows and any(len(row[3]) != dim for row in rows):
+            msg = f"MmapVectorStore expects {dim}-dimensional embeddings"
+            raise ValueError(msg)
+        if rows:
+            matrix = _normalize(np.stack([row[3] for row in rows]))
+            self._append_matrix(directory, matrix, generation=generation, count=count, dim=dim)
+            for column, values in zip(_COLUMNS, zip(*[row[:3] for row in rows])):
+                self._append_column(directory, column, values, generation=generation, count=count)
+        slug_ranges = {} if fresh else {slug: list(ranges) for slug, ranges in self._slug_ranges.items()}
+        for offset, row in enumerate(rows):
+            _extend_ranges(slug_ranges, row[2].get(METADATA_KEY_DOCTRINE_SLUG, ""), count + offset)
+        self._write_manifest(generation=generation, count=count + len(rows), dim=dim, slug_ranges=slug_ranges)
+        logger.info("Persisted %d vectors (%s) to %s", len(rows), self.precision.value, directory)
+        self._load()
+
+    def _append_matrix(
+        self,
+        directory: Path,
+        matrix: np.ndarray,
+        *,
+        generation: str,
+        count: int,
+        dim: int,
+    ) -> None:
+        if self.precision == EmbeddingPrecision.INT8:
+            quantized, scales = _quantize_int8(matrix)
+            _append_bytes(
+                directory / _generation_file(_SCALES_PREFIX, generation),
+                committed=count * _SCALE_DTYPE.itemsize,
+                data=scales.astype(_SCALE_DTYPE).tobytes(),
+            )
+        else:
+            quantized = matrix.astype(np.float16)
+        _append_bytes(
+            directory / _generation_file(_EMBEDDINGS_PREFIX, generation),
+            committed=count * dim * quantized.dtype.itemsize,
+            data=quantized.tobytes(),
+        )
+
+    def _append_column(
+        self,
+        directory: Path,
+        column: str,
+        values: Sequence[str | dict],
+        *,
+        generation: str,
+        count: int,
+    ) -> None:
+        encoded = [
+            (value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)).encode("utf-8")
+            for value in values
+        ]
+        base = int(self._blobs[column][1][count]) if count else 0
+        offsets = base + np.cumsum([0, *map(len, encoded)], dtype=_OFFSET_DTYPE)
+        _append_bytes(
+            directory / _generation_file(column, generation),
+            committed=base,
+            data=b"".join(encoded),
+        )
+        # The leading offset is already stored unless this is the first append.
+        _append_bytes(
+            directory / _generation_file(f"{column}_offsets", generation),
+            committed=(count + 1) * _OFFSET_DTYPE.itemsize if count else 0,
+            data=(offsets[1:] if count else offsets).tobytes(),
+        )
+
+    def _drop_rows(self, dead: set[int]) -> None:
+        live = [i for i in self._live_rows().tolist() if i not in dead]
+        if self._count - len(live) > len(live):
+            self._rewrite(self._rows(live))
+            return
+        slug_ranges: dict[str, list[tuple[int, int]]] = {}
+        for slug, ranges in self._slug_ranges.items():
+            for start, end in ranges:
+                for row in range(start, end):
+                    if row not in dead:
+                        _extend_ranges(slug_ranges, slug, row)
+        self._write_manifest(
+            generation=self._generation,
+            count=self._count,
+            dim=self._dim,
+            slug_ranges=slug_ranges,
+        )
+        self._load()
+
+    def _write_manifest(
+        self,
+        *,
+        generation: str,
+        count: int,
+        dim: int,
+        slug_ranges: dict[str, list[tuple[int, int]]],
+    ) -> None:
+        # Replacing the manifest is the commit point for appends, deletes and rewrites.
+        manifest = {
+            "generation": generation,
+            "precision": self.precision.value,
+            "count": count,
+            "dim": dim,
+            "slug_ranges": slug_ranges,
+        }
+        _atomic_write_text(Path(self.persist_dir) / _MANIFEST_FILE, json.dumps(manifest, ensure_ascii=False))
+
+    def _load(self) -> None:
+        directory = Path(self.persist_dir)
+        manifest_path = directory / _MANIFEST_FILE
+        if not manifest_path.exists():
+            if (directory / _LEGACY_ROWS_FILE).exists():
+                self._migrate_legacy_rows(directory)
+            return
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        self.precision = EmbeddingPrecision(manifest["precision"])
+        self._generation = manifest["generation"]
+        self._count, self._dim = manifest["count"], manifest["dim"]
+        self._slug_ranges = {
+            slug: [tuple(r) for r in ranges] for slug, ranges in manifest["slug_ranges"].items()
+        }
+        generation, count = self._generation, self._count
+        matrix_dtype = np.int8 if self.precision == EmbeddingPrecision.INT8 else np.float16
+        self._matrix = _map(
+            directory / _generation_file(_EMBEDDINGS_PREFIX, generation),
+            matrix_dtype, (count, self._dim),
+        )
+        if self.precision == EmbeddingPrecision.INT8:
+            self._scales = _map(directory / _generation_file(_SCALES_PREFIX, generation), _SCALE_DTYPE, (count,))
+        self._blobs = {}
+        for column in _COLUMNS:
+            offsets = _map(
+                directory / _generation_file(f"{column}_offsets", generation),
+                _OFFSET_DTYPE, (count + 1 if count else 0,),
+            )
+            blob_size = int(offsets[-1]) if count else 0
+            blob = _map(directory / _generation_file(column, generation), np.uint8, (blob_size,))
+            self._blobs[column] = (blob, offsets)
+
+    def _migrate_legacy_rows(self, directory: Path) -> None:
+        # Stores from before the columnar layout kept every row in one rows.json.
+        legacy_path = directory / _LEGACY_ROWS_FILE
+        columns = json.loads(legacy_path.read_text(encoding="utf-8"))
+        self.precision = EmbeddingPrecision(columns["precision"])
+        generation = columns.get("generation")
+        legacy = [
+            directory / (f"{prefix}-{generation}.npy" if generation else f"{prefix}.npy")
+            for prefix in (_EMBEDDINGS_PREFIX, _SCALES_PREFIX)
+        ]
+        matrix = np.load(legacy[0]).astype(np.float32)
+        if self.precision == EmbeddingPrecision.INT8:
+            matrix = matrix * np.load(legacy[1])[:, None]
+        logger.info("Migrating %d rows in %s to the columnar layout", len(columns["ids"]), directory)
+        self._rewrite(list(zip(columns["ids"], columns["texts"], columns["metadata"], matrix)))
+        for path in (legacy_path, *legacy):
+            path.unlink(missing_ok=True)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def _quantize_int8(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    scales = np.abs(matrix).max(axis=1, initial=0.0) / _INT8_MAX
+    scales = np.where(scales == 0, 1.0, scales).astype(np.float32)
+    return np.round(matrix / scales[:, None]).astype(np.int8), scales
+
+
+def _matches(metadata: dict, f: Any) -> bool:
+    value = metadata.get(f.key)
+    if f.operator == FilterOperator.EQ:
+        return value == f.value
+    if f.operator == FilterOperator.NE:
+        return value != f.value
+    if f.operator == FilterOperator.IN:
+        return value in f.value
+    if f.operator == FilterOperator.NIN:
+        return value not in f.value
+    msg = f"MmapVectorStore does not support filter operator {f.operator}"
+    raise ValueError(msg)
+
+
+def _matches_all(metadata: dict, filters: MetadataFilters) -> bool:
+    if filters.condition == FilterCondition.OR:
+        return _matches_any(metadata, filters)
+    return all(
+        _matches_all(metadata, f) if isinstance(f, MetadataFilters) else _matches(metadata, f)
+        for f in filters.filters
+    )
+
+
+def _matches_any(metadata: dict, filters: MetadataFilters) -> bool:
+    return any(
+        _matches_all(metadata, f) if isinstance(f, MetadataFilters) else _matches(metadata, f)
+        for f in filters.filters
+    )
+
+
+def _extend_ranges(ranges: dict[str, list[tuple[int, int]]], slug: str, row: int) -> None:
+    runs = ranges.setdefault(slug, [])
+    if runs and runs[-1][1] == row:
+        runs[-1] = (runs[-1][0], row + 1)
+    else:
+        runs.append((row, row + 1))
+
+
+def _generation_file(prefix: str, generation: str) -> str:
+    return f"{prefix}-{generation}.bin"
+
+
+def _remove_stale_generations(directory: Path, *, keep: str) -> None:
+    for path in directory.iterdir():
+        # Only finished generation files; temp files of an in-flight write never match.
+        if _GENERATION_PATTERN.match(path.name) and not path.name.endswith(f"-{keep}.bin"):
+            try:
+                path.unlink()
+            except OSError:
+                # Still mapped by a reader on some platforms; removed on the next rewrite.
+                logger.debug("Could not remove stale vector file %s", path, exc_info=True)
+
+
+def _append_bytes(path: Path, *, committed: int, data: bytes) -> None:
+    """Write ``data`` right after the first ``committed`` bytes, dropping any torn tail."""
+    with open(path, "r+b" if path.exists() else "wb") as f:
+        f.truncate(committed)
+        f.seek(committed)
+        f.write(data)
+
+
+def _map(path: Path, dtype: Any, shape: tuple[int, ...]) -> np.ndarray:
+    if not all(shape):
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape)
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+
+from cachetools import TTLCache
+
+from core.domain.constants import (
+    DEFAULT_EVIDENCE_CACHE_SIZE,
+    DEFAULT_EVIDENCE_CACHE_TTL_SECONDS,
+)
+from core.domain.forecast_models import Evidence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class QueryResultCache:
+    """LRU + TTL cache of retrieval results, cleared when the index version changes.
+
+    Callers pass the version of the index they actually query. A lookup at
+    a new version clears the cache; results retrieved at any other version
+    than the cache's current one are not stored.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = DEFAULT_EVIDENCE_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_EVIDENCE_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._entries: TTLCache[tuple[str, int], list[Evidence]] = TTLCache(
+            maxsize=maxsize, ttl=ttl_seconds,
+        )
+        self._version: str | None = None
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def get(self, query: str, *, top_k: int, version: str | None) -> list[Evidence] | None:
+        key = _cache_key(query, top_k)
+        with self._lock:
+            self._check_version(version)
+            results = self._entries.get(key)
+            if results is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            return list(results)
+
+    def put(
+        self,
+        query: str,
+        *,
+        top_k: int,
+        results: list[Evidence],
+        version: str | None,
+    ) -> None:
+        with self._lock:
+            if version != self._version:
+                logger.debug("Not caching results retrieved at stale index version %s", version)
+                return
+            self._entries[_cache_key(query, top_k)] = list(results)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _check_version(self, version: str | None) -> None:
+        if version == self._version:
+            return
+        if self._entries:
+            logger.info("Index version changed to %s, clearing query cache", version)
+            self._entries.clear()
+            self.stats.invalidations += 1
+        self._version = version
+
+
+def _cache_key(query: str, top_k: int) -> tuple[str, int]:
+    return " ".join(query.lower().split()), top_k
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from llama_index.core.schema import NodeWithScore
+
+_RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[NodeWithScore]],
+    *,
+    top_k: int,
+    k: int = _RRF_K,
+) -> list[NodeWithScore]:
+    """Merge ranked lists by summing 1 / (k + rank); scores are rescaled to [0, 1]."""
+    fused: dict[str, float] = {}
+    nodes: dict[str, NodeWithScore] = {}
+    for ranking in rankings:
+        for rank, node_with_score in enumerate(ranking, start=1):
+            node_id = node_with_score.node.node_id
+            fused[node_id] = fused.get(node_id, 0.0) + 1.0 / (k + rank)
+            nodes.setdefault(node_id, node_with_score)
+
+    ordered = sorted(fused, key=fused.__getitem__, reverse=True)[:top_k]
+    if not ordered:
+        return []
+    top_score = fused[ordered[0]]
+    return [
+        NodeWithScore(node=nodes[node_id].node, score=fused[node_id] / top_score)
+        for node_id in ordered
+    ]
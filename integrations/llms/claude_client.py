@@ -1,4 +1,6 @@
+import json
 import logging
+from collections.abc import Iterator
 
 import httpx
 
@@ -12,6 +14,7 @@ from core.domain.exceptions import LLMClientError
 from core.domain.models import LLMResponse
 from core.llm.json_extraction import extract_json_array
 from .base import BaseLLMClient, LLMClientConfig
+from .sse import iter_sse_data
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +63,28 @@ class ClaudeLLMClient(BaseLLMClient):
         except httpx.HTTPError as e:
             raise LLMClientError(f"Claude API call failed: {e}") from e
 
+    def call_stream(self, prompt: str, system_prompt: str | None = None) -> Iterator[str]:
+        payload = {**self._build_payload(prompt, system_prompt), "stream": True}
+        try:
+            with httpx.stream(
+                "POST",
+                self._url,
+                headers=self._build_headers(),
+                json=payload,
+                timeout=_TIMEOUT_SECONDS,
+            ) as resp:
+                resp.raise_for_status()
+                for data in iter_sse_data(resp.iter_lines()):
+                    event = json.loads(data)
+                    if event.get("type") == "error":
+                        raise LLMClientError(f"Claude stream failed: {event.get('error')}")
+                    if event.get("type") == "content_block_delta":
+                        text = event["delta"].get("text")
+                        if text:
+                            yield text
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            raise LLMClientError(f"Claude API stream failed: {e}") from e
+
     def call_batch(
         self,
         batch_texts: list[str],
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterator
 
 import cohere
 
@@ -30,6 +31,20 @@ class CohereLLMClient(BaseLLMClient):
         except Exception as e:
             raise LLMClientError(f"Cohere call failed: {e}") from e
 
+    def call_stream(self, prompt: str, system_prompt: str | None = None) -> Iterator[str]:
+        try:
+            for event in self._client.chat_stream(
+                message=prompt,
+                model=self.model,
+                preamble=system_prompt or "",
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+            ):
+                if event.event_type == "text-generation" and event.text:
+                    yield event.text
+        except Exception as e:
+            raise LLMClientError(f"Cohere stream failed: {e}") from e
+
     def call_batch(
         self,
         batch_texts: list[str],
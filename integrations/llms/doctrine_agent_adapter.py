@@ -3,12 +3,25 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from core.config.settings import get_settings
 from core.domain.agents.ports import DoctrineAgentPort
+from core.domain.constants import (
+    DEFAULT_RAG_PASSAGE_MAX_CHARS,
+    EVIDENCE_SECTION_TOKENS,
+    METADATA_KEY_SOURCE_FILENAME,
+    PRINCIPLES_SECTION_TOKENS,
+    RAG_PASSAGES_SECTION_TOKENS,
+    PromptPriority,
+    RagContextMode,
+)
 from core.domain.forecast_models import DoctrinePack, Evidence
 from core.llm.ports import LLMClientPort
+from core.prompts.prompt_budget import PromptSection, assemble_prompt
 
 if TYPE_CHECKING:
-    from llama_index.core.tools import QueryEngineTool
+    from llama_index.core.schema import NodeWithScore
+
+    from integrations.llamaindex.doctrine_query_tools import DoctrineToolRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -18,32 +31,53 @@ _NO_PRINCIPLES = "No specific principles."
 
 
 class DoctrineAgentAdapter:
+    """Analyzes a question through one doctrine.
+
+    RAG context comes from ``registry`` on every call (a retriever in
+    RETRIEVAL mode, the query engine tool otherwise), so an agent kept
+    across a reindex uses the reopened index.
+    """
+
     def __init__(
         self,
         *,
         llm: LLMClientPort,
         pack: DoctrinePack,
-        query_tool: QueryEngineTool | None = None,
+        registry: DoctrineToolRegistry | None = None,
+        mode: RagContextMode = RagContextMode.SYNTHESIS,
     ) -> None:
         self._llm = llm
         self._pack = pack
-        self._query_tool = query_tool
+        self._registry = registry
+        self._mode = mode
 
     @property
     def doctrine_id(self) -> str:
         return self._pack.doctrine_id
 
-    def analyze(self, question: str, evidence: list[Evidence]) -> str:
-        rag_context = self._retrieve_rag_context(question)
+    def analyze(
+        self,
+        question: str,
+        evidence: list[Evidence],
+        *,
+        passages: list[Evidence] | None = None,
+    ) -> str:
+        if passages is None:
+            rag_context = self._retrieve_rag_context(question)
+        else:
+            rag_context = _format_evidence_passages(passages)
         prompt = self._build_prompt(question, evidence, rag_context=rag_context)
         return self._llm.call(prompt)
 
     def _retrieve_rag_context(self, question: str) -> str:
-        if not self._query_tool:
+        if self._registry is None:
             return ""
         try:
-            result = self._query_tool.call(question)
-            return str(result).strip()
+            if self._mode == RagContextMode.RETRIEVAL:
+                retriever = self._registry.get_retriever(self.doctrine_id)
+                return _format_passages(retriever.retrieve(question)) if retriever else ""
+            query_tool = self._registry.get(self.doctrine_id)
+            return str(query_tool.call(question)).strip() if query_tool else ""
         except Exception:
             logger.warning(
                 "RAG retrieval failed for doctrine '%s'",
@@ -59,24 +93,75 @@ class DoctrineAgentAdapter:
         *,
         rag_context: str,
     ) -> str:
-        evidence_text = "\n".join(
-            f"- {e.snippet}" for e in evidence[:5]
-        ) or _NO_EVIDENCE
-
-        principles = "\n".join(
-            f"- {p}" for p in self._pack.principles[:5]
-        ) or _NO_PRINCIPLES
-
-        rag_block = ""
+        rag_parts: list[str | PromptSection] = []
         if rag_context:
-            rag_block = f"\n{_RAG_SECTION_HEADER}:\n{rag_context}\n"
+            rag_parts = [
+                f"\n{_RAG_SECTION_HEADER}:\n",
+                PromptSection(
+                    name="rag_passages",
+                    items=rag_context.split("\n"),
+                    max_tokens=RAG_PASSAGES_SECTION_TOKENS,
+                    priority=PromptPriority.LOW,
+                ),
+                "\n",
+            ]
 
-        return (
+        return assemble_prompt([
             f"You are analyzing through the lens of {self._pack.name}.\n\n"
-            f"Core principles:\n{principles}\n\n"
-            f"Evidence:\n{evidence_text}\n"
-            f"{rag_block}\n"
-            f"Question: {question}\n\n"
+            "Core principles:\n",
+            PromptSection(
+                name="principles",
+                items=[f"- {p}" for p in self._pack.principles[:5]],
+                max_tokens=PRINCIPLES_SECTION_TOKENS,
+                priority=PromptPriority.HIGH,
+                fallback=_NO_PRINCIPLES,
+            ),
+            "\n\nEvidence:\n",
+            PromptSection(
+                name="evidence",
+                items=[f"- {e.snippet}" for e in evidence[:5]],
+                max_tokens=EVIDENCE_SECTION_TOKENS,
+                fallback=_NO_EVIDENCE,
+            ),
+            "\n",
+            *rag_parts,
+            f"\nQuestion: {question}\n\n"
             "Provide a concise analysis (3-5 sentences) with specific references "
-            "to evidence and doctrine sources. Identify key risks and opportunities."
+            "to evidence and doctrine sources. Identify key risks and opportunities.",
+        ])
+
+
+def build_doctrine_agents(
+    *,
+    llm: LLMClientPort,
+    packs: list[DoctrinePack],
+    registry: DoctrineToolRegistry,
+    mode: RagContextMode | None = None,
+) -> list[DoctrineAgentAdapter]:
+    """RETRIEVAL mode feeds raw passages to each agent, skipping the
+    query engine's synthesis call. ``mode`` defaults to the
+    ``RAG_CONTEXT_MODE`` setting."""
+    mode = mode or get_settings().rag_context_mode
+    return [
+        DoctrineAgentAdapter(llm=llm, pack=pack, registry=registry, mode=mode)
+        for pack in packs
+    ]
+
+
+def _format_passages(nodes: list[NodeWithScore]) -> str:
+    return "\n".join(
+        _passage_line(
+            (n.node.metadata or {}).get(METADATA_KEY_SOURCE_FILENAME, ""),
+            n.node.get_content(),
         )
+        for n in nodes
+    )
+
+
+def _format_evidence_passages(passages: list[Evidence]) -> str:
+    return "\n".join(_passage_line(p.source, p.snippet) for p in passages)
+
+
+def _passage_line(source: str, text: str) -> str:
+    text = " ".join(text.split())[:DEFAULT_RAG_PASSAGE_MAX_CHARS]
+    return f"- ({source}) {text}" if source else f"- {text}"
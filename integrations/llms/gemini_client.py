@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterator
 
 import google.generativeai as genai
 
@@ -26,6 +27,16 @@ class GeminiLLMClient(BaseLLMClient):
         except Exception as e:
             raise LLMClientError(f"Gemini call failed: {e}") from e
 
+    def call_stream(self, prompt: str, system_prompt: str | None = None) -> Iterator[str]:
+        full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+        try:
+            for chunk in self._model.generate_content(full_prompt, stream=True):
+                text = _chunk_text(chunk)
+                if text:
+                    yield text
+        except Exception as e:
+            raise LLMClientError(f"Gemini stream failed: {e}") from e
+
     def call_batch(
         self,
         batch_texts: list[str],
@@ -42,3 +53,11 @@ class GeminiLLMClient(BaseLLMClient):
             else:
                 logger.warning("Failed to parse JSON from Gemini response")
         return LLMResponse(response_type=ResponseType.JSON, content=results)
+
+
+def _chunk_text(chunk) -> str:
+    """Text of a streamed chunk; unlike ``chunk.text`` this is empty, not an error, without parts."""
+    candidates = chunk.candidates or []
+    if not candidates or not candidates[0].content:
+        return ""
+    return "".join(getattr(part, "text", "") or "" for part in candidates[0].content.parts)
@@ -1,4 +1,6 @@
+import json
 import logging
+from collections.abc import Iterator
 
 import httpx
 
@@ -8,6 +10,7 @@ from core.domain.exceptions import LLMClientError
 from core.domain.models import LLMResponse
 from core.llm.json_extraction import extract_json_array
 from .base import BaseLLMClient, LLMClientConfig
+from .sse import SSE_DONE, iter_sse_data
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +59,27 @@ class GroqLLMClient(BaseLLMClient):
         except httpx.HTTPError as e:
             raise LLMClientError(f"Groq API call failed: {e}") from e
 
+    def call_stream(self, prompt: str, system_prompt: str | None = None) -> Iterator[str]:
+        payload = {**self._build_payload(prompt, system_prompt), "stream": True}
+        try:
+            with httpx.stream(
+                "POST",
+                self._url,
+                headers=self._build_headers(),
+                json=payload,
+                timeout=_TIMEOUT_SECONDS,
+            ) as resp:
+                resp.raise_for_status()
+                for data in iter_sse_data(resp.iter_lines()):
+                    if data == SSE_DONE:
+                        return
+                    choices = json.loads(data).get("choices") or [{}]
+                    text = choices[0].get("delta", {}).get("content")
+                    if text:
+                        yield text
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            raise LLMClientError(f"Groq API stream failed: {e}") from e
+
     def call_batch(
         self,
         batch_texts: list[str],
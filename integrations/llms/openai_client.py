@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterator
 
 from openai import OpenAI
 
@@ -18,15 +19,10 @@ class OpenAILLMClient(BaseLLMClient):
         self._client = OpenAI(api_key=get_settings().openai_api_key)
 
     def call(self, prompt: str, system_prompt: str | None = None) -> str:
-        messages: list[dict[str, str]] = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
         try:
             response = self._client.chat.completions.create(
                 model=self.model,
-                messages=messages,
+                messages=_build_messages(prompt, system_prompt),
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
             )
@@ -34,6 +30,21 @@ class OpenAILLMClient(BaseLLMClient):
         except Exception as e:
             raise LLMClientError(f"OpenAI call failed: {e}") from e
 
+    def call_stream(self, prompt: str, system_prompt: str | None = None) -> Iterator[str]:
+        try:
+            stream = self._client.chat.completions.create(
+                model=self.model,
+                messages=_build_messages(prompt, system_prompt),
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                stream=True,
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise LLMClientError(f"OpenAI stream failed: {e}") from e
+
     def call_batch(
         self,
         batch_texts: list[str],
@@ -50,3 +61,11 @@ class OpenAILLMClient(BaseLLMClient):
             else:
                 logger.warning("Failed to parse JSON from OpenAI response")
         return LLMResponse(response_type=ResponseType.JSON, content=results)
+
+
+def _build_messages(prompt: str, system_prompt: str | None) -> list[dict[str, str]]:
+    messages: list[dict[str, str]] = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+    return messages
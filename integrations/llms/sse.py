@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+SSE_DONE = "[DONE]"
+
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[str]:
+    """Data payload of each event in a server-sent event stream."""
+    data: list[str] = []
+    for line in lines:
+        if not line:
+            if data:
+                yield "\n".join(data)
+                data = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if field == "data":
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        yield "\n".join(data)
@@ -1,5 +1,6 @@
 import logging
 
+from core.config import Paths
 from core.doctrine.metadata.doctrine_metadata import DoctrineMetadata
 from core.doctrine.processor.doctrine_processor import DoctrineProcessor
 
@@ -10,6 +11,6 @@ class RawProcess:
     @staticmethod
     def run_all() -> None:
         logger.info("Starting raw doctrine processing")
-        DoctrineMetadata.bulk_generate()
+        DoctrineMetadata.bulk_generate(Paths.RAW_DIR)
         DoctrineProcessor.batch_process()
         logger.info("Raw doctrine processing complete")
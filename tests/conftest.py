@@ -0,0 +1,11 @@
+import pytest
+
+from core.doctrine import text_splitter
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _offline_token_counts():
+    """Count tokens locally so no test needs tiktoken's network download."""
+    text_splitter.use_encoding(text_splitter.ApproximateEncoding())
+    yield
+    text_splitter.use_encoding(None)
@@ -0,0 +1,33 @@
+from core.config import Paths
+from core.doctrine import split_corpus, split_texts
+from core.doctrine.text_splitter import split_text
+
+_TEXT = " ".join(f"Sentence {i} weighs sea power against land power." for i in range(200))
+
+
+class TestSplitCorpus:
+    def test_each_doctrine_is_split_and_failures_are_left_out(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Paths, "CLEANED_DIR", tmp_path)
+        (tmp_path / "mahan.md").write_text(_TEXT, encoding="utf-8")
+        (tmp_path / "sun_tzu.md").write_text("All warfare is based on deception.", encoding="utf-8")
+
+        segments = split_corpus(["mahan", "missing", "sun_tzu"], max_tokens=100, max_workers=2)
+
+        assert list(segments) == ["mahan", "sun_tzu"]
+        assert segments["mahan"] == split_text(_TEXT, max_tokens=100)
+        assert segments["sun_tzu"] == ["All warfare is based on deception."]
+
+    def test_defaults_to_every_cleaned_doctrine(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Paths, "CLEANED_DIR", tmp_path)
+        (tmp_path / "mahan.md").write_text("Sea power.", encoding="utf-8")
+
+        assert split_corpus(max_workers=1) == {"mahan": ["Sea power."]}
+
+
+class TestSplitTexts:
+    def test_pool_keeps_input_order(self):
+        texts = [_TEXT, "Short.", _TEXT[:500]]
+
+        result = split_texts(texts, max_tokens=100, max_workers=3)
+
+        assert result == [split_text(text, max_tokens=100) for text in texts]
@@ -0,0 +1,40 @@
+import json
+
+from core.config import Paths
+from core.doctrine.processor.helpers import chunk_and_enrich
+from core.doctrine.processor.helpers.chunk_and_enrich import ChunkAndEnrich
+from core.domain.constants import ResponseType
+from core.domain.models import LLMResponse
+
+
+class _RecordingClient:
+    def __init__(self, log: list[str]) -> None:
+        self._log = log
+
+    def call_batch(self, batch_texts, embedded_prompt, system_prompt=None) -> LLMResponse:
+        self._log.append(f"batch of {len(batch_texts)}")
+        return LLMResponse(
+            content=[{"text": text} for text in batch_texts],
+            response_type=ResponseType.JSON,
+        )
+
+
+class TestChunkAndEnrich:
+    def test_segments_are_enriched_as_they_stream(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Paths, "CHUNK_DIR", tmp_path)
+        monkeypatch.setattr(chunk_and_enrich, "_BATCH_DELAY_SECONDS", 0)
+        log: list[str] = []
+
+        def split_file(path, *, max_tokens):
+            for i in range(5):
+                log.append(f"segment {i}")
+                yield f"segment {i}"
+
+        monkeypatch.setattr(chunk_and_enrich, "split_file", split_file)
+
+        ChunkAndEnrich.process("sun_tzu", [_RecordingClient(log)])
+
+        chunks = json.loads((tmp_path / "sun_tzu_chunks.json").read_text(encoding="utf-8"))
+        assert log.index("batch of 3") < log.index("segment 3")
+        assert [c["id"] for c in chunks] == [f"sun_tzu_00{i}" for i in range(1, 6)]
+        assert chunks[4]["meta"]["chunk_index"] == 5
@@ -0,0 +1,67 @@
+from core.domain.agents.doctrine_council import run_doctrine_council
+from core.domain.forecast_models import Evidence
+
+
+class _FakeAgent:
+    def __init__(self, doctrine_id: str) -> None:
+        self._id = doctrine_id
+        self.received: list[Evidence] | None = None
+
+    @property
+    def doctrine_id(self) -> str:
+        return self._id
+
+    def analyze(self, question, evidence, *, passages=None) -> str:
+        self.received = passages
+        return f"{self._id} analysis"
+
+
+class _FakePassagePort:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls = 0
+        self._fail = fail
+
+    def retrieve_by_doctrine(self, query, *, doctrine_ids, top_k=5):
+        self.calls += 1
+        if self._fail:
+            raise RuntimeError("vector store down")
+        return {
+            "artofwar": [Evidence(source="artofwar", snippet="deception", relevance_score=0.9)],
+        }
+
+
+class TestDoctrineCouncil:
+    def test_without_passage_port_agents_retrieve_themselves(self):
+        agent = _FakeAgent("artofwar")
+
+        result = run_doctrine_council(["Will X happen?"], [], [agent])
+
+        assert agent.received is None
+        assert result.analyses[0].response == "artofwar analysis"
+
+    def test_single_retrieval_pass_is_sliced_per_agent(self):
+        agents = [_FakeAgent("artofwar"), _FakeAgent("seapower")]
+        port = _FakePassagePort()
+
+        run_doctrine_council(["Will X happen?"], [], agents, passage_port=port)
+
+        assert port.calls == 1
+        assert agents[0].received[0].snippet == "deception"
+        assert agents[1].received is None
+
+    def test_doctrine_without_shared_hits_falls_back_to_own_retrieval(self):
+        agent = _FakeAgent("seapower")
+
+        run_doctrine_council(["Will X happen?"], [], [agent], passage_port=_FakePassagePort())
+
+        assert agent.received is None
+
+    def test_failed_passage_retrieval_falls_back(self):
+        agent = _FakeAgent("artofwar")
+
+        result = run_doctrine_council(
+            ["Will X happen?"], [], [agent], passage_port=_FakePassagePort(fail=True),
+        )
+
+        assert agent.received is None
+        assert len(result.analyses) == 1
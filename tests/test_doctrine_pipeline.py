@@ -0,0 +1,148 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core.config import Paths
+from core.doctrine import fingerprints
+from core.doctrine.pipeline import DoctrinePipeline, PipelineStage
+from core.domain.constants import METADATA_KEY_DOCTRINE_SLUG, DoctrineStatus
+from integrations.llamaindex.doctrine_reader import read_cleaned_doctrine, read_cleaned_documents
+from workers.raw_doctrine_watcher_worker import RawDoctrineWatcherWorker
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    raw = tmp_path / "raw.txt"
+    cleaned = tmp_path / "cleaned.md"
+    raw.write_text("Know the enemy.", encoding="utf-8")
+    runs: list[DoctrineStatus] = []
+
+    def clean(slug: str) -> None:
+        runs.append(DoctrineStatus.CLEANED)
+        cleaned.write_text(raw.read_text(encoding="utf-8").lower(), encoding="utf-8")
+
+    def chunk(slug: str) -> None:
+        runs.append(DoctrineStatus.CHUNKED)
+
+    stages = [
+        PipelineStage(status=DoctrineStatus.CLEANED, inputs=lambda s: [raw], run=clean),
+        PipelineStage(status=DoctrineStatus.CHUNKED, inputs=lambda s: [cleaned], run=chunk),
+    ]
+    return DoctrinePipeline(stages, state_dir=tmp_path / "state"), raw, runs
+
+
+class TestDoctrinePipeline:
+    def test_unchanged_doctrine_skips_every_stage(self, workspace):
+        pipeline, _, runs = workspace
+        pipeline.process("sun_tzu")
+        runs.clear()
+
+        state = pipeline.process("sun_tzu")
+
+        assert runs == []
+        assert state.status == DoctrineStatus.CHUNKED
+
+    def test_changed_input_reruns_stage_and_everything_after_it(self, workspace):
+        pipeline, raw, runs = workspace
+        pipeline.process("sun_tzu")
+        runs.clear()
+
+        raw.write_text("Know yourself.", encoding="utf-8")
+        pipeline.process("sun_tzu")
+
+        assert runs == [DoctrineStatus.CLEANED, DoctrineStatus.CHUNKED]
+
+    def test_unchanged_inputs_are_not_hashed_again(self, tmp_path, monkeypatch):
+        hashed: list[str] = []
+        hash_file = fingerprints._hash_file
+        monkeypatch.setattr(fingerprints, "_hash_file", lambda path: hashed.append(path.name) or hash_file(path))
+        source = tmp_path / "raw.txt"
+        source.write_text("x", encoding="utf-8")
+        stages = [
+            PipelineStage(status=status, inputs=lambda s: [source], run=lambda s: None)
+            for status in (DoctrineStatus.RAW_COLLECTED, DoctrineStatus.CLEANED)
+        ]
+        pipeline = DoctrinePipeline(stages, state_dir=tmp_path / "state")
+        pipeline.process("sun_tzu")
+        first_pass = list(hashed)
+
+        pipeline.process("sun_tzu")
+
+        assert first_pass == ["raw.txt"]
+        assert hashed == first_pass
+
+    def test_failed_stage_is_recorded_and_resumed(self, tmp_path):
+        source = tmp_path / "raw.txt"
+        source.write_text("x", encoding="utf-8")
+        attempts: list[int] = []
+
+        def flaky(slug: str) -> None:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("LLM unavailable")
+
+        stages = [
+            PipelineStage(status=DoctrineStatus.CLEANED, inputs=lambda s: [source], run=lambda s: None),
+            PipelineStage(status=DoctrineStatus.CHUNKED, inputs=lambda s: [source], run=flaky),
+        ]
+        pipeline = DoctrinePipeline(stages, state_dir=tmp_path / "state")
+
+        with pytest.raises(RuntimeError):
+            pipeline.process("sun_tzu")
+        failed = pipeline.load_state("sun_tzu")
+        resumed = pipeline.process("sun_tzu")
+
+        assert failed.status == DoctrineStatus.CLEANED
+        assert failed.error == "chunked: LLM unavailable"
+        assert resumed.status == DoctrineStatus.CHUNKED and resumed.error is None
+        assert len(attempts) == 2
+
+    def test_removed_doctrine_runs_hook_and_drops_state(self, tmp_path):
+        removed: list[str] = []
+        source = tmp_path / "raw.txt"
+        source.write_text("x", encoding="utf-8")
+        stages = [
+            PipelineStage(status=DoctrineStatus.CLEANED, inputs=lambda s: [source], run=lambda s: None),
+        ]
+        pipeline = DoctrinePipeline(stages, state_dir=tmp_path / "state", on_remove=removed.append)
+        pipeline.process("sun_tzu")
+
+        source.unlink()
+        pipeline.remove("sun_tzu")
+
+        assert removed == ["sun_tzu"]
+        assert pipeline.load_state("sun_tzu").status is None
+
+
+class TestReadCleanedDoctrine:
+    def test_reads_cleaned_output_tagged_with_slug(self, tmp_path):
+        (tmp_path / "art_of_war.md").write_text("All warfare is deception.", encoding="utf-8")
+
+        (document,) = read_cleaned_doctrine("art_of_war", cleaned_dir=tmp_path)
+
+        assert document.text == "All warfare is deception."
+        assert document.metadata[METADATA_KEY_DOCTRINE_SLUG] == "art_of_war"
+
+    def test_bulk_read_covers_every_cleaned_doctrine(self, tmp_path):
+        (tmp_path / "mahan.md").write_text("Sea power.", encoding="utf-8")
+        (tmp_path / "sun_tzu.md").write_text("Deception.", encoding="utf-8")
+        (tmp_path / "kautilya.md.partial").write_text("Half written", encoding="utf-8")
+
+        documents = read_cleaned_documents(cleaned_dir=tmp_path)
+
+        assert [d.metadata[METADATA_KEY_DOCTRINE_SLUG] for d in documents] == ["mahan", "sun_tzu"]
+
+
+class TestRawDoctrineWatcher:
+    def test_doctrine_without_raw_files_is_removed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Paths, "RAW_DIR", tmp_path)
+        calls: list[tuple[str, str]] = []
+        worker = RawDoctrineWatcherWorker.__new__(RawDoctrineWatcherWorker)
+        worker.pipeline = SimpleNamespace(
+            remove=lambda slug: calls.append(("remove", slug)),
+            process=lambda slug: calls.append(("process", slug)),
+        )
+
+        worker.process_doctrine("sun_tzu")
+
+        assert calls == [("remove", "sun_tzu")]
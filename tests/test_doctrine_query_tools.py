@@ -0,0 +1,57 @@
+import pytest
+
+from integrations.llamaindex import doctrine_query_tools, index_router
+from integrations.llamaindex.doctrine_query_tools import DoctrineToolRegistry
+from integrations.llamaindex.index_manifest import write_index_manifest
+
+
+@pytest.fixture
+def collection_slugs(monkeypatch):
+    calls: list[int] = []
+
+    def fake_list(*, persist_dir):
+        calls.append(1)
+        return {"seapower"}
+
+    monkeypatch.setattr(index_router, "list_collection_slugs", fake_list)
+    return calls
+
+
+@pytest.fixture
+def created_tools(monkeypatch):
+    created: list[str] = []
+
+    def fake_create(router, slug, *, top_k):
+        created.append(slug)
+        return object()
+
+    monkeypatch.setattr(doctrine_query_tools, "_create_tool_for_doctrine", fake_create)
+    return created
+
+
+class TestDoctrineToolRegistry:
+    def test_slugs_come_from_manifest_without_querying_collection(self, tmp_path, collection_slugs):
+        write_index_manifest(tmp_path, collection="doctrines", slugs={"sun_tzu", "clausewitz"}, node_count=2)
+
+        registry = DoctrineToolRegistry(index=object(), persist_dir=tmp_path)
+
+        assert registry.slugs == ["clausewitz", "sun_tzu"]
+        assert collection_slugs == []
+
+    def test_slugs_fall_back_to_collection_metadata(self, tmp_path, collection_slugs):
+        registry = DoctrineToolRegistry(index=object(), persist_dir=tmp_path)
+
+        assert registry.slugs == ["seapower"]
+        assert registry.slugs == ["seapower"]
+        assert collection_slugs == [1]
+
+    def test_tools_are_built_once_and_only_for_known_slugs(self, tmp_path, collection_slugs, created_tools):
+        registry = DoctrineToolRegistry(index=object(), persist_dir=tmp_path)
+
+        first = registry.get("seapower")
+        second = registry.get("seapower")
+        unknown = registry.get("sun_tzu")
+
+        assert first is second
+        assert unknown is None
+        assert created_tools == ["seapower"]
@@ -0,0 +1,35 @@
+from core.domain.evidence_selection import select_diverse_evidence
+from core.domain.forecast_models import Evidence
+
+_CHUNK = "all warfare is based on deception so when able to attack we must seem unable"
+
+
+def _evidence(snippet: str, score: float) -> Evidence:
+    return Evidence(source="artofwar", snippet=snippet, relevance_score=score)
+
+
+class TestSelectDiverseEvidence:
+    def test_zero_diversity_keeps_relevance_order(self):
+        items = [_evidence(_CHUNK, 0.9), _evidence(_CHUNK, 0.8), _evidence("sea power", 0.1)]
+
+        result = select_diverse_evidence(items, top_k=2, diversity=0.0)
+
+        assert result == items[:2]
+
+    def test_overlapping_chunks_are_dropped(self):
+        items = [
+            _evidence(_CHUNK, 0.9),
+            _evidence(_CHUNK + " when using our forces", 0.85),
+            _evidence("command of the sea decides maritime wars", 0.4),
+        ]
+
+        result = select_diverse_evidence(items, top_k=2, diversity=0.3)
+
+        assert [e.relevance_score for e in result] == [0.9, 0.4]
+
+    def test_returns_fewer_than_top_k_when_only_duplicates_remain(self):
+        items = [_evidence(_CHUNK, 0.9), _evidence(_CHUNK, 0.8)]
+
+        result = select_diverse_evidence(items, top_k=5, diversity=0.3)
+
+        assert len(result) == 1
@@ -0,0 +1,133 @@
+import os
+
+import pytest
+
+from core.config import Paths
+from core.doctrine.fingerprints import FingerprintManifest
+from core.doctrine.metadata import DoctrineMetadata
+from core.doctrine.processor import DoctrineProcessor
+
+
+class TestFingerprintManifest:
+    def test_touched_file_is_not_a_change(self, tmp_path):
+        source = tmp_path / "sun_tzu.txt"
+        source.write_text("All warfare is based on deception.", encoding="utf-8")
+        manifest = FingerprintManifest(tmp_path / "manifest.json", version="1")
+        manifest.update("sun_tzu", [manifest.fingerprint(source)])
+        manifest.save()
+
+        os.utime(source, ns=(0, 10**9))
+        reloaded = FingerprintManifest(tmp_path / "manifest.json", version="1")
+
+        assert reloaded.is_current("sun_tzu", [reloaded.fingerprint(source)])
+
+    def test_version_change_invalidates_everything(self, tmp_path):
+        source = tmp_path / "sun_tzu.txt"
+        source.write_text("x", encoding="utf-8")
+        manifest = FingerprintManifest(tmp_path / "manifest.json", version="1")
+        manifest.update("sun_tzu", [manifest.fingerprint(source)])
+        manifest.save()
+
+        upgraded = FingerprintManifest(tmp_path / "manifest.json", version="2")
+
+        assert not upgraded.is_current("sun_tzu", [upgraded.fingerprint(source)])
+
+
+class TestBulkGenerate:
+    @pytest.fixture(autouse=True)
+    def _isolated_dirs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Paths, "STATE_DIR", tmp_path / "state")
+        monkeypatch.setattr(DoctrineMetadata, "STORAGE_DIR", tmp_path / "metadata")
+
+    def test_rescan_only_rewrites_changed_doctrines(self, tmp_path):
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        (raw / "art_of_war_1.txt").write_text("Part one.", encoding="utf-8")
+        (raw / "art_of_war_2.txt").write_text("Part two.", encoding="utf-8")
+        (raw / "mahan.txt").write_text("Sea power.", encoding="utf-8")
+
+        first = DoctrineMetadata.bulk_generate(raw)
+        unchanged = DoctrineMetadata.bulk_generate(raw)
+        (raw / "mahan.txt").write_text("Sea power, revised.", encoding="utf-8")
+        edited = DoctrineMetadata.bulk_generate(raw)
+
+        assert sorted(first) == ["art_of_war", "mahan"]
+        assert unchanged == []
+        assert edited == ["mahan"]
+        assert DoctrineMetadata.path_for("art_of_war").exists()
+
+    def test_metadata_of_removed_doctrine_is_deleted(self, tmp_path):
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        (raw / "mahan_1.txt").write_text("Sea power.", encoding="utf-8")
+        (raw / "mahan_2.txt").write_text("Command of the sea.", encoding="utf-8")
+        DoctrineMetadata.bulk_generate(raw)
+
+        for part in raw.iterdir():
+            part.unlink()
+        DoctrineMetadata.bulk_generate(raw)
+
+        assert not DoctrineMetadata.path_for("mahan").exists()
+
+    def test_parts_are_ordered_by_part_number(self, tmp_path):
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        for part in (10, 2, 1):
+            (raw / f"mahan_{part}.txt").write_text(f"Part {part}.", encoding="utf-8")
+
+        names = [file.name for file in DoctrineMetadata.raw_files("mahan", raw)]
+        grouped = [file.name for file in DoctrineMetadata.group_raw_files(raw)["mahan"]]
+
+        assert names == grouped == ["mahan_1.txt", "mahan_2.txt", "mahan_10.txt"]
+
+
+class TestDoctrineProcessorBatch:
+    @pytest.fixture(autouse=True)
+    def _isolated_dirs(self, tmp_path, monkeypatch):
+        for name in ("RAW_DIR", "CLEANED_DIR", "CHUNK_DIR", "STATE_DIR"):
+            monkeypatch.setattr(Paths, name, tmp_path / name.lower())
+        Paths.RAW_DIR.mkdir()
+        Paths.CHUNK_DIR.mkdir()
+
+    def test_edited_raw_file_is_recleaned_and_its_chunks_invalidated(self):
+        raw = Paths.RAW_DIR / "sun_tzu.txt"
+        raw.write_text("All warfare   is deception.", encoding="utf-8")
+        chunks = Paths.CHUNK_DIR / "sun_tzu_chunks.json"
+
+        first = DoctrineProcessor.batch_process()
+        chunks.write_text("[]", encoding="utf-8")
+        unchanged = DoctrineProcessor.batch_process()
+        raw.write_text("Know the enemy and know yourself.", encoding="utf-8")
+        edited = DoctrineProcessor.batch_process()
+
+        assert (first, unchanged, edited) == (["sun_tzu"], [], ["sun_tzu"])
+        assert (Paths.CLEANED_DIR / "sun_tzu.md").read_text(encoding="utf-8") == raw.read_text(encoding="utf-8")
+        assert not chunks.exists()
+
+    def test_edited_part_recleans_the_whole_doctrine(self):
+        (Paths.RAW_DIR / "deep_state-1.txt").write_text("Part   one.", encoding="utf-8")
+        second = Paths.RAW_DIR / "deep_state-2.txt"
+        second.write_text("Part two.", encoding="utf-8")
+        DoctrineProcessor.batch_process()
+
+        second.write_text("Part two, revised.", encoding="utf-8")
+        edited = DoctrineProcessor.batch_process()
+
+        assert edited == ["deep_state"]
+        assert (Paths.CLEANED_DIR / "deep_state.md").read_text(encoding="utf-8") == (
+            "Part one.\n\nPart two, revised."
+        )
+        assert not (Paths.CLEANED_DIR / "deep_state_2.md").exists()
+
+    def test_first_run_trusts_cleaned_outputs_newer_than_raw_files(self):
+        raw = Paths.RAW_DIR / "mahan.txt"
+        raw.write_text("Sea power.", encoding="utf-8")
+        Paths.CLEANED_DIR.mkdir()
+        cleaned = Paths.CLEANED_DIR / "mahan.md"
+        cleaned.write_text("Previously cleaned.", encoding="utf-8")
+        os.utime(raw, ns=(0, 10**9))
+
+        first = DoctrineProcessor.batch_process()
+
+        assert first == []
+        assert cleaned.read_text(encoding="utf-8") == "Previously cleaned."
@@ -0,0 +1,44 @@
+from datetime import date
+
+from core.domain.agents.forecaster import generate_forecasts
+from core.domain.constants import DoctrineDomain
+from core.domain.forecast_models import Evidence
+
+
+class _FakeLLM:
+    def call(self, prompt, system_prompt=None) -> str:
+        if "probability estimate" in prompt:
+            return "0.7"
+        return "1. What is the historical base rate for this event?"
+
+
+class _FakeEvidencePort:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def retrieve(self, query, *, top_k=10):
+        raise AssertionError("batch forecasting must not retrieve one event at a time")
+
+    def retrieve_many(self, queries, *, top_k=10):
+        self.batches.append(list(queries))
+        return [[Evidence(source=q, snippet=q, relevance_score=0.5)] for q in queries]
+
+
+class TestGenerateForecasts:
+    def test_evidence_is_retrieved_in_one_batch(self):
+        port = _FakeEvidencePort()
+        events = ["Will X invade Y?", "Will Z default?"]
+
+        forecasts = generate_forecasts(
+            events,
+            horizon=date(2027, 1, 1),
+            domain=DoctrineDomain.GEOPOLITICS,
+            llm=_FakeLLM(),
+            evidence_port=port,
+            doctrine_agents=[],
+        )
+
+        assert port.batches == [events]
+        assert [f.event for f in forecasts] == events
+        assert [f.sources for f in forecasts] == [[events[0]], [events[1]]]
+        assert forecasts[0].probability == 0.7
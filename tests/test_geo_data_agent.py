@@ -0,0 +1,94 @@
+import importlib
+import json
+import sys
+from types import ModuleType
+
+import pytest
+
+CATEGORIES = ["conflict", "trade"]
+
+
+class _Stub:
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+
+class _FakeChain:
+    """Answers every batch from ``answers``, leaving out themes it maps to None."""
+
+    def __init__(self, answers: dict[str, str | None]) -> None:
+        self.answers = answers
+        self.prompts: list[str] = []
+
+    def invoke(self, inputs: dict) -> str:
+        self.prompts.append(inputs["themes"])
+        codes = [line[2:].split(":")[0] for line in inputs["themes"].splitlines()]
+        return json.dumps({
+            "classifications": [
+                {"theme_code": code, "category": self.answers[code]}
+                for code in codes
+                if self.answers[code] is not None
+            ]
+        })
+
+
+@pytest.fixture
+def geo_data_agent(monkeypatch):
+    stubs = {
+        "pandas": {},
+        "langchain_core": {},
+        "langchain_core.prompts": {"PromptTemplate": _Stub},
+        "langchain_core.output_parsers": {"StrOutputParser": _Stub},
+        "langchain_ollama": {"ChatOllama": _Stub},
+    }
+    for name, attrs in stubs.items():
+        module = ModuleType(name)
+        module.__dict__.update(attrs)
+        monkeypatch.setitem(sys.modules, name, module)
+    name = "geo_intelligenge_agent.geo_data_agent"
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    yield importlib.import_module(name)
+    sys.modules.pop(name, None)
+
+
+def _agent(module, tmp_path, chain: _FakeChain):
+    agent = module.GeoDataAgent(cache_file=tmp_path / "classifications.json")
+    agent.init_batch_chains = lambda categories: setattr(
+        agent, "batch_chains", {True: chain, False: chain},
+    )
+    return agent
+
+
+class TestClassifyThemes:
+    def test_skipped_or_unknown_category_maps_to_uncategorized(self, geo_data_agent, tmp_path):
+        chain = _FakeChain({"armedconflict": "conflict", "tax_fncact": "SKIP", "wb_123": "weather"})
+        agent = _agent(geo_data_agent, tmp_path, chain)
+
+        result = agent.classify_themes(["armedconflict", "tax_fncact", "wb_123"], CATEGORIES)
+
+        assert result == [
+            ("armedconflict", "conflict"),
+            ("tax_fncact", geo_data_agent.UNCATEGORIZED),
+            ("wb_123", geo_data_agent.UNCATEGORIZED),
+        ]
+
+    def test_theme_omitted_by_llm_is_not_cached(self, geo_data_agent, tmp_path):
+        chain = _FakeChain({"armedconflict": "conflict", "econ_trade": None})
+        agent = _agent(geo_data_agent, tmp_path, chain)
+
+        first = agent.classify_themes(["armedconflict", "econ_trade"], CATEGORIES)
+        chain.answers["econ_trade"] = "trade"
+        second = agent.classify_themes(["armedconflict", "econ_trade"], CATEGORIES)
+
+        assert first[1] == ("econ_trade", geo_data_agent.UNCATEGORIZED)
+        assert second[1] == ("econ_trade", "trade")
+        assert chain.prompts[-1] == "- econ_trade"
+
+    def test_category_list_change_drops_the_cache(self, geo_data_agent, tmp_path):
+        chain = _FakeChain({"armedconflict": "conflict"})
+        agent = _agent(geo_data_agent, tmp_path, chain)
+        agent.classify_themes(["armedconflict"], CATEGORIES)
+
+        agent.classify_themes(["armedconflict"], [*CATEGORIES, "energy"])
+
+        assert chain.prompts == ["- armedconflict", "- armedconflict"]
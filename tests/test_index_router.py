@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+
+import pytest
+from llama_index.core import MockEmbedding
+from llama_index.core.schema import Document, TextNode
+
+from core.domain.constants import (
+    METADATA_KEY_DOCTRINE_SLUG,
+    EmbeddingPrecision,
+    IndexLayout,
+    RetrievalMode,
+    VectorStoreBackend,
+)
+from integrations.llamaindex import index_builder, index_registry
+from integrations.llamaindex.evidence_retriever import LlamaIndexEvidenceRetriever
+from integrations.llamaindex.index_builder import _collection_name, replace_doctrine
+from integrations.llamaindex.index_manifest import read_index_manifest, write_index_manifest
+from integrations.llamaindex.index_router import DoctrineIndexRouter, slug_filters
+from integrations.llamaindex.mmap_vector_store import MmapVectorStore
+
+
+@pytest.fixture
+def partitioned(tmp_path, monkeypatch):
+    settings = SimpleNamespace(
+        index_layout=IndexLayout.PARTITIONED,
+        vector_store_backend=VectorStoreBackend.MMAP,
+        vector_store_precision=EmbeddingPrecision.FLOAT16,
+        llamaindex_chunk_size=256,
+        llamaindex_chunk_overlap=0,
+    )
+    monkeypatch.setattr(index_builder, "get_settings", lambda: settings)
+    monkeypatch.setattr(index_builder, "create_embed_model", lambda: MockEmbedding(embed_dim=2))
+    monkeypatch.setattr(index_registry, "create_embed_model", lambda: MockEmbedding(embed_dim=2))
+    for slug in ("sun_tzu", "mahan"):
+        store = MmapVectorStore.from_persist_dir(tmp_path / "mmap_partitions" / slug)
+        store.add([
+            TextNode(
+                id_=f"{slug}-{i}",
+                text=f"{slug} passage {i}",
+                embedding=[1.0, float(i)],
+                metadata={METADATA_KEY_DOCTRINE_SLUG: slug},
+            )
+            for i in range(2)
+        ])
+        store.persist()
+    return tmp_path
+
+
+class TestPartitionNaming:
+    def test_collection_names(self):
+        assert _collection_name(None) == "masx_doctrines"
+        assert _collection_name("sun_tzu") == "masx_doctrines__sun_tzu"
+
+    def test_slug_filters_use_eq_for_one_and_in_for_many(self):
+        one = slug_filters(["sun_tzu"]).filters[0]
+        many = slug_filters(["sun_tzu", "mahan"]).filters[0]
+
+        assert (one.key, one.value, one.operator.value) == (METADATA_KEY_DOCTRINE_SLUG, "sun_tzu", "==")
+        assert (many.value, many.operator.value) == (["sun_tzu", "mahan"], "in")
+
+
+class TestPartitionedRouting:
+    def test_grouped_retrieval_only_returns_requested_partitions(self, partitioned):
+        router = DoctrineIndexRouter(persist_dir=partitioned, embed_model=MockEmbedding(embed_dim=2))
+
+        grouped = router.retrieve_grouped("deterrence", slugs=["mahan", "kautilya"], top_k=1)
+
+        assert list(grouped) == ["mahan"]
+        assert grouped["mahan"][0].node.metadata[METADATA_KEY_DOCTRINE_SLUG] == "mahan"
+
+    def test_removed_doctrine_is_dropped_from_catalog(self, partitioned):
+        write_index_manifest(partitioned, collection="masx_doctrines", slugs={"sun_tzu", "mahan", "ghost"}, node_count=4)
+
+        replace_doctrine("mahan", [], persist_dir=partitioned)
+
+        manifest = read_index_manifest(partitioned)
+        assert manifest.slugs == ["sun_tzu"]
+        assert manifest.node_count == 2
+        assert DoctrineIndexRouter(persist_dir=partitioned).slugs == ["sun_tzu"]
+
+
+class TestIndexRegistry:
+    def test_router_is_reused_until_the_index_version_changes(self, partitioned):
+        registry = index_registry.IndexRegistry()
+        first = registry.get(partitioned)
+        same = registry.get(partitioned)
+
+        replace_doctrine("mahan", [], persist_dir=partitioned)
+        reopened = registry.get(partitioned)
+
+        assert same is first
+        assert reopened is not first
+        assert reopened.version == read_index_manifest(partitioned).version
+        assert first.version != reopened.version
+
+    def test_retriever_follows_a_reindex(self, partitioned):
+        registry = index_registry.IndexRegistry()
+        retriever = LlamaIndexEvidenceRetriever(
+            router_source=lambda: registry.get(partitioned),
+            mode=RetrievalMode.VECTOR,
+            diversity=0.0,
+        )
+        before = retriever.retrieve("sea power", top_k=10)
+
+        replace_doctrine(
+            "kautilya",
+            [Document(text="The king shall protect the realm.", metadata={METADATA_KEY_DOCTRINE_SLUG: "kautilya"})],
+            persist_dir=partitioned,
+        )
+        after = retriever.retrieve("sea power", top_k=10)
+
+        assert not any(e.source.startswith("kautilya") for e in before)
+        assert any(e.source.startswith("kautilya") for e in after)
+
+    def test_warm_reports_success_and_failure(self, partitioned, tmp_path, monkeypatch):
+        registry = index_registry.IndexRegistry()
+        warmed = registry.warm(partitioned)
+
+        monkeypatch.setattr(DoctrineIndexRouter, "retrieve", _raise_unavailable)
+        failed = registry.warm(tmp_path / "missing")
+
+        assert (warmed, failed) == (True, False)
+
+
+def _raise_unavailable(self, query, *, top_k):
+    raise OSError("vector store unavailable")
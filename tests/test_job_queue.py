@@ -0,0 +1,55 @@
+import threading
+import time
+
+from workers.job_queue import DebouncedJobQueue
+
+
+class TestDebouncedJobQueue:
+    def test_burst_of_submissions_runs_one_job_per_key(self):
+        calls: list[str] = []
+        queue = DebouncedJobQueue(handler=calls.append, debounce_seconds=0.05, max_workers=2)
+        queue.start()
+
+        for _ in range(50):
+            queue.submit("clausewitz")
+            queue.submit("sun_tzu")
+        queue.stop()
+
+        assert sorted(calls) == ["clausewitz", "sun_tzu"]
+
+    def test_submission_during_run_schedules_one_follow_up(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[str] = []
+
+        def handler(key: str) -> None:
+            calls.append(key)
+            started.set()
+            release.wait(timeout=1)
+
+        queue = DebouncedJobQueue(handler=handler, debounce_seconds=0.01, max_workers=2)
+        queue.start()
+        queue.submit("clausewitz")
+        started.wait(timeout=1)
+
+        queue.submit("clausewitz")
+        queue.submit("clausewitz")
+        time.sleep(0.05)
+        in_flight = queue.in_flight
+        release.set()
+        queue.stop()
+
+        assert in_flight == 1
+        assert calls == ["clausewitz", "clausewitz"]
+
+    def test_stop_without_drain_returns_skipped_keys(self):
+        calls: list[str] = []
+        queue = DebouncedJobQueue(handler=calls.append, debounce_seconds=60, max_workers=1)
+        queue.start()
+
+        queue.submit("clausewitz")
+        queue.submit("sun_tzu")
+        skipped = queue.stop(drain=False)
+
+        assert calls == []
+        assert skipped == ["clausewitz", "sun_tzu"]
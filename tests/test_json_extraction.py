@@ -0,0 +1,23 @@
+from core.llm.json_extraction import extract_json_array, iter_json_objects
+
+
+class TestExtractJsonArray:
+    def test_nested_arrays_are_kept_intact(self):
+        raw = 'Result:\n```json\n[{"a": [1, [2]]}, {"b": [{"c": 3}]},]\n```'
+
+        assert extract_json_array(raw) == [{"a": [1, [2]]}, {"b": [{"c": 3}]}]
+
+    def test_envelope_object_is_unwrapped(self):
+        assert extract_json_array('{"chunks": [{"a": 1}, {"b": 2}]}') == [{"a": 1}, {"b": 2}]
+
+    def test_no_json_returns_none(self):
+        assert extract_json_array("I could not produce chunks.") is None
+
+
+class TestIterJsonObjects:
+    def test_objects_are_yielded_as_soon_as_they_close(self):
+        stream = iter(['[{"section": "A"', '}, {"sec', 'tion": "B"}', "]"])
+        objects = iter_json_objects(stream)
+
+        assert next(objects) == {"section": "A"}
+        assert next(stream) == 'tion": "B"}'
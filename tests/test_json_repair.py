@@ -0,0 +1,45 @@
+from core.doctrine.parser import parse_llm_chunks
+from core.llm.json_repair import JsonObjectScanner, scan_json_objects
+
+
+class TestScanJsonObjects:
+    def test_extracts_every_object_from_fenced_array(self):
+        raw = '```json\n[{"section": "A", "text": "x"}, {"section": "B", "text": "y"}]\n```'
+
+        objects, stats = scan_json_objects(raw)
+
+        assert [o["section"] for o in objects] == ["A", "B"]
+        assert stats.repairs == 0
+
+    def test_repairs_trailing_commas_unquoted_keys_and_single_quotes(self):
+        raw = "{section: 'Intro', text: \"it's fine\", meta: {usage_tags: ['a',],},}"
+
+        objects, stats = scan_json_objects(raw)
+
+        assert objects == [{"section": "Intro", "text": "it's fine", "meta": {"usage_tags": ["a"]}}]
+        assert stats.unquoted_keys == 4
+        assert stats.single_quoted_strings == 2
+        assert stats.trailing_commas == 3
+
+    def test_truncated_object_is_closed(self):
+        objects, stats = scan_json_objects('{"section": "A", "meta": {"usage_tags": ["x", "y')
+
+        assert objects == [{"section": "A", "meta": {"usage_tags": ["x", "y"]}}]
+        assert stats.truncated == 1
+
+    def test_feeding_pieces_matches_single_pass(self):
+        raw = '[{"section": "A", "text": "x"}, {section: "B", text: "y",}]'
+        scanner = JsonObjectScanner()
+
+        objects = [obj for ch in raw for obj in scanner.feed(ch)] + scanner.close()
+
+        assert objects == scan_json_objects(raw)[0]
+
+
+class TestParseLlmChunks:
+    def test_all_chunks_are_recovered_and_numbered(self):
+        raw = '{"chunks": [{"section": "A", "text": "x"}, {"section": "B", "text": "y"}]}'
+
+        chunks, _ = parse_llm_chunks(raw)
+
+        assert [(c["id"], c["section"]) for c in chunks] == [("chunk_001", "A"), ("chunk_002", "B")]
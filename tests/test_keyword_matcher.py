@@ -0,0 +1,39 @@
+from core.domain.keyword_matcher import KeywordMatcher
+from integrations.gdelt.gdelt_themes import GdeltV2Themes
+
+
+class TestKeywordMatcher:
+    def test_returns_every_matching_category_in_keyword_order(self):
+        matcher = KeywordMatcher({
+            "security": ["terror", "military"],
+            "economy": ["econ"],
+            "health": ["disease"],
+        })
+
+        assert matcher.match("econ_terrorism_military") == ["security", "economy"]
+
+    def test_overlapping_and_prefix_keywords_all_match(self):
+        matcher = KeywordMatcher({"a": ["war"], "b": ["warfare"], "c": ["arfa"], "d": ["fare"]})
+
+        assert matcher.match("CYBER_WARFARE") == ["a", "b", "c", "d"]
+
+    def test_no_match_or_no_keywords(self):
+        assert KeywordMatcher({"a": ["x"]}).match("tax_fncact") == ["a"]
+        assert KeywordMatcher({"a": ["zzz"]}).match("tax_fncact") == []
+        assert KeywordMatcher({}).match("tax_fncact") == []
+
+
+class TestLoadAndFilter:
+    def test_theme_listed_under_each_matching_category(self, tmp_path):
+        themes_file = tmp_path / "v2_themes.txt"
+        themes_file.write_text("MILITARY_CYBER\t10\nWB_HEALTH\t5\n\nBROKEN\n", encoding="utf-8")
+
+        themes = GdeltV2Themes.load_and_filter(
+            themes_file, {"defense": ["military"], "tech": ["cyber"], "health": ["health"]}
+        )
+
+        assert themes == [
+            ("military_cyber", "defense"),
+            ("military_cyber", "tech"),
+            ("wb_health", "health"),
+        ]
@@ -0,0 +1,77 @@
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from core.domain.constants import METADATA_KEY_DOCTRINE_SLUG, RetrievalMode
+from integrations.llamaindex.evidence_retriever import LlamaIndexEvidenceRetriever
+from integrations.llamaindex.keyword_index import BM25KeywordIndex
+from integrations.llamaindex.rank_fusion import reciprocal_rank_fusion
+
+
+def _node(node_id: str, text: str, slug: str = "sun_tzu") -> TextNode:
+    return TextNode(id_=node_id, text=text, metadata={METADATA_KEY_DOCTRINE_SLUG: slug})
+
+
+_NODES = [
+    _node("a", "deception deception and the art of war"),
+    _node("b", "the art of naval war and sea power", slug="mahan"),
+    _node("c", "the art of statecraft"),
+]
+
+
+class TestBM25KeywordIndex:
+    def test_rare_and_repeated_terms_rank_first(self):
+        index = BM25KeywordIndex.from_nodes(_NODES)
+
+        hits = index.search("deception art", top_k=3)
+
+        assert [h.node.node_id for h in hits][0] == "a"
+        assert hits[0].score == 1.0
+        assert all(0.0 < h.score <= 1.0 for h in hits)
+
+    def test_slug_filter_and_unknown_terms(self):
+        index = BM25KeywordIndex.from_nodes(_NODES)
+
+        assert [h.node.node_id for h in index.search("war", top_k=5, slugs={"mahan"})] == ["b"]
+        assert index.search("submarine", top_k=5) == []
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        BM25KeywordIndex.from_nodes(_NODES).save(tmp_path)
+
+        loaded = BM25KeywordIndex.load(tmp_path)
+
+        assert len(loaded) == 3
+        assert loaded.search("naval", top_k=1)[0].node.metadata[METADATA_KEY_DOCTRINE_SLUG] == "mahan"
+
+
+class TestReciprocalRankFusion:
+    def test_nodes_ranked_by_both_lists_win_and_scores_are_rescaled(self):
+        a, b, c = (NodeWithScore(node=n, score=0.5) for n in _NODES)
+
+        fused = reciprocal_rank_fusion([[a, b], [b, c]], top_k=2)
+
+        assert [n.node.node_id for n in fused] == ["b", "a"]
+        assert fused[0].score == 1.0
+        assert fused[1].score < 1.0
+
+    def test_empty_rankings(self):
+        assert reciprocal_rank_fusion([[], []], top_k=3) == []
+
+
+class _Router:
+    def __init__(self, persist_dir) -> None:
+        self.persist_dir = persist_dir
+        self.version = "v1"
+
+
+class TestKeywordIndexReload:
+    def test_keyword_index_reloads_when_index_version_changes(self, tmp_path):
+        BM25KeywordIndex.from_nodes(_NODES[:1]).save(tmp_path)
+        router = _Router(tmp_path)
+        retriever = LlamaIndexEvidenceRetriever(router=router, mode=RetrievalMode.KEYWORD, diversity=0.0)
+        before = retriever.retrieve("naval", top_k=1)
+
+        BM25KeywordIndex.from_nodes(_NODES).save(tmp_path)
+        router.version = "v2"
+        after = retriever.retrieve("naval", top_k=1)
+
+        assert before == []
+        assert after[0].source.startswith("mahan")
@@ -0,0 +1,54 @@
+from llama_index.core.llms import ChatMessage
+
+from integrations.llamaindex.llm_adapter import MasxLLMBridge
+from integrations.llms.sse import SSE_DONE, iter_sse_data
+
+
+class _StreamingPort:
+    def call(self, prompt: str, system_prompt: str | None = None) -> str:
+        return "".join(self.call_stream(prompt))
+
+    def call_stream(self, prompt: str, system_prompt: str | None = None):
+        yield from ("Know ", "the ", "enemy.")
+
+
+class TestIterSseData:
+    def test_multi_line_data_is_joined_into_one_event(self):
+        lines = ["data: first", "data: second", "", "data: third", ""]
+
+        assert list(iter_sse_data(lines)) == ["first\nsecond", "third"]
+
+    def test_comments_and_other_fields_are_skipped(self):
+        lines = [": keep-alive", "event: message_delta", "id: 7", "data:{\"a\": 1}", ""]
+
+        assert list(iter_sse_data(lines)) == ['{"a": 1}']
+
+    def test_done_marker_is_passed_through(self):
+        lines = ["data: {}", "", f"data: {SSE_DONE}", ""]
+
+        assert list(iter_sse_data(lines))[-1] == SSE_DONE
+
+    def test_event_split_across_reads_and_unterminated_tail_are_emitted(self):
+        reads = [["data: par"], ["data: tial", ""], ["data: tail"]]
+
+        events = list(iter_sse_data(line for read in reads for line in read))
+
+        assert events == ["par\ntial", "tail"]
+
+
+class TestMasxLLMBridgeStreaming:
+    def test_stream_complete_accumulates_deltas(self):
+        bridge = MasxLLMBridge(llm_port=_StreamingPort())
+
+        responses = list(bridge.stream_complete("prompt"))
+
+        assert [r.delta for r in responses] == ["Know ", "the ", "enemy."]
+        assert responses[-1].text == "Know the enemy."
+
+    def test_stream_chat_yields_growing_assistant_message(self):
+        bridge = MasxLLMBridge(llm_port=_StreamingPort())
+
+        responses = list(bridge.stream_chat([ChatMessage(role="user", content="prompt")]))
+
+        assert responses[-1].message.content == "Know the enemy."
+        assert responses[-1].delta == "enemy."
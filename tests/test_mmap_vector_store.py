@@ -0,0 +1,124 @@
+import pytest
+from llama_index.core.schema import TextNode
+from llama_index.core.vector_stores import FilterOperator, MetadataFilter, MetadataFilters
+from llama_index.core.vector_stores.types import VectorStoreQuery
+
+from core.domain.constants import METADATA_KEY_DOCTRINE_SLUG, EmbeddingPrecision
+from integrations.llamaindex import mmap_vector_store
+from integrations.llamaindex.mmap_vector_store import MmapVectorStore
+
+_EMBEDDINGS = {
+    "sun_tzu-1": [1.0, 0.0, 0.0],
+    "sun_tzu-2": [0.9, 0.1, 0.0],
+    "mahan-1": [0.0, 1.0, 0.0],
+    "kautilya-1": [0.0, 0.0, 1.0],
+}
+
+
+def _node(node_id: str) -> TextNode:
+    return TextNode(
+        id_=node_id,
+        text=f"passage {node_id}",
+        embedding=_EMBEDDINGS[node_id],
+        metadata={METADATA_KEY_DOCTRINE_SLUG: node_id.split("-")[0]},
+    )
+
+
+def _store(tmp_path, precision: EmbeddingPrecision) -> MmapVectorStore:
+    store = MmapVectorStore.from_persist_dir(tmp_path, precision=precision)
+    store.add([_node(node_id) for node_id in _EMBEDDINGS])
+    store.persist()
+    return store
+
+
+def _query(store: MmapVectorStore, embedding, *, top_k=2, filters=None):
+    return store.query(VectorStoreQuery(query_embedding=embedding, similarity_top_k=top_k, filters=filters))
+
+
+@pytest.mark.parametrize("precision", list(EmbeddingPrecision))
+class TestMmapVectorStore:
+    def test_round_trip_through_reload(self, tmp_path, precision):
+        _store(tmp_path, precision)
+
+        reloaded = MmapVectorStore.from_persist_dir(tmp_path)
+        result = _query(reloaded, [1.0, 0.0, 0.0])
+
+        assert reloaded.precision == precision
+        assert result.ids == ["sun_tzu-1", "sun_tzu-2"]
+        assert result.similarities[0] == pytest.approx(1.0, abs=1e-2)
+        assert result.nodes[0].get_content() == "passage sun_tzu-1"
+
+    def test_slug_filters_restrict_candidates(self, tmp_path, precision):
+        store = _store(tmp_path, precision)
+        one = MetadataFilters(filters=[MetadataFilter(key=METADATA_KEY_DOCTRINE_SLUG, value="mahan")])
+        several = MetadataFilters(filters=[
+            MetadataFilter(key=METADATA_KEY_DOCTRINE_SLUG, value=["mahan", "kautilya"], operator=FilterOperator.IN),
+        ])
+
+        assert _query(store, [1.0, 0.0, 0.0], filters=one).ids == ["mahan-1"]
+        assert set(_query(store, [1.0, 0.0, 0.0], top_k=5, filters=several).ids) == {"mahan-1", "kautilya-1"}
+
+    def test_delete_slug_survives_reload(self, tmp_path, precision):
+        store = _store(tmp_path, precision)
+
+        store.delete_slug("sun_tzu")
+        reloaded = MmapVectorStore.from_persist_dir(tmp_path)
+
+        assert reloaded.slugs == ["kautilya", "mahan"]
+        assert _query(reloaded, [1.0, 0.0, 0.0], top_k=5).ids[0] != "sun_tzu-1"
+
+    def test_add_appends_to_the_current_generation(self, tmp_path, precision):
+        store = _store(tmp_path, precision)
+        files = sorted(path.name for path in tmp_path.iterdir())
+
+        store.add([TextNode(
+            id_="corbett-1",
+            text="passage corbett-1",
+            embedding=[0.0, 0.7, 0.7],
+            metadata={METADATA_KEY_DOCTRINE_SLUG: "corbett"},
+        )])
+        store.persist()
+        reloaded = MmapVectorStore.from_persist_dir(tmp_path)
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == files
+        assert reloaded.slugs == ["corbett", "kautilya", "mahan", "sun_tzu"]
+        assert _query(reloaded, [0.0, 0.7, 0.7], top_k=1).nodes[0].get_content() == "passage corbett-1"
+        assert _query(reloaded, [1.0, 0.0, 0.0]).ids == ["sun_tzu-1", "sun_tzu-2"]
+
+    def test_compaction_replaces_generation_but_keeps_foreign_files(self, tmp_path, precision):
+        store = _store(tmp_path, precision)
+        foreign = tmp_path / "embeddings.tmp-writer.npy"
+        foreign.write_bytes(b"in flight")
+        before = set(tmp_path.glob("embeddings-*.bin"))
+
+        store.delete_slug("sun_tzu")
+        store.delete_slug("mahan")
+
+        assert foreign.exists()
+        assert len(set(tmp_path.glob("embeddings-*.bin")) - before) == 1
+        assert not before & set(tmp_path.glob("embeddings-*.bin"))
+        assert MmapVectorStore.from_persist_dir(tmp_path).get_nodes()[0].node_id == "kautilya-1"
+
+    def test_interrupted_delete_keeps_previous_rows(self, tmp_path, precision, monkeypatch):
+        store = _store(tmp_path, precision)
+
+        def crash(path, text):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(mmap_vector_store, "_atomic_write_text", crash)
+        with pytest.raises(OSError):
+            store.delete_slug("sun_tzu")
+        monkeypatch.undo()
+        reloaded = MmapVectorStore.from_persist_dir(tmp_path)
+
+        assert "sun_tzu" in reloaded.slugs
+        assert _query(reloaded, [1.0, 0.0, 0.0]).ids == ["sun_tzu-1", "sun_tzu-2"]
+
+
+class TestUnsupportedFilter:
+    def test_unsupported_operator_raises_value_error(self, tmp_path):
+        store = _store(tmp_path, EmbeddingPrecision.FLOAT16)
+        filters = MetadataFilters(filters=[MetadataFilter(key="part_index", value=1, operator=FilterOperator.GT)])
+
+        with pytest.raises(ValueError):
+            _query(store, [1.0, 0.0, 0.0], filters=filters)
@@ -0,0 +1,59 @@
+from core.doctrine.processor.helpers.ocr_cache import CachedPageOcr, OcrCache
+
+
+class _Pixmap:
+    def __init__(self, pixels: bytes) -> None:
+        self.samples = pixels
+        self.width, self.height, self.n = len(pixels), 1, 1
+
+    def tobytes(self, fmt: str) -> bytes:
+        return self.samples
+
+
+class _Page:
+    def __init__(self, *, text: str = "", pixels: bytes = b"") -> None:
+        self._text = text
+        self._pixels = pixels
+
+    def get_text(self) -> str:
+        return self._text
+
+    def get_pixmap(self, *, dpi: int) -> _Pixmap:
+        return _Pixmap(self._pixels)
+
+
+class _Reader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def readtext(self, image: bytes):
+        self.calls += 1
+        return [(None, image.decode(), 0.9)]
+
+
+class TestCachedPageOcr:
+    def test_identical_page_images_are_ocred_once_across_runs(self, tmp_path):
+        pages = [_Page(text="Native text."), _Page(pixels=b"scan-1"), _Page(pixels=b"scan-2")]
+        reader = _Reader()
+        first = CachedPageOcr(lambda: reader, engine_version="v1", dpi=72, cache=OcrCache(tmp_path))
+        [first.page_text(page, document="a.pdf") for page in pages]
+
+        rerun = CachedPageOcr(lambda: reader, engine_version="v1", dpi=72, cache=OcrCache(tmp_path))
+        texts = [rerun.page_text(page, document="a.pdf") for page in pages]
+
+        assert texts == ["Native text.", "scan-1", "scan-2"]
+        assert reader.calls == 2
+        assert rerun.report()["a.pdf"] == {
+            "pages": 3, "text_pages": 1, "cache_hits": 2, "cache_misses": 0, "coverage": 1.0,
+        }
+
+    def test_engine_version_or_dpi_change_misses_the_cache(self, tmp_path):
+        page = _Page(pixels=b"scan")
+        reader = _Reader()
+        CachedPageOcr(lambda: reader, engine_version="v1", dpi=72, cache=OcrCache(tmp_path)).page_text(page, document="a.pdf")
+
+        for engine_version, dpi in (("v2", 72), ("v1", 150)):
+            ocr = CachedPageOcr(lambda: reader, engine_version=engine_version, dpi=dpi, cache=OcrCache(tmp_path))
+            ocr.page_text(page, document="a.pdf")
+
+        assert reader.calls == 3
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from core.doctrine.processor.helpers.page_stream import (
+    StreamingTextCleaner,
+    clean_text,
+    stream_pages_to_file,
+)
+
+_PAGES = [
+    "  \n\nChapter 1\t\tLaying  Plans\n\n\n\n",
+    "\n\n\nThe art of war is of vital importance.   ",
+    "",
+    " \t\n\n\n\nIt is a matter of life and death.\n",
+    "Hence it is a subject of inquiry.\n\n\n",
+]
+
+
+class TestStreamingTextCleaner:
+    def test_pieces_clean_exactly_like_the_whole_document(self):
+        document = "\n".join(_PAGES)
+        rng = random.Random(7)
+        cuts = sorted(rng.sample(range(1, len(document)), 25))
+        pieces = [document[i:j] for i, j in zip([0, *cuts], [*cuts, len(document)])]
+        cleaner = StreamingTextCleaner()
+
+        assert "".join(cleaner.feed(piece) for piece in pieces) == clean_text(document)
+
+
+class TestStreamPagesToFile:
+    def test_crash_resumes_at_first_unwritten_page(self, tmp_path):
+        source = tmp_path / "art_of_war.pdf"
+        source.write_bytes(b"%PDF")
+        dest = tmp_path / "art_of_war.md"
+        requested: list[int] = []
+
+        def crashing_pages(start: int):
+            requested.append(start)
+            for number in range(start, len(_PAGES)):
+                if number == 3 and len(requested) == 1:
+                    raise RuntimeError("OCR crashed")
+                yield _PAGES[number]
+
+        with pytest.raises(RuntimeError):
+            stream_pages_to_file(source, dest, crashing_pages)
+        pages = stream_pages_to_file(source, dest, crashing_pages)
+
+        assert requested == [0, 3]
+        assert pages == len(_PAGES)
+        assert dest.read_text(encoding="utf-8") == clean_text("\n".join(_PAGES))
+        assert not (tmp_path / "art_of_war.md.cursor").exists()
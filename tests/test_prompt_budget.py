@@ -0,0 +1,32 @@
+from core.doctrine.text_splitter import count_tokens
+from core.domain.constants import PromptPriority
+from core.prompts.prompt_budget import PromptSection, assemble_prompt
+
+_ITEMS = [f"- passage {i} " + "context " * 50 for i in range(20)]
+
+
+class TestAssemblePrompt:
+    def test_prompt_under_budget_is_unchanged(self):
+        result = assemble_prompt(
+            ["Evidence:\n", PromptSection(name="evidence", items=["- a", "- b"]), "\nEnd"],
+            budget=100,
+        )
+
+        assert result == "Evidence:\n- a\n- b\nEnd"
+
+    def test_empty_section_uses_fallback(self):
+        result = assemble_prompt(
+            ["Evidence:\n", PromptSection(name="evidence", fallback="None."), "\nEnd"],
+        )
+
+        assert result == "Evidence:\nNone.\nEnd"
+
+    def test_low_priority_section_is_trimmed_first(self):
+        low = PromptSection(name="rag", items=_ITEMS, priority=PromptPriority.LOW)
+        high = PromptSection(name="synthesis", items=_ITEMS[:3], priority=PromptPriority.HIGH)
+
+        result = assemble_prompt(["Context:\n", low, "\nSynthesis:\n", high], budget=400)
+
+        assert count_tokens(result) <= 400
+        assert result.endswith(_ITEMS[2])
+        assert _ITEMS[5] not in result
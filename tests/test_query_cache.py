@@ -0,0 +1,83 @@
+import time
+
+from core.domain.constants import RetrievalMode
+from core.domain.forecast_models import Evidence
+from integrations.llamaindex.evidence_retriever import LlamaIndexEvidenceRetriever
+from integrations.llamaindex.query_cache import QueryResultCache
+
+_RESULTS = [Evidence(source="sun_tzu", snippet="All warfare is based on deception.", relevance_score=0.9)]
+
+
+def _put(cache: QueryResultCache, query: str, *, top_k: int = 5, version: str | None = None) -> None:
+    cache.get(query, top_k=top_k, version=version)
+    cache.put(query, top_k=top_k, results=_RESULTS, version=version)
+
+
+class _Router:
+    """Stands in for a router opened at ``version`` that returns nothing."""
+
+    def __init__(self, version: str) -> None:
+        self.version = version
+        self.queries = 0
+
+    def retrieve(self, query, *, top_k):
+        self.queries += 1
+        return []
+
+
+class TestQueryResultCache:
+    def test_hit_after_put_with_normalized_query_and_stats(self):
+        cache = QueryResultCache()
+        _put(cache, "Taiwan strait")
+
+        assert cache.get("  taiwan   STRAIT ", top_k=5, version=None) == _RESULTS
+        assert cache.get("taiwan strait", top_k=10, version=None) is None
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.hit_rate) == (1, 2, 1 / 3)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = QueryResultCache(maxsize=2)
+        _put(cache, "a")
+        _put(cache, "b")
+        cache.get("a", top_k=5, version=None)
+
+        _put(cache, "c")
+
+        assert cache.get("a", top_k=5, version=None) is not None
+        assert cache.get("b", top_k=5, version=None) is None
+
+    def test_entries_expire_after_ttl(self):
+        cache = QueryResultCache(ttl_seconds=0.05)
+        _put(cache, "a")
+
+        time.sleep(0.1)
+
+        assert cache.get("a", top_k=5, version=None) is None
+
+    def test_version_change_clears_entries(self):
+        cache = QueryResultCache()
+        _put(cache, "a", version="v1")
+
+        assert cache.get("a", top_k=5, version="v2") is None
+        assert cache.stats.invalidations == 1
+
+    def test_results_from_an_older_index_are_not_cached(self):
+        cache = QueryResultCache()
+        cache.get("a", top_k=5, version="v2")
+
+        cache.put("a", top_k=5, results=_RESULTS, version="v1")
+
+        assert cache.get("a", top_k=5, version="v2") is None
+
+
+class TestEvidenceRetrieverCache:
+    def test_cache_follows_the_version_of_the_router_queried(self):
+        routers = [_Router("v1")]
+        retriever = LlamaIndexEvidenceRetriever(router_source=lambda: routers[-1], mode=RetrievalMode.VECTOR, diversity=0.0)
+        retriever.retrieve("deterrence")
+        retriever.retrieve("deterrence")
+
+        routers.append(_Router("v2"))
+        retriever.retrieve("deterrence")
+
+        assert [router.queries for router in routers] == [1, 1]
+        assert retriever.cache_stats.invalidations == 1
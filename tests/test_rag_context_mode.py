@@ -0,0 +1,66 @@
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from core.domain.agents.doctrine_council import run_doctrine_council
+from core.domain.constants import RagContextMode
+from core.domain.forecast_models import DoctrinePack
+from integrations.forecasting import build_forecast_ports
+
+
+class _CountingLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def call(self, prompt, system_prompt=None) -> str:
+        self.calls += 1
+        return "analysis"
+
+
+class _SynthesizingTool:
+    """Stands in for a query engine tool, which spends one LLM call synthesizing."""
+
+    def __init__(self, llm: _CountingLLM) -> None:
+        self._llm = llm
+
+    def call(self, question):
+        return self._llm.call(question)
+
+
+class _Retriever:
+    def retrieve(self, question):
+        return [NodeWithScore(node=TextNode(text="Supreme excellence is winning without fighting."), score=0.9)]
+
+
+class _Router:
+    def retrieve_grouped(self, query, *, slugs, top_k):
+        return {}
+
+
+class _Registry:
+    def __init__(self, llm: _CountingLLM) -> None:
+        self.router = _Router()
+        self._llm = llm
+
+    def get(self, slug):
+        return _SynthesizingTool(self._llm)
+
+    def get_retriever(self, slug):
+        return _Retriever()
+
+
+def _council_llm_calls(mode: RagContextMode) -> int:
+    llm = _CountingLLM()
+    packs = [
+        DoctrinePack(doctrine_id="artofwar", name="The Art of War"),
+        DoctrinePack(doctrine_id="seapower", name="Sea Power"),
+    ]
+    ports = build_forecast_ports(llm=llm, packs=packs, registry=_Registry(llm), mode=mode)
+
+    run_doctrine_council(["Will X happen?"], [], ports.doctrine_agents, passage_port=ports.passage_port)
+
+    return llm.calls
+
+
+class TestRagContextMode:
+    def test_retrieval_mode_makes_one_llm_call_per_agent(self):
+        assert _council_llm_calls(RagContextMode.SYNTHESIS) == 4
+        assert _council_llm_calls(RagContextMode.RETRIEVAL) == 2
@@ -0,0 +1,59 @@
+import pytest
+
+from core.doctrine import text_splitter
+from core.doctrine.text_splitter import ApproximateEncoding, count_tokens, iter_segments, split_text
+
+_TEXT = " ".join(f"Sentence {i} discusses deterrence and escalation." for i in range(400))
+
+
+class TestSplitText:
+    def test_segments_respect_limit_and_rejoin_losslessly(self):
+        segments = split_text(_TEXT, max_tokens=100)
+
+        assert max(count_tokens(s) for s in segments) <= 100
+        assert "".join(segments) == _TEXT
+
+    def test_segments_end_on_sentence_boundaries(self):
+        segments = split_text(_TEXT, max_tokens=100)
+
+        assert all(s.rstrip().endswith(".") for s in segments)
+
+    def test_overlap_repeats_tail_of_previous_segment(self):
+        segments = split_text(_TEXT, max_tokens=100, overlap_tokens=20)
+
+        assert segments[0][-30:] in segments[1]
+
+    def test_streamed_blocks_match_whole_text(self):
+        blocks = [_TEXT[i:i + 37] for i in range(0, len(_TEXT), 37)]
+
+        assert list(iter_segments(blocks, max_tokens=100)) == split_text(_TEXT, max_tokens=100)
+
+    def test_sentences_are_encoded_in_batches(self, monkeypatch):
+        batch_sizes: list[int] = []
+
+        class _Recording(ApproximateEncoding):
+            def encode_ordinary_batch(self, texts, *, num_threads=8):
+                batch_sizes.append(len(texts))
+                return super().encode_ordinary_batch(texts)
+
+        monkeypatch.setattr(text_splitter, "_ENCODING", _Recording())
+        segments = split_text(_TEXT, max_tokens=100)
+
+        assert "".join(segments) == _TEXT
+        assert batch_sizes == [256, 144]
+
+    def test_overlap_must_be_smaller_than_segment(self):
+        with pytest.raises(ValueError):
+            split_text(_TEXT, max_tokens=100, overlap_tokens=100)
+
+
+class TestEncodingFallback:
+    def test_unavailable_encoding_falls_back_to_approximate_counts(self, monkeypatch):
+        def offline(name):
+            raise ConnectionError("cannot resolve openaipublic.blob.core.windows.net")
+
+        monkeypatch.setattr(text_splitter, "get_encoding", offline)
+        monkeypatch.setattr(text_splitter, "_ENCODING", None)
+
+        assert count_tokens("Know the enemy and know yourself.") > 0
+        assert isinstance(text_splitter._ENCODING, ApproximateEncoding)
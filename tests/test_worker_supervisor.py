@@ -0,0 +1,104 @@
+from workers.base_worker import BaseWorker
+from workers.metrics import WorkerMetrics
+from workers.supervisor import WorkerSupervisor
+
+
+class _FakeWorker(BaseWorker):
+    def __init__(self) -> None:
+        super().__init__(name="fake")
+        self.alive = False
+        self.drained: bool | None = None
+        self.queued: list[str] = []
+
+    def start(self) -> None:
+        self.alive = True
+
+    def stop(self, *, drain: bool = True) -> None:
+        self.alive = False
+        self.drained = drain
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def take_pending(self) -> list[str]:
+        queued, self.queued = self.queued, []
+        return queued
+
+    def resume(self, jobs: list[str]) -> None:
+        self.queued.extend(jobs)
+
+
+class TestWorkerSupervisor:
+    def test_dead_worker_is_replaced_by_a_fresh_instance(self):
+        created: list[_FakeWorker] = []
+
+        def factory() -> _FakeWorker:
+            created.append(_FakeWorker())
+            return created[-1]
+
+        supervisor = WorkerSupervisor({"fake": factory}, check_interval=60)
+        supervisor.start()
+        created[0].alive = False
+
+        supervisor.check()
+        status = supervisor.status()[0]
+        supervisor.stop()
+
+        assert len(created) == 2
+        assert status["running"] is True and status["restarts"] == 1
+        assert created[1].drained is True
+
+    def test_pending_jobs_move_to_the_replacement(self):
+        created: list[_FakeWorker] = []
+
+        def factory() -> _FakeWorker:
+            created.append(_FakeWorker())
+            return created[-1]
+
+        supervisor = WorkerSupervisor({"fake": factory}, check_interval=60)
+        supervisor.start()
+        created[0].queued = ["clausewitz", "sun_tzu"]
+        created[0].alive = False
+
+        supervisor.check()
+        supervisor.stop()
+
+        assert created[0].drained is False
+        assert created[1].queued == ["clausewitz", "sun_tzu"]
+
+    def test_failed_start_is_reported_and_retried(self):
+        attempts: list[int] = []
+
+        def factory() -> _FakeWorker:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("raw dir unavailable")
+            return _FakeWorker()
+
+        supervisor = WorkerSupervisor({"fake": factory}, check_interval=60)
+        supervisor.start()
+        failed = supervisor.status()[0]
+        supervisor.check()
+        recovered = supervisor.status()[0]
+        supervisor.stop()
+
+        assert failed["running"] is False
+        assert failed["last_error"] == "OSError: raw dir unavailable"
+        assert recovered["running"] is True
+
+
+class TestWorkerMetrics:
+    def test_snapshot_reports_failures_and_stage_latency(self):
+        metrics = WorkerMetrics()
+        for error in (None, ValueError("bad chunk")):
+            metrics.job_started()
+            metrics.job_finished(error=error)
+        metrics.observe_stage("chunked", 0.3)
+        metrics.observe_stage("chunked", 45.0)
+
+        snapshot = metrics.snapshot()
+
+        assert (snapshot["completed"], snapshot["failed"], snapshot["in_flight"]) == (1, 1, 0)
+        assert snapshot["last_error"] == "ValueError: bad chunk"
+        assert snapshot["stage_latency"]["chunked"]["buckets"]["<=0.5s"] == 1
+        assert snapshot["stage_latency"]["chunked"]["buckets"]["<=120s"] == 1
@@ -1,3 +1,4 @@
 from .raw_doctrine_watcher_worker import RawDoctrineWatcherWorker
+from .supervisor import WorkerSupervisor
 
-__all__ = ["RawDoctrineWatcherWorker"]
+__all__ = ["RawDoctrineWatcherWorker", "WorkerSupervisor"]
@@ -1,21 +1,46 @@
 import logging
 from abc import ABC, abstractmethod
 
+from .metrics import WorkerMetrics
+
 logger = logging.getLogger(__name__)
 
 
 class BaseWorker(ABC):
+    """A background worker; ``start`` returns once the worker's threads are running."""
+
     def __init__(self, *, name: str) -> None:
         self.name = name
+        self.metrics = WorkerMetrics()
 
     @abstractmethod
     def start(self) -> None: ...
 
     @abstractmethod
-    def stop(self) -> None: ...
+    def stop(self, *, drain: bool = True) -> None: ...
+
+    @abstractmethod
+    def is_alive(self) -> bool: ...
+
+    def queue_depth(self) -> int:
+        return 0
+
+    def take_pending(self) -> list[str]:
+        """Return and forget the jobs a ``stop(drain=False)`` left unprocessed."""
+        return []
+
+    def resume(self, jobs: list[str]) -> None:
+        """Queue jobs handed over from a previous instance of this worker."""
+        if jobs:
+            logger.warning("%s cannot resume jobs, dropped %d", self.name, len(jobs))
 
     def log(self, message: str) -> None:
         logger.info("%s: %s", self.name, message)
 
-    def status(self) -> dict[str, str | bool]:
-        return {"name": self.name, "running": True}
+    def status(self) -> dict:
+        return {
+            "name": self.name,
+            "running": self.is_alive(),
+            "queue_depth": self.queue_depth(),
+            **self.metrics.snapshot(),
+        }
@@ -0,0 +1,128 @@
+import json
+import logging
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from core.config import Paths
+from core.config.settings import get_settings
+from core.doctrine.metadata import DoctrineMetadata, enrich_metadata_from_chunks
+from core.doctrine.pipeline import DoctrinePipeline, PipelineStage
+from core.doctrine.processor import DoctrineProcessor
+from core.doctrine.processor.helpers import ChunkAndEnrich
+from core.domain.constants import DEFAULT_PIPELINE_STAGE_CONCURRENCY, DoctrineStatus
+from core.domain.exceptions import ConfigurationError
+from core.llm.ports import LLMClientPort
+from .metrics import WorkerMetrics
+
+logger = logging.getLogger(__name__)
+
+_PROVIDER_MODEL_SEPARATOR = ":"
+
+
+def build_doctrine_pipeline(*, metrics: WorkerMetrics | None = None) -> DoctrinePipeline:
+    """raw → cleaned → chunked → tagged → indexed, wired to the configured services."""
+    settings = get_settings()
+    concurrency = {**DEFAULT_PIPELINE_STAGE_CONCURRENCY, **settings.pipeline_stage_concurrency}
+    clients: list[LLMClientPort] | None = None
+
+    def chunk(slug: str) -> None:
+        nonlocal clients
+        if clients is None:
+            clients = _create_chunking_clients(settings.chunking_llms)
+        ChunkAndEnrich.process(slug, clients, overwrite=True)
+
+    stages = [
+        (DoctrineStatus.RAW_COLLECTED, _raw_files, _generate_metadata),
+        (DoctrineStatus.CLEANED, _raw_files, _clean),
+        (DoctrineStatus.CHUNKED, _cleaned_file, chunk),
+        (DoctrineStatus.TAGGED, _chunk_file, _tag),
+        (DoctrineStatus.INDEXED, _cleaned_file, _index),
+    ]
+    return DoctrinePipeline(
+        [
+            PipelineStage(
+                status=status,
+                inputs=inputs,
+                run=_timed(status, run, metrics) if metrics else run,
+                concurrency=concurrency[status],
+            )
+            for status, inputs, run in stages
+        ],
+        on_status=DoctrineMetadata.set_status,
+        on_remove=_remove,
+    )
+
+
+def _timed(
+    status: DoctrineStatus,
+    run: Callable[[str], None],
+    metrics: WorkerMetrics,
+) -> Callable[[str], None]:
+    def timed_run(slug: str) -> None:
+        start = time.perf_counter()
+        try:
+            run(slug)
+        finally:
+            metrics.observe_stage(status.value, time.perf_counter() - start)
+
+    return timed_run
+
+
+def _raw_files(slug: str) -> list[Path]:
+    return DoctrineMetadata.raw_files(slug, Paths.RAW_DIR)
+
+
+def _cleaned_file(slug: str) -> list[Path]:
+    return [Paths.CLEANED_DIR / f"{slug}.md"]
+
+
+def _chunk_file(slug: str) -> list[Path]:
+    return [Paths.CHUNK_DIR / f"{slug}_chunks.json"]
+
+
+def _generate_metadata(slug: str) -> None:
+    metadata = DoctrineMetadata.for_slug(slug, Paths.RAW_DIR)
+    if metadata is None:
+        # The raw files went away between the event and this stage.
+        logger.warning("No raw files left for %s, skipped metadata generation", slug)
+        return
+    metadata.save()
+
+
+def _clean(slug: str) -> None:
+    DoctrineProcessor.clean_doctrine(slug, _raw_files(slug))
+
+
+def _tag(slug: str) -> None:
+    (chunk_path,) = _chunk_file(slug)
+    chunks = json.loads(chunk_path.read_text(encoding="utf-8"))
+    enrich_metadata_from_chunks(DoctrineMetadata.path_for(slug), chunks)
+
+
+def _index(slug: str) -> None:
+    from integrations.llamaindex.doctrine_reader import read_cleaned_doctrine
+    from integrations.llamaindex.index_builder import replace_doctrine
+
+    replace_doctrine(slug, read_cleaned_doctrine(slug))
+
+
+def _remove(slug: str) -> None:
+    from integrations.llamaindex.index_builder import replace_doctrine
+
+    replace_doctrine(slug, [])
+    DoctrineMetadata.delete(slug)
+    for path in (*_cleaned_file(slug), *_chunk_file(slug)):
+        path.unlink(missing_ok=True)
+
+
+def _create_chunking_clients(specs: list[str]) -> list[LLMClientPort]:
+    from integrations.llms.factory import LLMClientFactory
+
+    if not specs:
+        raise ConfigurationError("CHUNKING_LLMS is empty; set it to e.g. [\"claude:<model>\"]")
+    clients: list[LLMClientPort] = []
+    for spec in specs:
+        provider, _, model = spec.partition(_PROVIDER_MODEL_SEPARATOR)
+        clients.append(LLMClientFactory.get_client(provider, model=model))
+    return clients
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from .metrics import WorkerMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class DebouncedJobQueue:
+    """Coalesces bursts of submissions per key into one job on a worker pool.
+
+    Submitting a key that is already pending pushes its deadline back, so a
+    file copy firing dozens of modified events produces a single job once the
+    events go quiet. A key never runs on two workers at once: a submission
+    that arrives while its job is running schedules exactly one follow-up run.
+    """
+
+    def __init__(
+        self,
+        *,
+        handler: Callable[[str], None],
+        debounce_seconds: float,
+        max_workers: int,
+        name: str = "jobs",
+        metrics: WorkerMetrics | None = None,
+    ) -> None:
+        self._handler = handler
+        self._debounce = debounce_seconds
+        self._max_workers = max_workers
+        self._name = name
+        self._metrics = metrics or WorkerMetrics()
+        self._cond = threading.Condition()
+        self._deadlines: dict[str, float] = {}
+        self._running: set[str] = set()
+        self._stopping = False
+        self._executor: ThreadPoolExecutor | None = None
+        self._dispatcher: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._deadlines)
+
+    @property
+    def in_flight(self) -> int:
+        with self._cond:
+            return len(self._running)
+
+    @property
+    def is_running(self) -> bool:
+        return self._dispatcher is not None and self._dispatcher.is_alive()
+
+    def start(self) -> None:
+        if self._dispatcher:
+            return
+        self._stopping = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix=self._name,
+        )
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop,
+            name=f"{self._name}-dispatcher",
+            daemon=True,
+        )
+        self._dispatcher.start()
+
+    def submit(self, key: str) -> None:
+        with self._cond:
+            if self._stopping:
+                logger.debug("Queue %s is stopping, dropped job for %s", self._name, key)
+                return
+            self._deadlines[key] = time.monotonic() + self._debounce
+            self._cond.notify()
+
+    def stop(self, *, drain: bool = True) -> list[str]:
+        """Stop dispatching; with ``drain`` pending jobs run now, otherwise their keys are returned."""
+        skipped: list[str] = []
+        with self._cond:
+            self._stopping = True
+            if drain:
+                now = time.monotonic()
+                self._deadlines = dict.fromkeys(self._deadlines, now)
+            else:
+                skipped = list(self._deadlines)
+                self._deadlines.clear()
+            self._cond.notify()
+        if self._dispatcher:
+            self._dispatcher.join()
+            self._dispatcher = None
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        return skipped
+
+    def _dispatch_loop(self) -> None:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                for key in [
+                    k for k, due in self._deadlines.items()
+                    if due <= now and k not in self._running
+                ]:
+                    del self._deadlines[key]
+                    self._running.add(key)
+                    self._executor.submit(self._run, key)
+                if self._stopping and not self._deadlines:
+                    return
+                self._cond.wait(timeout=self._next_wait(now))
+
+    def _next_wait(self, now: float) -> float | None:
+        waiting = [
+            due for key, due in self._deadlines.items() if key not in self._running
+        ]
+        return max(min(waiting) - now, 0.0) if waiting else None
+
+    def _run(self, key: str) -> None:
+        self._metrics.job_started()
+        error: Exception | None = None
+        try:
+            self._handler(key)
+        except Exception as e:
+            error = e
+            logger.exception("Job %s failed in queue %s", key, self._name)
+        finally:
+            self._metrics.job_finished(error=error)
+            with self._cond:
+                self._running.discard(key)
+                self._cond.notify()
@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import deque
+
+from core.domain.constants import LATENCY_BUCKETS_SECONDS, WORKER_THROUGHPUT_WINDOW_SECONDS
+
+
+class LatencyHistogram:
+    """Per-bucket counts of observed durations; each bucket is ``<= bound``."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS_SECONDS) -> None:
+        self._bounds = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        idx = next((i for i, bound in enumerate(self._bounds) if seconds <= bound), len(self._bounds))
+        self._counts[idx] += 1
+        self.count += 1
+        self.total_seconds += seconds
+
+    def snapshot(self) -> dict:
+        labels = [f"<={bound:g}s" for bound in self._bounds] + ["+inf"]
+        return {
+            "count": self.count,
+            "mean_seconds": self.total_seconds / self.count if self.count else 0.0,
+            "buckets": dict(zip(labels, self._counts)),
+        }
+
+
+class WorkerMetrics:
+    """Thread-safe job counters, throughput and per-stage latencies of one worker."""
+
+    def __init__(self, *, window_seconds: float = WORKER_THROUGHPUT_WINDOW_SECONDS) -> None:
+        self._lock = threading.Lock()
+        self._window = window_seconds
+        self._started_at = time.monotonic()
+        self._finished_at: deque[float] = deque()
+        self._stages: dict[str, LatencyHistogram] = {}
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.last_error: str | None = None
+
+    def job_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def job_finished(self, *, error: BaseException | None = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight -= 1
+            if error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+                self.last_error = f"{type(error).__name__}: {error}"
+            self._finished_at.append(now)
+            self._trim(now)
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._stages.setdefault(stage, LatencyHistogram()).observe(seconds)
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            span = min(self._window, now - self._started_at) or 1.0
+            return {
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "failed": self.failed,
+                "jobs_per_second": len(self._finished_at) / span,
+                "last_error": self.last_error,
+                "stage_latency": {
+                    stage: histogram.snapshot() for stage, histogram in self._stages.items()
+                },
+            }
+
+    def _trim(self, now: float) -> None:
+        while self._finished_at and now - self._finished_at[0] > self._window:
+            self._finished_at.popleft()
@@ -1,24 +1,42 @@
 from pathlib import Path
+
 from watchdog.events import FileSystemEventHandler
-from core.config import Paths
+
 from core.doctrine.metadata import DoctrineMetadata
+from core.domain.constants import SUPPORTED_DOC_EXTENSIONS
+from .job_queue import DebouncedJobQueue
+
 
+class RawDoctrineHandler(FileSystemEventHandler):
+    """Turns raw-file events into one debounced job per doctrine slug.
 
-SUPPORTED_EXTENSIONS = (".txt", ".pdf", ".html")
+    Runs on the observer thread, so it only resolves the slug and enqueues;
+    the actual processing happens on the queue's workers.
+    """
 
+    def __init__(self, *, queue: DebouncedJobQueue) -> None:
+        super().__init__()
+        self._queue = queue
 
-class RawDoctrineHandler(FileSystemEventHandler):
     def on_created(self, event) -> None:
         self._process(event)
 
     def on_modified(self, event) -> None:
         self._process(event)
 
-    def _process(self, event) -> None:
-        if event.is_directory or not event.src_path.endswith(SUPPORTED_EXTENSIONS):
-            return
+    def on_deleted(self, event) -> None:
+        self._process(event)
+
+    def on_moved(self, event) -> None:
+        self._process(event)
+        self._enqueue(event.dest_path)
 
-        file_path = Path(event.src_path)
-        slug = DoctrineMetadata.extract_slug(file_path.name)
+    def _process(self, event) -> None:
+        if not event.is_directory:
+            self._enqueue(event.src_path)
 
-        DoctrineMetadata(slug, [file_path.name], Paths.RAW_DIR).save()
+    def _enqueue(self, path: str) -> None:
+        file_path = Path(path)
+        if file_path.suffix.lower() not in SUPPORTED_DOC_EXTENSIONS:
+            return
+        self._queue.submit(DoctrineMetadata.extract_slug(file_path.name))
@@ -1,34 +1,73 @@
+import logging
+
+from watchdog.observers import Observer
+
+from core.config import Paths
+from core.config.settings import get_settings
+from core.doctrine.metadata import DoctrineMetadata
 from .base_worker import BaseWorker
+from .doctrine_pipeline import build_doctrine_pipeline
+from .job_queue import DebouncedJobQueue
 from .raw_doctrine_handler import RawDoctrineHandler
-from core.config import Paths
-from watchdog.observers import Observer
-import time
+
+logger = logging.getLogger(__name__)
 
 
 class RawDoctrineWatcherWorker(BaseWorker):
     def __init__(self) -> None:
         super().__init__(name="RawDoctrineWatcher")
         self.observer: Observer | None = None
+        self._skipped: list[str] = []
+        settings = get_settings()
+        self.pipeline = build_doctrine_pipeline(metrics=self.metrics)
+        self.queue = DebouncedJobQueue(
+            handler=self.process_doctrine,
+            debounce_seconds=settings.watcher_debounce_seconds,
+            max_workers=settings.watcher_workers,
+            name="raw-doctrine",
+            metrics=self.metrics,
+        )
 
     def start(self) -> None:
         self.log("Starting file watcher...")
+        Paths.RAW_DIR.mkdir(parents=True, exist_ok=True)
+        self.queue.start()
         self.observer = Observer()
         self.observer.schedule(
-            RawDoctrineHandler(),
+            RawDoctrineHandler(queue=self.queue),
             path=str(Paths.RAW_DIR),
             recursive=False,
         )
         self.observer.start()
 
-        try:
-            while True:
-                time.sleep(5)
-        except KeyboardInterrupt:
-            self.stop()
-
-    def stop(self) -> None:
+    def stop(self, *, drain: bool = True) -> None:
         if self.observer:
             self.log("Stopping file watcher...")
             self.observer.stop()
             self.observer.join()
             self.observer = None
+        self._skipped.extend(self.queue.stop(drain=drain))
+
+    def is_alive(self) -> bool:
+        return bool(self.observer and self.observer.is_alive() and self.queue.is_running)
+
+    def queue_depth(self) -> int:
+        return self.queue.pending
+
+    def take_pending(self) -> list[str]:
+        skipped, self._skipped = self._skipped, []
+        return skipped
+
+    def resume(self, jobs: list[str]) -> None:
+        for slug in jobs:
+            self.queue.submit(slug)
+
+    def process_doctrine(self, slug: str) -> None:
+        if not DoctrineMetadata.raw_files(slug, Paths.RAW_DIR):
+            self.pipeline.remove(slug)
+            logger.info("Doctrine %s removed — no raw files remain", slug)
+            return
+        state = self.pipeline.process(slug)
+        logger.info(
+            "Doctrine %s is %s", slug, state.status.value if state.status else "unprocessed",
+        )
@@ -0,0 +1,119 @@
+import logging
+import signal
+import threading
+from collections.abc import Callable
+
+from core.domain.constants import DEFAULT_SUPERVISOR_CHECK_SECONDS
+from .base_worker import BaseWorker
+
+logger = logging.getLogger(__name__)
+
+WorkerFactory = Callable[[], BaseWorker]
+
+
+class _Supervised:
+    def __init__(self, name: str, factory: WorkerFactory) -> None:
+        self.name = name
+        self.factory = factory
+        self.worker: BaseWorker | None = None
+        self.restarts = 0
+        self.last_error: str | None = None
+        self.pending: list[str] = []
+
+
+class WorkerSupervisor:
+    """Runs several workers side by side and restarts any that die.
+
+    Every worker runs on its own threads. A health check every
+    ``check_interval`` seconds replaces each worker whose ``is_alive`` is
+    false, or whose construction or start failed, with a fresh instance from
+    its factory; jobs still queued on the dead instance are handed to the
+    replacement once it has started. ``stop`` lets each worker drain its
+    in-flight and pending jobs before returning.
+    """
+
+    def __init__(
+        self,
+        factories: dict[str, WorkerFactory],
+        *,
+        check_interval: float = DEFAULT_SUPERVISOR_CHECK_SECONDS,
+    ) -> None:
+        self._workers = [_Supervised(name, factory) for name, factory in factories.items()]
+        self._check_interval = check_interval
+        self._stopped = threading.Event()
+        self._monitor: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stopped.clear()
+        for supervised in self._workers:
+            self._launch(supervised)
+        self._monitor = threading.Thread(target=self._monitor_loop, name="worker-supervisor", daemon=True)
+        self._monitor.start()
+
+    def check(self) -> None:
+        """Restart every worker that is not alive."""
+        for supervised in self._workers:
+            worker = supervised.worker
+            if worker is not None and worker.is_alive():
+                continue
+            logger.warning("Worker %s is down, restarting", supervised.name)
+            if worker is not None:
+                self._shutdown(supervised, drain=False)
+                supervised.pending = list(dict.fromkeys([*supervised.pending, *worker.take_pending()]))
+            supervised.restarts += 1
+            self._launch(supervised)
+
+    def stop(self, *, drain: bool = True) -> None:
+        self._stopped.set()
+        if self._monitor:
+            self._monitor.join()
+            self._monitor = None
+        for supervised in self._workers:
+            self._shutdown(supervised, drain=drain)
+
+    def status(self) -> list[dict]:
+        statuses = []
+        for supervised in self._workers:
+            worker = supervised.worker
+            status = worker.status() if worker else {"name": supervised.name, "running": False}
+            status["restarts"] = supervised.restarts
+            status["last_error"] = status.get("last_error") or supervised.last_error
+            statuses.append(status)
+        return statuses
+
+    def run_forever(self) -> None:
+        """Start, then block until SIGINT/SIGTERM and shut down gracefully."""
+        if threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(sig, lambda *_: self._stopped.set())
+        self.start()
+        self._stopped.wait()
+        logger.info("Shutting down workers, draining in-flight jobs")
+        self.stop()
+
+    def _monitor_loop(self) -> None:
+        while not self._stopped.wait(self._check_interval):
+            self.check()
+
+    def _launch(self, supervised: _Supervised) -> None:
+        try:
+            supervised.worker = supervised.factory()
+            supervised.worker.start()
+        except Exception as e:
+            supervised.last_error = f"{type(e).__name__}: {e}"
+            logger.exception("Worker %s failed to start", supervised.name)
+            return
+        if supervised.pending:
+            logger.info("Handing %d pending jobs to the new %s", len(supervised.pending), supervised.name)
+            supervised.worker.resume(supervised.pending)
+            supervised.pending = []
+
+    def _shutdown(self, supervised: _Supervised, *, drain: bool) -> None:
+        worker, supervised.worker = supervised.worker, None
+        if worker is None:
+            return
+        try:
+            worker.stop(drain=drain)
+        except Exception as e:
+            supervised.last_error = f"{type(e).__name__}: {e}"
+            logger.exception("Worker %s failed to stop cleanly", supervised.name)